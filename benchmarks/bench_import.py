@@ -0,0 +1,42 @@
+"""
+Measure how long `import date_extractor_mds` takes in a fresh interpreter,
+and check that string input does not pull in pandas or NumPy.
+
+Run from the repository root with:
+
+    python benchmarks/bench_import.py
+"""
+import subprocess
+import sys
+
+RUNS = 10
+
+# Times the import inside a fresh interpreter, so interpreter start-up is excluded.
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import date_extractor_mds
+elapsed = time.perf_counter() - start
+date_extractor_mds.extract_time("2024-02-29T08:15:30")
+heavy = [name for name in ("pandas", "numpy") if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure():
+    """Return the import time in seconds and the heavy modules loaded, for one fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), output[1] if len(output) > 1 else ""
+
+
+if __name__ == "__main__":
+    results = [measure() for _ in range(RUNS)]
+    times = sorted(elapsed for elapsed, _ in results)
+    print(f"import date_extractor_mds: best {times[0] * 1e3:.1f} ms, "
+          f"median {times[len(times) // 2] * 1e3:.1f} ms over {RUNS} runs")
+    heavy = results[0][1]
+    print(f"modules loaded by string input: {heavy or 'neither pandas nor numpy'}")
+    if heavy:
+        sys.exit(1)
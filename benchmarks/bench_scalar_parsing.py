@@ -0,0 +1,50 @@
+"""
+Compare the strptime-based parsing used by earlier releases of
+`extract_month` and `extract_time` with the current fixed-offset parsing.
+
+Run from the repository root with:
+
+    python benchmarks/bench_scalar_parsing.py
+"""
+import timeit
+from datetime import datetime
+
+import pandas as pd
+
+from date_extractor_mds import extract_month, extract_time
+
+DATE_STRING = "2024-02-29T08:15:30"
+SERIES = pd.Series([DATE_STRING, "2023-07-16T12:34:56"] * 50_000)
+
+
+def strptime_month(datetime_str):
+    """Month parsing as done before the strptime hot path was removed."""
+    return datetime.strptime(datetime_str.split('T')[0], "%Y-%m-%d").month
+
+
+def strptime_time(datetime_str):
+    """Time parsing as done before the strptime hot path was removed."""
+    return datetime.strptime(datetime_str.split('T')[1], "%H:%M:%S").time()
+
+
+def report(label, baseline, current, number):
+    """Time two callables and print their per-call cost and speed-up."""
+    before = min(timeit.repeat(baseline, number=number, repeat=5)) / number
+    after = min(timeit.repeat(current, number=number, repeat=5)) / number
+    print(f"{label:<30} {before * 1e3:>12.4f} ms {after * 1e3:>12.4f} ms {before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    print(f"{'':<30} {'strptime':>15} {'current':>15} {'speed-up':>9}")
+    report("month, str", lambda: strptime_month(DATE_STRING),
+           lambda: extract_month(DATE_STRING), 20_000)
+    report("time, str", lambda: strptime_time(DATE_STRING),
+           lambda: extract_time(DATE_STRING), 20_000)
+    report("month, 100K Series (python)", lambda: SERIES.apply(strptime_month),
+           lambda: extract_month(SERIES, engine="python"), 1)
+    report("time, 100K Series (python)", lambda: SERIES.apply(strptime_time),
+           lambda: extract_time(SERIES, engine="python"), 1)
+    report("month, 100K Series (numpy)", lambda: SERIES.apply(strptime_month),
+           lambda: extract_month(SERIES), 1)
+    report("time, 100K Series (numpy)", lambda: SERIES.apply(strptime_time),
+           lambda: extract_time(SERIES), 1)
@@ -0,0 +1,158 @@
+"""
+Benchmark suite for the validators and extractors.
+
+The classes follow the airspeed velocity (asv) conventions, so the suite can
+be run and compared across commits with ``asv run`` (see asv.conf.json at the
+repository root). ``python benchmarks/run.py`` runs the same cases without
+asv and prints throughput and peak memory.
+
+Series are generated deterministically: high cardinality Series hold one
+distinct timestamp per row, low cardinality Series repeat 1,000 timestamps.
+Invalid Series hold a single malformed row at the end, so the whole Series is
+scanned before the error is raised.
+"""
+import numpy as np
+import pandas as pd
+
+from date_extractor_mds import (
+    extract_components,
+    extract_day,
+    extract_month,
+    extract_time,
+    extract_year,
+    to_datetime64,
+    validate_datetime,
+)
+
+
+def pandas_to_datetime(data):
+    """Baseline for `to_datetime64`: pandas parsing the same strings."""
+    return pd.to_datetime(data, format="ISO8601")
+
+
+FUNCTIONS = {
+    "validate_datetime": validate_datetime,
+    "extract_year": extract_year,
+    "extract_month": extract_month,
+    "extract_day": extract_day,
+    "extract_time": extract_time,
+    "extract_components": extract_components,
+    "to_datetime64": to_datetime64,
+    "pandas_to_datetime": pandas_to_datetime,
+}
+
+# Functions without an engine option, measured once per input.
+WITHOUT_ENGINE = ("validate_datetime", "to_datetime64", "pandas_to_datetime")
+SIZES = [1_000, 1_000_000, 10_000_000]
+ENGINES = ["numpy", "python"]
+CARDINALITIES = ["high", "low"]
+
+# The row-by-row engine takes minutes on the largest Series, so it is only
+# measured up to this size.
+MAX_PYTHON_ENGINE_ROWS = 1_000_000
+
+DATE_STRING = "2024-02-29T08:15:30"
+
+_series_cache = {}
+
+
+def make_series(n_rows, cardinality, valid=True):
+    """
+    Build a Series of ISO 8601 strings for benchmarking.
+
+    Parameters
+    ----------
+    n_rows : int
+        The length of the Series.
+    cardinality : {"high", "low"}
+        "high" for one distinct timestamp per row, "low" for 1,000
+        timestamps repeated.
+    valid : bool, default True
+        If False, the last row is replaced by a malformed string.
+
+    Returns
+    -------
+    pandas.Series
+        The generated Series. Repeated calls return the same object.
+    """
+    key = (n_rows, cardinality, valid)
+    if key not in _series_cache:
+        distinct = n_rows if cardinality == "high" else min(n_rows, 1_000)
+        # One timestamp every 37 seconds from 2000 onwards covers every field.
+        stamps = np.datetime64("2000-01-01T00:00:00") + np.arange(distinct) * 37
+        values = np.datetime_as_string(stamps, unit="s").astype(object)
+        if distinct < n_rows:
+            values = values[np.arange(n_rows) % distinct]
+        if not valid:
+            values = values.copy()
+            values[-1] = "invalid-date"
+        _series_cache[key] = pd.Series(values)
+    return _series_cache[key]
+
+
+def call(function, data, engine):
+    """Call a benchmarked function, passing the engine to the extractors."""
+    if function in WITHOUT_ENGINE:
+        return FUNCTIONS[function](data)
+    return FUNCTIONS[function](data, engine=engine)
+
+
+class ScalarSuite:
+    """A single string, as passed by per-request code."""
+
+    params = [list(FUNCTIONS)]
+    param_names = ["function"]
+
+    def time_valid_string(self, function):
+        FUNCTIONS[function](DATE_STRING)
+
+
+class SeriesSuite:
+    """Valid Series of increasing size."""
+
+    params = [list(FUNCTIONS), SIZES, ENGINES, CARDINALITIES]
+    param_names = ["function", "rows", "engine", "cardinality"]
+    timeout = 600
+
+    def setup(self, function, rows, engine, cardinality):
+        if engine == "python" and (function in WITHOUT_ENGINE or rows > MAX_PYTHON_ENGINE_ROWS):
+            # Functions without an engine are measured once; skip the duplicate case.
+            raise NotImplementedError
+        self.data = make_series(rows, cardinality)
+
+    def time_series(self, function, rows, engine, cardinality):
+        call(function, self.data, engine)
+
+    def peakmem_series(self, function, rows, engine, cardinality):
+        call(function, self.data, engine)
+
+
+class InvalidSeriesSuite:
+    """Series whose last row is malformed, measuring the error path."""
+
+    params = [list(FUNCTIONS), SIZES, ENGINES]
+    param_names = ["function", "rows", "engine"]
+    timeout = 600
+
+    def setup(self, function, rows, engine):
+        if engine == "python" and (function in WITHOUT_ENGINE or rows > MAX_PYTHON_ENGINE_ROWS):
+            raise NotImplementedError
+        self.data = make_series(rows, "high", valid=False)
+
+    def time_invalid_series(self, function, rows, engine):
+        try:
+            call(function, self.data, engine)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for the malformed row")
+
+
+class ImportSuite:
+    """Start-up cost for callers that only pass strings."""
+
+    def timeraw_import(self):
+        return "import date_extractor_mds"
+
+    def timeraw_import_and_extract_string(self):
+        return "import date_extractor_mds; date_extractor_mds.extract_month('2024-02-29T08:15:30')"
@@ -0,0 +1,93 @@
+"""
+Run the benchmark suite without asv and print throughput and peak memory.
+
+Run from the repository root with:
+
+    python benchmarks/run.py                   # every case up to 1M rows
+    python benchmarks/run.py --max-rows 10000000
+    python benchmarks/run.py --filter extract_time
+
+Each case is timed as the best of `--repeat` runs. Peak memory is the largest
+amount allocated through Python and NumPy during one extra run, measured with
+tracemalloc, so it excludes the input Series itself.
+"""
+import argparse
+import itertools
+import time
+import tracemalloc
+
+from benchmarks import InvalidSeriesSuite, ScalarSuite, SeriesSuite
+
+
+def best_time(method, args, repeat, number=1):
+    """Return the best per-call time of `method(*args)` over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            method(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_memory(method, args):
+    """Return the peak number of bytes allocated during `method(*args)`."""
+    tracemalloc.start()
+    try:
+        method(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cases(suite, max_rows, pattern):
+    """Yield the parameter combinations of a suite that fit the options."""
+    names = suite.param_names
+    for args in itertools.product(*suite.params):
+        params = dict(zip(names, args))
+        if params.get("rows", 1) > max_rows:
+            continue
+        label = " ".join(str(arg) for arg in args)
+        if pattern and pattern not in label:
+            continue
+        yield label, params.get("rows", 1), args
+
+
+def run_suite(suite_class, method_name, max_rows, pattern, repeat, number=1):
+    """Time one benchmark method of a suite over its parameters and print a row per case."""
+    suite = suite_class()
+    for label, rows, args in cases(suite_class, max_rows, pattern):
+        setup = getattr(suite, "setup", None)
+        if setup is not None:
+            try:
+                setup(*args)
+            except NotImplementedError:
+                continue
+        method = getattr(suite, method_name)
+        seconds = best_time(method, args, repeat, number)
+        peak = peak_memory(method, args)
+        print(f"{method_name:<20} {label:<42} {seconds * 1e3:>11.3f} ms "
+              f"{rows / seconds:>14,.0f} rows/s {peak / 2**20:>9.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-rows", type=int, default=1_000_000,
+                        help="skip Series longer than this (default: 1,000,000)")
+    parser.add_argument("--filter", default="",
+                        help="only run cases whose parameters contain this text")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs per case (default: 3)")
+    options = parser.parse_args()
+
+    print(f"{'benchmark':<20} {'parameters':<42} {'best time':>14} "
+          f"{'throughput':>21} {'peak memory':>13}")
+    run_suite(ScalarSuite, "time_valid_string", options.max_rows, options.filter,
+              options.repeat, number=10_000)
+    run_suite(SeriesSuite, "time_series", options.max_rows, options.filter, options.repeat)
+    run_suite(InvalidSeriesSuite, "time_invalid_series", options.max_rows, options.filter,
+              options.repeat)
+
+
+if __name__ == "__main__":
+    main()
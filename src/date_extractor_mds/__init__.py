@@ -1,5 +1,17 @@
-# read version from installed package
-from importlib.metadata import version
-__version__ = version("date_extractor_mds")
+from date_extractor_mds.date_extractor_mds import *
+from date_extractor_mds.instrumentation import CallRecord, add_listener, recording, remove_listener
+from date_extractor_mds.search import find_datetimes
+from date_extractor_mds.streaming import extract_from_file, extract_from_log
 
-from date_extractor_mds.date_extractor_mds import *
\ No newline at end of file
+
+def __getattr__(name):
+    # read version from installed package, on first request only, as
+    # importlib.metadata takes longer to import than the package itself
+    if name == "__version__":
+        from importlib.metadata import version
+        return version("date_extractor_mds")
+    # likewise, asyncio is only imported by callers that batch from a loop
+    if name == "BatchExtractor":
+        from date_extractor_mds.batching import BatchExtractor
+        return BatchExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
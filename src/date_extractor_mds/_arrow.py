@@ -0,0 +1,88 @@
+"""
+Fixed-width byte buffers over the string buffers of Arrow arrays.
+
+An Arrow string array keeps its strings back to back in one data buffer,
+with an offsets buffer marking where each one starts. When every string is
+exactly ``ISO8601_WIDTH`` bytes long, that data buffer already is the two
+dimensional buffer the NumPy engine works on and is viewed without a copy.
+Otherwise the strings are gathered into ``BUFFER_WIDTH`` wide rows one
+column at a time, still without creating a Python object per row.
+"""
+import numpy as np
+import pyarrow
+
+from date_extractor_mds._engine import BUFFER_WIDTH, ISO8601_WIDTH, NUL_MARK
+
+# The view types only exist from pyarrow 16 on; older versions have no arrays
+# of them to pass in.
+_VIEW_CHECKS = tuple(
+    check for check in (
+        getattr(pyarrow.types, "is_string_view", None),
+        getattr(pyarrow.types, "is_binary_view", None),
+    )
+    if check is not None
+)
+
+
+def _is_view_type(data_type):
+    """Return whether an Arrow type is a string or binary view type."""
+    return any(check(data_type) for check in _VIEW_CHECKS)
+
+
+def is_string_type(data_type):
+    """Return whether an Arrow type holds strings (or ASCII bytes) the engine can read."""
+    types = pyarrow.types
+    return (
+        types.is_string(data_type) or types.is_large_string(data_type)
+        or types.is_binary(data_type) or types.is_large_binary(data_type)
+        or _is_view_type(data_type)
+    )
+
+
+def to_buffer(array):
+    """
+    Build the byte buffer of the NumPy engine from an Arrow string array.
+
+    Parameters
+    ----------
+    array : pyarrow.Array
+        An array whose type satisfies `is_string_type`. View types are cast
+        to the offset layout first.
+
+    Returns
+    -------
+    numpy.ndarray
+        An ``(len(array), ISO8601_WIDTH)`` uint8 view of the data buffer if
+        every string has exactly that length, otherwise an
+        ``(len(array), BUFFER_WIDTH)`` copy as produced by
+        `_engine.to_buffer`, with the rows of strings holding NUL bytes
+        marked likewise. Null rows hold arbitrary bytes.
+    """
+    types = pyarrow.types
+    if _is_view_type(array.type):
+        array = array.cast(pyarrow.large_binary())
+    n_rows = len(array)
+    if n_rows == 0:
+        return np.zeros((0, BUFFER_WIDTH), dtype=np.uint8)
+    large = types.is_large_string(array.type) or types.is_large_binary(array.type)
+    _, offsets_buffer, data_buffer = array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64 if large else np.int32)
+    offsets = offsets[array.offset:array.offset + n_rows + 1]
+    data = (
+        np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None
+        else np.zeros(0, dtype=np.uint8)
+    )
+    lengths = np.diff(offsets)
+    if (lengths == ISO8601_WIDTH).all():
+        start = offsets[0]
+        return data[start:start + n_rows * ISO8601_WIDTH].reshape(n_rows, ISO8601_WIDTH)
+
+    buffer = np.zeros((n_rows, BUFFER_WIDTH), dtype=np.uint8)
+    starts = offsets[:-1]
+    for column in range(BUFFER_WIDTH):
+        present = lengths > column
+        buffer[present, column] = data[starts[present] + column]
+    # A NUL byte, which would pass for padding, leaves its row with fewer
+    # non-zero bytes than its length (as do strings too long for the row).
+    buffer[np.count_nonzero(buffer, axis=1) != lengths, 0] = NUL_MARK
+    return buffer
@@ -0,0 +1,205 @@
+"""
+Lazy extraction from Dask Series, one partition at a time.
+
+An extractor given a Dask Series is mapped over its partitions, each of
+which is an ordinary pandas Series. The `meta` describing the result is
+obtained by running the extractor on the empty pandas Series that describes
+the partitions, so it has exactly the dtypes and names each partition gives,
+and building the result computes nothing. Each partition is validated by the
+task that extracts from it, rather than in a separate pass over the data,
+and the invalid rows of all partitions are reported together.
+
+Reporting them together has a cost with errors="raise": no partition of the
+result is passed on until every partition has been checked, so computing it
+holds the results of all partitions in memory at once, and the result is
+built from delayed tasks that the dask-expr optimizer cannot see through.
+errors="coerce" and errors="mask" map over the partitions directly and
+have neither cost.
+"""
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+from date_extractor_mds.date_extractor_mds import (
+    _MALFORMED,
+    _OUT_OF_RANGE,
+    _decode_series,
+    _raise_invalid_positions,
+)
+from date_extractor_mds.instrumentation import _count_rows
+
+# Columns holding the values and the validity mask of a Series result in the
+# partitions computed for errors="mask", before they are split apart.
+_RESULT = "__result__"
+_VALID = "__valid__"
+
+# Reasons for invalid rows, in the order the extractors check for them. A
+# Series failing several checks is only reported for the first, as pandas
+# input would be.
+_CHECK_ORDER = (_MALFORMED, _OUT_OF_RANGE)
+
+
+def _extract_partition(partition, function, options):
+    """Extract from one partition."""
+    return function(partition, **options)
+
+
+def _masked_partition(partition, function, options):
+    """Extract from one partition with errors="mask", returning the values and the mask as one DataFrame."""
+    result, valid = function(partition, errors="mask", **options)
+    frame = result.to_frame(_RESULT) if isinstance(result, pd.Series) else result
+    frame[_VALID] = valid
+    return frame
+
+
+def _attempt_partition(partition, function, options):
+    """
+    Extract from one partition, reporting its invalid rows instead of raising.
+
+    Returns
+    -------
+    result : object
+        The result of the extractor, or None if the partition is invalid.
+    report : tuple
+        ``(length, reason, positions)``: the number of rows, and what is
+        wrong with the invalid rows and their positions in the partition.
+        `reason` is None for a valid partition, and `positions` is None for
+        errors that do not concern particular rows.
+    """
+    try:
+        return function(partition, **options), (len(partition), None, None)
+    except ValueError as error:
+        reason = getattr(error, "reason", str(error))
+        return None, (len(partition), reason, getattr(error, "positions", None))
+
+
+def _check_rank(reason):
+    """Return the position of the check behind a reason among the checks run."""
+    return _CHECK_ORDER.index(reason) if reason in _CHECK_ORDER else len(_CHECK_ORDER)
+
+
+def _check_reports(reports):
+    """
+    Raise one error for the invalid rows of every partition, if there are any.
+
+    Parameters
+    ----------
+    reports : list of tuple
+        The reports of `_attempt_partition`, in partition order.
+
+    Raises
+    ------
+    ValueError
+        If a partition is invalid. Errors that do not concern particular
+        rows, such as non-string elements, name the first partition raising
+        them. Otherwise the message lists the rows of every partition that
+        failed the first check any row failed, counting from the start of
+        the whole Series.
+    """
+    lengths = np.array([length for length, _, _ in reports], dtype=np.intp)
+    starts = np.cumsum(lengths) - lengths
+    failures = [
+        (number, start, reason, positions)
+        for number, ((_, reason, positions), start) in enumerate(zip(reports, starts))
+        if reason is not None
+    ]
+    if not failures:
+        return
+    for number, _, reason, positions in failures:
+        if positions is None:
+            raise ValueError(f"In partition {number}: {reason}")
+    first = min((reason for _, _, reason, _ in failures), key=_check_rank)
+    positions = [positions + start for _, start, reason, positions in failures if reason == first]
+    _raise_invalid_positions(np.concatenate(positions), first, "Dask Series")
+
+
+def _checked_result(result, check):
+    """Return the result of a partition once every partition has been checked, keeping it in memory until then."""
+    return result
+
+
+def map_extractor(function, series, errors, options):
+    """
+    Map an extractor over the partitions of a Dask Series.
+
+    Parameters
+    ----------
+    function : callable
+        The public extractor, such as `extract_year`.
+    series : dask.dataframe.Series
+        The strings to extract from.
+    errors : {"raise", "coerce", "mask"}
+        The errors mode. With "raise", computing any part of the result
+        checks every partition and raises a single ValueError listing the
+        invalid rows of all of them, counted from the start of the Series.
+        The results of the partitions are only passed on once all of them
+        have been checked, so the whole result is held in memory, and
+        column projections and other dask-expr optimizations do not reach
+        the partitions. For Series larger than memory, check them with
+        `validate` and extract with "coerce", which streams the partitions.
+    options : dict
+        The other keyword arguments of the extractor.
+
+    Returns
+    -------
+    dask.dataframe.Series or dask.dataframe.DataFrame or tuple
+        The lazy result, with ``(result, mask)`` when `errors` is "mask".
+
+    Raises
+    ------
+    ValueError
+        If an option is invalid, as found by running the extractor on the
+        empty `meta` Series.
+    """
+    if errors == "mask":
+        meta = _masked_partition(series._meta, function, options)
+        combined = series.map_partitions(_masked_partition, function, options, meta=meta)
+        valid = combined[_VALID].rename(series.name)
+        if _RESULT in meta.columns:
+            return combined[_RESULT].rename(series.name), valid
+        return combined[[column for column in meta.columns if column != _VALID]], valid
+    options = dict(options, errors=errors)
+    meta = _extract_partition(series._meta, function, options)
+    if errors == "coerce":
+        return series.map_partitions(_extract_partition, function, options, meta=meta)
+    attempts = [
+        dask.delayed(_attempt_partition, nout=2)(partition, function, options)
+        for partition in series.to_delayed()
+    ]
+    check = dask.delayed(_check_reports)([report for _, report in attempts])
+    # Object results, such as the datetime.time objects of `extract_time`,
+    # must not be converted to strings.
+    with dask.config.set({"dataframe.convert-string": False}):
+        return dd.from_delayed(
+            [dask.delayed(_checked_result)(result, check) for result, _ in attempts],
+            meta=meta, divisions=series.divisions, verify_meta=False,
+        )
+
+
+def validate(series):
+    """
+    Validate every partition of a Dask Series and report all invalid rows.
+
+    The partitions are checked in parallel by the current scheduler, and
+    only the positions of their invalid rows are kept, so the Series is
+    never held in memory as a whole.
+
+    Parameters
+    ----------
+    series : dask.dataframe.Series
+        The strings to validate.
+
+    Raises
+    ------
+    ValueError
+        If any element, in any partition, is not a string in valid ISO 8601
+        format. The positions count from the start of the whole Series.
+    """
+    options = {"fields": (), "validate": "fast"}
+    reports = dask.compute(*(
+        dask.delayed(_attempt_partition, nout=2)(partition, _decode_series, options)[1]
+        for partition in series.to_delayed()
+    ))
+    _count_rows(sum(length for length, _, _ in reports))
+    _check_reports(list(reports))
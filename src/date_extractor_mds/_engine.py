@@ -0,0 +1,817 @@
+"""
+Fixed-offset NumPy engine for ISO 8601 strings.
+
+Every accepted string starts with the fixed-width YYYY-MM-DDThh:mm:ss part,
+so a column of timestamps can be copied once into a two dimensional byte
+buffer (one row per string, one column per character). Structure checks,
+digit decoding and range checks are then plain array arithmetic over whole
+columns of that buffer, with no Python work per row. That part is first
+copied into column-major order, in cache-sized blocks, so that each of
+those passes reads one contiguous column.
+
+Strings with fractional seconds, a "Z" or a numeric UTC offset are wider,
+and the width varies from row to row. When any row continues after the
+seconds, each row is dispatched on the byte that follows the seconds and on
+the length of its fraction, which locate its designator and offset; those
+bytes are then gathered and checked with the same array arithmetic. Columns
+without any such row never pay for this.
+"""
+from collections import namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from date_extractor_mds import _format
+from date_extractor_mds.instrumentation import _phase
+from date_extractor_mds._format import (
+    CHECKED_DATE_FIELDS,
+    DATE_FIELDS,
+    DERIVED_FIELDS,
+    FIELD_OFFSETS,
+    FRACTION_FIELD,
+    ISO8601_WIDTH,
+    MAX_FRACTION_DIGITS,
+    MAX_WIDTH,
+    MINUTES_PER_DAY,
+    NANOSECOND_FIELD,
+    TIME_FIELDS,
+    is_leap_year,
+)
+
+# Width of the rows of a buffer of YYYY-MM-DDThh:mm:ss strings: one spare
+# byte so that longer strings are detected rather than truncated.
+BASIC_WIDTH = ISO8601_WIDTH + 1
+
+# Width of the rows produced by `to_buffer`, with the same spare byte after
+# the longest accepted string.
+BUFFER_WIDTH = MAX_WIDTH + 1
+
+# Every buffer row is compared against this template: subtracting it leaves
+# 0-9 at digit positions and exactly 0 at separators and the spare byte.
+_TEMPLATE = np.frombuffer(b"0000-00-00T00:00:00\0", dtype=np.uint8)
+_TEMPLATE_LIMIT = np.where(_TEMPLATE == ord("0"), 9, 0).astype(np.uint8)
+
+# The digit "0", as a byte.
+_ZERO = np.uint8(ord("0"))
+
+# Column of the first digit of the fractional seconds.
+_FRACTION_START = ISO8601_WIDTH + 1
+
+# Days per month, indexed by month number (index 0 is unused).
+DAYS_IN_MONTH = np.array(_format.DAYS_IN_MONTH)
+
+# Whether each four digit year is a leap year, and the days from 1970-01-01
+# to its January 1st, so that dates are converted by lookups rather than
+# by int64 divisions. Year 10000 is included, as converting the last day of
+# year 9999 to UTC can reach it.
+_YEARS = np.arange(10 ** _format.FIELD_DIGITS["year"] + 1)
+_IS_LEAP = is_leap_year(_YEARS)
+_YEAR_START = _format.days_from_civil(_YEARS, 1, 1)
+
+# Length of each month and days from January 1st to its first day, in common
+# years (first 13 entries) and leap years (last 13), by month number.
+_MONTH_LENGTH = np.concatenate((DAYS_IN_MONTH, DAYS_IN_MONTH + (np.arange(13) == 2)))
+_MONTH_START = np.concatenate(
+    [np.cumsum(lengths) - lengths for lengths in np.split(_MONTH_LENGTH, 2)]
+)
+
+# Number of ISO weeks of each four digit year.
+_WEEKS_IN_YEAR = _format.weeks_in_iso_year(_YEARS)
+
+# Written over the first byte of the rows of strings holding NUL characters,
+# which the buffer could not tell from its zero padding. Like NUL, it is
+# never valid.
+NUL_MARK = 0xFF
+
+# Rows copied at a time into column-major order, few enough for both sides
+# of the copy to stay in the CPU cache.
+_TRANSPOSE_BLOCK = 4096
+
+# What follows the seconds of each row of a buffer: whether it is well
+# formed, the fractional seconds in whole microseconds and the nanoseconds
+# beyond them, and the UTC offset in minutes (0 without an offset).
+Suffixes = namedtuple("Suffixes", ["well_formed", "microseconds", "nanoseconds", "offsets"])
+
+# Width of the YYYY-MM-DD date that starts every row.
+_DATE_WIDTH = FIELD_OFFSETS["day"][1]
+
+# Shortest average run of rows sharing their date for which sharing pays
+# off: with shorter runs, expanding the results of each run back to its rows
+# costs more than handling every row.
+_MIN_RUN_LENGTH = 4
+
+# Runs of consecutive rows of a buffer that share their date: the position
+# of the first row of each run, and its number of rows.
+DateRuns = namedtuple("DateRuns", ["starts", "lengths"])
+
+
+def to_buffer(values, validated=True):
+    """
+    Copy strings into a fixed-width byte buffer.
+
+    Parameters
+    ----------
+    values : array-like of str
+        The strings to copy.
+    validated : bool, default True
+        Whether the buffer will be validated, in which case the rows of
+        strings holding NUL characters are marked with `mark_nul_rows`.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(len(values), BUFFER_WIDTH)`` uint8 array. Shorter strings are
+        padded with zero bytes and longer strings are cut after
+        ``BUFFER_WIDTH`` bytes, which `is_well_formed` rejects either way.
+
+    Raises
+    ------
+    UnicodeEncodeError
+        If a string contains non-ASCII characters.
+    """
+    fixed = np.asarray(values, dtype=f"S{BUFFER_WIDTH}")
+    buffer = fixed.view(np.uint8).reshape(-1, BUFFER_WIDTH)
+    if validated:
+        mark_nul_rows(values, buffer)
+    return buffer
+
+
+def mark_nul_rows(values, buffer):
+    """
+    Make the rows of the strings holding NUL characters malformed.
+
+    NumPy byte strings drop their trailing NUL characters, so that
+    "2023-07-16T12:34:56\0" would otherwise fill the same row of the buffer
+    as "2023-07-16T12:34:56". Only sequences and object arrays can hold such
+    strings: str_ and bytes_ arrays have already dropped them.
+
+    Parameters
+    ----------
+    values : array-like of str
+        The strings copied into `buffer`.
+    buffer : numpy.ndarray
+        The buffer, whose rows are marked in place.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype != object:
+            return
+        values = values.tolist()
+    try:
+        if "\0" not in "".join(values):
+            return
+    except TypeError:
+        # Bytes elements are checked one at a time below.
+        pass
+    rows = [row for row, value in enumerate(values) if ("\0" if isinstance(value, str) else b"\0") in value]
+    buffer[rows, 0] = NUL_MARK
+
+
+def line_stamps(data, starts):
+    """
+    Copy the first token of each line of a byte array into a buffer.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        A uint8 array holding whole lines, such as a memory-mapped file.
+    starts : numpy.ndarray
+        The position in `data` of the first byte of each line, in
+        increasing order.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(len(starts), BUFFER_WIDTH)`` buffer like those produced by
+        `to_buffer`, holding the bytes of each line up to its first space or
+        control character (such as a tab or the line ending), zero padded.
+        Longer tokens are cut after ``BUFFER_WIDTH`` bytes, which
+        `is_well_formed` rejects.
+    """
+    n_rows = len(starts)
+    buffer = np.zeros((n_rows, BUFFER_WIDTH), dtype=np.uint8)
+    # Lines starting less than a row from the end are read from a zero padded
+    # copy of the end of the data.
+    head = int(np.searchsorted(starts, len(data) - BUFFER_WIDTH, side="right"))
+    if head < n_rows:
+        end = data[starts[head]:]
+        padded = np.zeros(len(end) + BUFFER_WIDTH, dtype=np.uint8)
+        padded[:len(end)] = end
+        buffer[head:] = line_stamps(padded, starts[head:] - starts[head])
+    if not head:
+        return buffer
+    starts = starts[:head]
+    # A space or control character among the first ISO8601_WIDTH bytes makes
+    # a row malformed whatever follows, so those bytes are copied as they
+    # are, and only the following ones are cut at the end of the token.
+    buffer[:head, :ISO8601_WIDTH] = sliding_window_view(data, ISO8601_WIDTH)[starts]
+    ended = np.zeros(head, dtype=bool)
+    for column in range(ISO8601_WIDTH, BUFFER_WIDTH):
+        byte = data[starts + column]
+        ended |= byte <= ord(" ")
+        if ended.all():
+            break
+        buffer[:head, column] = np.where(ended, np.uint8(0), byte)
+    return buffer
+
+
+def find_stamps(data):
+    """
+    Locate the timestamps embedded anywhere in a byte array.
+
+    A timestamp is a YYYY-MM-DDThh:mm:ss run of bytes, not preceded by a
+    digit, followed by as much of a fraction and a designator as is well
+    formed, and not followed by a digit. The "T" separators are found
+    first, and only the bytes around them are gathered and checked.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        A uint8 array of text.
+
+    Returns
+    -------
+    starts : numpy.ndarray
+        The position in `data` of each timestamp, in increasing order.
+    buffer : numpy.ndarray
+        A ``(len(starts), BUFFER_WIDTH)`` buffer like those produced by
+        `to_buffer`, holding each timestamp, zero padded. The formats of
+        the timestamps are checked but not the ranges of their components,
+        which `scan_masked` does.
+    """
+    # A zero byte before the data and zero bytes after it let every
+    # candidate be read as a whole row, along with the byte preceding it.
+    padded = np.zeros(len(data) + BUFFER_WIDTH, dtype=np.uint8)
+    padded[1:len(data) + 1] = data
+    # A candidate starts the width of a date before its "T".
+    starts = np.flatnonzero(padded == ord("T")) - _DATE_WIDTH
+    starts = starts[starts >= 1]
+    windows = sliding_window_view(padded, BUFFER_WIDTH)[starts]
+    found = _matches_template(windows[:, :ISO8601_WIDTH])
+    found &= ~_is_digit(padded[starts - 1])
+    starts, windows = starts[found], windows[found]
+
+    # The fraction is only taken with 1 to MAX_FRACTION_DIGITS digits; a
+    # longer run of digits leaves a digit after the timestamp.
+    rows = np.arange(len(starts))
+    digits = _is_digit(windows[:, _FRACTION_START:_FRACTION_START + MAX_FRACTION_DIGITS + 1])
+    run = np.where(digits.all(axis=1), digits.shape[1], digits.argmin(axis=1))
+    fraction = (windows[:, ISO8601_WIDTH] == ord(".")) & (run >= 1)
+    designator_at = ISO8601_WIDTH + np.where(fraction, np.minimum(run, MAX_FRACTION_DIGITS) + 1, 0)
+
+    def at(shift):
+        return windows[rows, designator_at + shift]
+
+    designator = at(0)
+    hours_tens, hours_units, colon, minutes_tens, minutes_units = (
+        at(shift) for shift in range(1, 6)
+    )
+    offset = (
+        ((designator == ord("+")) | (designator == ord("-")))
+        & _is_digit(hours_tens) & _is_digit(hours_units) & (colon == ord(":"))
+        & _is_digit(minutes_tens) & _is_digit(minutes_units)
+    )
+    length = designator_at + (designator == ord("Z")) + _format.OFFSET_WIDTH * offset
+    found = ~_is_digit(windows[rows, length])
+    length, windows = length[found], windows[found]
+    buffer = np.where(np.arange(BUFFER_WIDTH) < length[:, None], windows, np.uint8(0))
+    return starts[found] - 1, buffer
+
+
+def _is_digit(column):
+    """Return whether each byte of a uint8 column is an ASCII digit."""
+    # Bytes below "0" wrap around to large values.
+    return (column - np.uint8(ord("0"))) <= 9
+
+
+def read_suffixes(buffer):
+    """
+    Dispatch the rows of a buffer on what follows their seconds.
+
+    The byte after the seconds tells whether a row has fractional seconds,
+    the length of the run of digits after it gives the column of the
+    designator, and the designator tells whether a numeric offset follows.
+    A row is only well formed if it ends right after its last part.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        A buffer produced by `to_buffer`.
+
+    Returns
+    -------
+    Suffixes
+        The suffix of every row.
+    """
+    n_rows, width = buffer.shape
+    rows = np.arange(n_rows)
+    last = width - 1
+
+    # Fractional seconds: a dot, then the run of digits that follows it.
+    digits = _is_digit(buffer[:, _FRACTION_START:_FRACTION_START + MAX_FRACTION_DIGITS + 1])
+    run = np.where(digits.all(axis=1), digits.shape[1], digits.argmin(axis=1))
+    fraction = buffer[:, ISO8601_WIDTH] == ord(".")
+    fraction_digits = np.where(fraction, run, 0)
+    well_formed = ~fraction | ((run >= 1) & (run <= MAX_FRACTION_DIGITS))
+
+    # The designator, if any, comes right after the seconds or the fraction.
+    designator_at = ISO8601_WIDTH + fraction + fraction_digits
+
+    def at(shift):
+        # Rows too short for the column are malformed anyway.
+        return buffer[rows, np.minimum(designator_at + shift, last)]
+
+    designator = at(0)
+    zulu = designator == ord("Z")
+    sign = (designator == ord("+")).astype(np.int64) - (designator == ord("-"))
+    offset = sign != 0
+    hours_tens, hours_units, colon, minutes_tens, minutes_units = (
+        at(shift) for shift in range(1, 6)
+    )
+    hours = (hours_tens.astype(np.int64) - ord("0")) * 10 + (hours_units - ord("0"))
+    minutes = (minutes_tens.astype(np.int64) - ord("0")) * 10 + (minutes_units - ord("0"))
+    offset_ok = (
+        _is_digit(hours_tens) & _is_digit(hours_units) & (colon == ord(":"))
+        & _is_digit(minutes_tens) & _is_digit(minutes_units) & (hours <= 23) & (minutes <= 59)
+    )
+    well_formed &= ~offset | offset_ok
+
+    # Rows are zero padded, so a row ending right after its last part has
+    # exactly that many non-zero bytes.
+    end = designator_at + zulu + _format.OFFSET_WIDTH * offset
+    well_formed &= np.count_nonzero(buffer, axis=1) == end
+    offsets = np.where(offset & well_formed, sign * (hours * 60 + minutes), 0)
+
+    # Missing digits are zeros.
+    nanoseconds = np.zeros(n_rows, dtype=np.int64)
+    for digit in range(MAX_FRACTION_DIGITS):
+        column = buffer[:, min(_FRACTION_START + digit, last)] - _ZERO
+        nanoseconds = nanoseconds * 10 + np.where(digit < fraction_digits, column, 0)
+    microseconds, nanoseconds = np.divmod(nanoseconds, 1_000)
+    return Suffixes(well_formed, microseconds, nanoseconds, offsets)
+
+
+def _by_column(buffer):
+    """Copy a buffer into column-major order, a block of rows at a time."""
+    n_rows, width = buffer.shape
+    columns = np.empty((width, n_rows), dtype=np.uint8)
+    for start in range(0, n_rows, _TRANSPOSE_BLOCK):
+        stop = start + _TRANSPOSE_BLOCK
+        columns[:, start:stop] = buffer[start:stop].T
+    return columns.T
+
+
+def split(buffer):
+    """
+    Separate the fixed-width part of a buffer from the suffixes of its rows.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        A buffer produced by `to_buffer`, or any narrower buffer of zero
+        padded strings, down to an ``(n, ISO8601_WIDTH)`` view of strings
+        already known to be exactly ``ISO8601_WIDTH`` bytes long.
+
+    Returns
+    -------
+    body : numpy.ndarray
+        A column-major copy of the YYYY-MM-DDThh:mm:ss columns, with the
+        spare byte if no row has a suffix.
+    suffixes : Suffixes or None
+        The suffixes as read by `read_suffixes`, or None if no row continues
+        after its seconds.
+    """
+    if buffer.shape[1] <= ISO8601_WIDTH or not buffer[:, ISO8601_WIDTH:].any():
+        return _by_column(buffer[:, :BASIC_WIDTH]), None
+    return _by_column(buffer[:, :ISO8601_WIDTH]), read_suffixes(buffer)
+
+
+def date_runs(body):
+    """
+    Find the runs of consecutive rows of a body that share their date.
+
+    Parameters
+    ----------
+    body : numpy.ndarray
+        A body returned by `split`.
+
+    Returns
+    -------
+    DateRuns or None
+        The runs, or None if they are too short on average for sharing the
+        work on each date to pay off, as when the rows are not in time order.
+    """
+    n_rows = len(body)
+    changed = np.zeros(n_rows, dtype=bool)
+    changed[:1] = True
+    for column in range(_DATE_WIDTH):
+        values = body[:, column]
+        changed[1:] |= values[1:] != values[:-1]
+    starts = np.flatnonzero(changed)
+    if not n_rows or len(starts) * _MIN_RUN_LENGTH > n_rows:
+        return None
+    return DateRuns(starts, np.diff(starts, append=n_rows))
+
+
+def expand(values, runs):
+    """Repeat the value of each run for every row of the run."""
+    return np.repeat(values, runs.lengths)
+
+
+def _matches_template(columns, start=0):
+    """Check consecutive columns of a buffer, from column `start`, against the template."""
+    # Bytes below the template wrap around to large values, so a single
+    # comparison checks both bounds of every position.
+    stop = start + columns.shape[1]
+    return ((columns - _TEMPLATE[start:stop]) <= _TEMPLATE_LIMIT[start:stop]).all(axis=1)
+
+
+def is_well_formed(buffer, suffixes=None, runs=None):
+    """
+    Check the separators and digits of every row of a buffer.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        A body returned by `split`.
+    suffixes : Suffixes, optional
+        The suffixes returned with it, if any.
+    runs : DateRuns, optional
+        Runs of rows sharing their date, as found by `date_runs`. The date
+        of a run is then only checked on its first row.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask, True where a row is in one of the accepted formats.
+    """
+    if runs is None:
+        well_formed = _matches_template(buffer)
+    else:
+        well_formed = _matches_template(buffer[:, _DATE_WIDTH:], _DATE_WIDTH)
+        well_formed &= expand(_matches_template(buffer[runs.starts, :_DATE_WIDTH]), runs)
+    if suffixes is not None:
+        well_formed &= suffixes.well_formed
+    return well_formed
+
+
+def fields_to_decode(fields, checked=True, utc=False):
+    """
+    Work out which components must be decoded to serve and check `fields`.
+
+    Requesting the month or the day checks the whole calendar date, and
+    requesting any time component checks the whole time of day, so those
+    groups are decoded together. Derived calendar fields are computed from
+    the whole date, and converting to UTC needs the whole date and time of
+    day.
+
+    Parameters
+    ----------
+    fields : iterable of str
+        The requested components.
+    checked : bool, default True
+        Whether the components will be range-checked.
+    utc : bool, default False
+        Whether the components will be converted to UTC.
+
+    Returns
+    -------
+    tuple of str
+        The components to decode, in string order, which leaves out the
+        derived fields.
+    """
+    needed = set(fields)
+    if needed.intersection(DERIVED_FIELDS):
+        needed.update(DATE_FIELDS)
+    if utc:
+        needed.update(DATE_FIELDS + TIME_FIELDS)
+    if checked and needed.intersection(CHECKED_DATE_FIELDS):
+        needed.update(DATE_FIELDS)
+    if checked and needed.intersection(TIME_FIELDS):
+        needed.update(TIME_FIELDS)
+    return tuple(
+        field for field in _format.DECODED_FIELDS + (NANOSECOND_FIELD,) if field in needed
+    )
+
+
+def decode(buffer, fields, suffixes=None, runs=None):
+    """
+    Decode components from the digits of a buffer.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        A buffer whose rows are well formed, such as a body returned by
+        `split`. Only its first ``ISO8601_WIDTH`` columns are read.
+    fields : iterable of str
+        The components to decode.
+    suffixes : Suffixes, optional
+        The suffixes of the rows, as returned by `split`, which hold the
+        fractional seconds. Without them every row has no fraction.
+    runs : DateRuns, optional
+        Runs of rows sharing their date, as found by `date_runs`. The date
+        fields are then decoded once per run.
+
+    Returns
+    -------
+    dict of str to numpy.ndarray
+        One int64 array per field, with one value per row, or per run for
+        the date fields when `runs` is given.
+    """
+    dates = buffer if runs is None else buffer[runs.starts, :_DATE_WIDTH]
+    components = {}
+    for field in fields:
+        if field in (FRACTION_FIELD, NANOSECOND_FIELD):
+            components[field] = (
+                np.zeros(len(buffer), dtype=np.int64) if suffixes is None
+                else suffixes.microseconds if field == FRACTION_FIELD else suffixes.nanoseconds
+            )
+            continue
+        start, stop = FIELD_OFFSETS[field]
+        # Two digits fit in a byte and four in two bytes, so the digits are
+        # combined in the narrowest type and widened once at the end.
+        dtype = np.uint8 if stop - start <= 2 else np.uint16
+        columns = dates if field in DATE_FIELDS else buffer
+        value = (columns[:, start] - _ZERO).astype(dtype)
+        for position in range(start + 1, stop):
+            value = value * dtype(10) + (columns[:, position] - _ZERO)
+        components[field] = value.astype(np.int64)
+    return components
+
+
+def _month_index(year, month):
+    """Return the position of each month in the month tables, given its year."""
+    return _IS_LEAP.take(year, mode="clip") * 13 + month
+
+
+def days_from_civil(year, month, day):
+    """
+    Count the days from 1970-01-01 to dates with four digit years.
+
+    A table-driven version of `_format.days_from_civil` for arrays.
+
+    Parameters
+    ----------
+    year, month, day : numpy.ndarray
+        The decoded dates. Dates that do not exist give meaningless results.
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of days, negative before 1970.
+    """
+    return (
+        _YEAR_START.take(year, mode="clip")
+        + _MONTH_START.take(_month_index(year, month), mode="clip")
+        + (day - 1)
+    )
+
+
+def calendar_fields(fields, year, month, day):
+    """
+    Compute derived calendar features of dates with four digit years.
+
+    A table-driven version of `_format.calendar_fields` for arrays.
+
+    Parameters
+    ----------
+    fields : iterable of str
+        The features to compute, from `DERIVED_FIELDS`.
+    year, month, day : numpy.ndarray
+        The decoded dates. Dates that do not exist give meaningless results.
+
+    Returns
+    -------
+    dict of str to numpy.ndarray
+        One int64 array per requested feature.
+    """
+    derived = {}
+    if "quarter" in fields:
+        derived["quarter"] = (month + 2) // 3
+    if any(field != "quarter" for field in fields):
+        day_of_year = _MONTH_START.take(_month_index(year, month), mode="clip") + day
+        days = _YEAR_START.take(year, mode="clip") + (day_of_year - 1)
+        weekday = _format.weekday(days)
+        derived.update(weekday=weekday, day_of_year=day_of_year)
+        if "iso_week" in fields:
+            derived["iso_week"] = _format.iso_week(
+                day_of_year, weekday, _WEEKS_IN_YEAR.take(year, mode="clip"),
+                _WEEKS_IN_YEAR.take(year - 1, mode="clip"),
+            )
+    return {field: derived[field] for field in fields}
+
+
+def to_utc(components, offsets):
+    """
+    Convert decoded local dates and times of day to UTC.
+
+    Parameters
+    ----------
+    components : dict of str to numpy.ndarray
+        Decoded components, holding every date and time field.
+    offsets : numpy.ndarray
+        The UTC offset of each row in minutes.
+
+    Returns
+    -------
+    dict of str to numpy.ndarray
+        The components with the date, hour and minute shifted by the offset.
+        Rows without an offset, or with a zero offset, are left unchanged,
+        even if their date or time of day does not exist.
+    """
+    has_offset = offsets != 0
+    if not has_offset.any():
+        return components
+    minutes = components["hour"] * 60 + components["minute"] - offsets
+    day_shift, minutes = np.divmod(minutes, MINUTES_PER_DAY)
+    hour, minute = np.divmod(minutes, 60)
+    shifted = dict(
+        components,
+        hour=np.where(has_offset, hour, components["hour"]),
+        minute=np.where(has_offset, minute, components["minute"]),
+    )
+    moved = has_offset & (day_shift != 0)
+    if moved.any():
+        year, month, day = components["year"], components["month"], components["day"]
+        civil = _format.civil_from_days(_format.days_from_civil(year, month, day) + day_shift)
+        for field, local, moved_value in zip(DATE_FIELDS, (year, month, day), civil):
+            shifted[field] = np.where(moved, moved_value, local)
+    return shifted
+
+
+def out_of_range(components, runs=None):
+    """
+    Flag rows whose decoded components do not form a valid date or time.
+
+    The date is checked when the month is present (which requires the year
+    and day too), and the time of day when the hour is present (which
+    requires the minute and second too).
+
+    Parameters
+    ----------
+    components : dict of str to numpy.ndarray
+        Decoded components, as returned by `decode`.
+    runs : DateRuns, optional
+        The runs the date fields were decoded with, if any.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask, True where a row is out of range.
+    """
+    if runs is None:
+        invalid = np.zeros(len(next(iter(components.values()))), dtype=bool)
+    else:
+        invalid = np.zeros(int(runs.lengths.sum()), dtype=bool)
+    if "month" in components:
+        year, month, day = components["year"], components["month"], components["day"]
+        month_ok = (month >= 1) & (month <= 12)
+        month_length = _MONTH_LENGTH.take(_month_index(year, month), mode="clip")
+        date_invalid = (year < 1) | ~month_ok | (day < 1) | (day > month_length)
+        invalid |= date_invalid if runs is None else expand(date_invalid, runs)
+    if "hour" in components:
+        invalid |= (
+            (components["hour"] > 23) | (components["minute"] > 59) | (components["second"] > 59)
+        )
+    return invalid
+
+
+def _select(components, fields, suffixes, utc, runs=None):
+    """
+    Convert decoded components to UTC if requested, derive calendar fields
+    from the result, and keep the requested fields, with one value per row.
+
+    Also returns a boolean mask of the rows that the conversion to UTC moved
+    before year 1 or past year 9999, or None if no conversion was asked for.
+    Rows without an offset are never flagged, whatever their year.
+    """
+    if runs is not None and utc and suffixes is not None:
+        # Converting to UTC can move the date of any row.
+        components = {
+            field: expand(values, runs) if field in DATE_FIELDS else values
+            for field, values in components.items()
+        }
+        runs = None
+    moved_out = None
+    if utc and suffixes is not None:
+        components = to_utc(components, suffixes.offsets)
+        # Only rows the conversion shifted are checked, as a year 0000
+        # written as such is left to the usual checks.
+        year = components["year"]
+        moved_out = (suffixes.offsets != 0) & ((year < _format.MIN_YEAR) | (year > _format.MAX_YEAR))
+    derived = [field for field in fields if field in DERIVED_FIELDS]
+    if derived:
+        components = dict(
+            components,
+            **calendar_fields(derived, components["year"], components["month"], components["day"]),
+        )
+    shared = () if runs is None else DATE_FIELDS + DERIVED_FIELDS
+    selected = {
+        field: expand(components[field], runs) if field in shared else components[field]
+        for field in fields
+    }
+    return selected, moved_out
+
+
+def scan(buffer, fields, validate="full", utc=False, shared_dates=False):
+    """
+    Validate the rows of a buffer and decode the requested components.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        A buffer accepted by `split`.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}, default "full"
+        "full" checks the format and the ranges of the components, "fast"
+        only the format, and "off" nothing.
+    utc : bool, default False
+        Whether to convert the components of rows with a UTC offset to UTC.
+        Rows without one are taken to be in UTC already.
+    shared_dates : bool, default False
+        Whether to check and decode each date once per run of consecutive
+        rows sharing it, as found by `date_runs`, which pays off for rows in
+        time order. Rows in any order give the same result.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray or None
+        One int64 array per requested field, or None if a row failed a check.
+    malformed : numpy.ndarray
+        Positions of the rows that are not in valid ISO 8601 format.
+    out_of_range : numpy.ndarray
+        Positions of the rows with out of range components, or whose date
+        leaves the four digit years when converted to UTC. Only filled in
+        when every row is well formed.
+    """
+    none = np.array([], dtype=np.intp)
+    with _phase("parsing"):
+        body, suffixes = split(buffer)
+        runs = date_runs(body) if shared_dates else None
+    if validate != "off":
+        with _phase("validation"):
+            malformed = np.flatnonzero(~is_well_formed(body, suffixes, runs))
+        if len(malformed):
+            return None, malformed, none
+    with _phase("parsing"):
+        components = decode(
+            body, fields_to_decode(fields, validate == "full", utc), suffixes, runs
+        )
+    if validate == "full":
+        with _phase("validation"):
+            invalid = np.flatnonzero(out_of_range(components, runs))
+        if len(invalid):
+            return None, none, invalid
+    with _phase("parsing"):
+        selected, moved_out = _select(components, fields, suffixes, utc, runs)
+    if validate != "off" and moved_out is not None and moved_out.any():
+        return None, none, np.flatnonzero(moved_out)
+    return selected, none, none
+
+
+def scan_masked(buffer, fields, validate="full", utc=False, shared_dates=False):
+    """
+    Decode the requested components of every row and flag the invalid rows.
+
+    Unlike `scan`, a failed check does not stop the scan: the components of
+    invalid rows are decoded too (their values are meaningless) and the rows
+    are flagged in a mask, so the caller can mask them out.
+
+    Parameters
+    ----------
+    buffer : numpy.ndarray
+        A buffer accepted by `split`.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}, default "full"
+        Which checks decide whether a row is valid.
+    utc, shared_dates : bool, default False
+        As for `scan`.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray
+        One int64 array per requested field.
+    valid : numpy.ndarray
+        Boolean mask, True where a row passed every check.
+    """
+    with _phase("parsing"):
+        body, suffixes = split(buffer)
+        runs = date_runs(body) if shared_dates else None
+    with _phase("validation"):
+        if validate == "off":
+            valid = np.ones(len(buffer), dtype=bool)
+        else:
+            valid = is_well_formed(body, suffixes, runs)
+    with _phase("parsing"):
+        components = decode(
+            body, fields_to_decode(fields, validate == "full", utc), suffixes, runs
+        )
+    if validate == "full":
+        with _phase("validation"):
+            valid &= ~out_of_range(components, runs)
+    with _phase("parsing"):
+        selected, moved_out = _select(components, fields, suffixes, utc, runs)
+    if validate != "off" and moved_out is not None:
+        valid &= ~moved_out
+    return selected, valid
@@ -0,0 +1,250 @@
+"""
+Layout of the accepted ISO 8601 formats.
+
+Every accepted string starts with YYYY-MM-DDThh:mm:ss, optionally followed
+by fractional seconds (a dot and 1 to 9 digits) and then by a UTC designator
+("Z") or a numeric offset (+hh:mm or -hh:mm).
+
+This module only uses the standard library, so that string input can be
+handled without importing NumPy or pandas.
+"""
+# Character offsets of each component in a YYYY-MM-DDThh:mm:ss string.
+FIELD_OFFSETS = {
+    "year": (0, 4),
+    "month": (5, 7),
+    "day": (8, 10),
+    "hour": (11, 13),
+    "minute": (14, 16),
+    "second": (17, 19),
+}
+DATE_FIELDS = ("year", "month", "day")
+TIME_FIELDS = ("hour", "minute", "second")
+
+# The fractional seconds, decoded from the optional digits after the seconds
+# and truncated to whole microseconds. Only extracted on request.
+FRACTION_FIELD = "microsecond"
+
+# Every component read from the string, in string order.
+DECODED_FIELDS = tuple(FIELD_OFFSETS) + (FRACTION_FIELD,)
+
+# The digits of the fractional seconds beyond the microsecond, in nanoseconds
+# (0 to 999). Only decoded for nanosecond timestamps, and not requestable.
+NANOSECOND_FIELD = "nanosecond"
+
+# Calendar features computed from the date with `calendar_fields`: the day of
+# the week (Monday is 0), the ISO 8601 week number, the day of the year
+# (January 1st is 1) and the quarter.
+DERIVED_FIELDS = ("weekday", "iso_week", "day_of_year", "quarter")
+
+# Every component that can be requested.
+FIELDS = DECODED_FIELDS + DERIVED_FIELDS
+
+# Number of decimal digits of each component.
+FIELD_DIGITS = {field: stop - start for field, (start, stop) in FIELD_OFFSETS.items()}
+FIELD_DIGITS[FRACTION_FIELD] = 6
+FIELD_DIGITS.update(weekday=1, iso_week=2, day_of_year=3, quarter=1)
+
+# The years a four digit year field can hold. Converting a date to UTC can
+# move it outside them.
+MIN_YEAR, MAX_YEAR = 1, 10 ** FIELD_DIGITS["year"] - 1
+
+# Requesting one of these fields checks that the whole date exists.
+CHECKED_DATE_FIELDS = ("month", "day") + DERIVED_FIELDS
+
+# Width of the YYYY-MM-DDThh:mm:ss part shared by every accepted string.
+ISO8601_WIDTH = 19
+
+# Fractional seconds have between 1 and this many digits.
+MAX_FRACTION_DIGITS = 9
+
+# Width of a numeric UTC offset such as +05:30.
+OFFSET_WIDTH = 6
+
+# Width of the longest accepted string, YYYY-MM-DDThh:mm:ss.fffffffff+hh:mm.
+MAX_WIDTH = ISO8601_WIDTH + 1 + MAX_FRACTION_DIGITS + OFFSET_WIDTH
+
+# Days per month, indexed by month number (index 0 is unused).
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def is_leap_year(year):
+    """Return whether `year` (an int or integer array) is a Gregorian leap year."""
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def days_from_civil(year, month, day):
+    """
+    Count the days from 1970-01-01 to a proleptic Gregorian date.
+
+    Uses only integer arithmetic, so it works on ints and on integer arrays
+    alike (H. Hinnant's days_from_civil algorithm).
+
+    Parameters
+    ----------
+    year, month, day : int or numpy.ndarray
+        The date. Months outside 1-12 give meaningless results.
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of days, negative before 1970.
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days):
+    """
+    Convert a count of days from 1970-01-01 back to a proleptic Gregorian date.
+
+    The inverse of `days_from_civil`, again for ints and integer arrays.
+
+    Parameters
+    ----------
+    days : int or numpy.ndarray
+        The number of days.
+
+    Returns
+    -------
+    tuple
+        The year, month and day.
+    """
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = (shifted_month + 2) % 12 + 1
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def weekday(days):
+    """Return the day of the week, Monday being 0, of a count of days from 1970-01-01."""
+    # 1970-01-01 was a Thursday.
+    return (days + 3) % 7
+
+
+def weeks_in_iso_year(year):
+    """Return the number of ISO 8601 weeks, 52 or 53, of `year` (an int or integer array)."""
+    def december_31st(year):
+        # Day of the week of December 31st, Sunday being 0.
+        return (year + year // 4 - year // 100 + year // 400) % 7
+
+    # Years starting on a Thursday, and leap years starting on a Wednesday,
+    # have 53 Thursdays.
+    return 52 + ((december_31st(year) == 4) | (december_31st(year - 1) == 3))
+
+
+def iso_week(day_of_year, weekday, weeks, previous_weeks):
+    """
+    Compute ISO 8601 week numbers, for ints and integer arrays alike.
+
+    Parameters
+    ----------
+    day_of_year : int or numpy.ndarray
+        The day of the year, January 1st being 1.
+    weekday : int or numpy.ndarray
+        The day of the week, Monday being 0.
+    weeks, previous_weeks : int or numpy.ndarray
+        The number of ISO weeks of the year and of the year before, as
+        returned by `weeks_in_iso_year`.
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The week, from 1 to 53. Days before the first Thursday of January
+        fall in the last week of the previous ISO year, and days after the
+        last Thursday of December in week 1 of the next.
+    """
+    week = (day_of_year - weekday + 9) // 7
+    week = week - (week > weeks) * (week - 1)
+    return week + (week < 1) * previous_weeks
+
+
+def calendar_fields(fields, year, month, day):
+    """
+    Compute derived calendar features of dates with integer arithmetic.
+
+    Like `days_from_civil`, this works on ints and on integer arrays alike.
+
+    Parameters
+    ----------
+    fields : iterable of str
+        The features to compute, from `DERIVED_FIELDS`.
+    year, month, day : int or numpy.ndarray
+        The dates, which must exist.
+
+    Returns
+    -------
+    dict
+        The requested features.
+    """
+    days = days_from_civil(year, month, day)
+    day_of_year = days - days_from_civil(year, 1, 1) + 1
+    derived = {
+        "weekday": weekday(days),
+        "day_of_year": day_of_year,
+        "quarter": (month + 2) // 3,
+    }
+    if "iso_week" in fields:
+        derived["iso_week"] = iso_week(
+            day_of_year, derived["weekday"], weeks_in_iso_year(year), weeks_in_iso_year(year - 1)
+        )
+    return {field: derived[field] for field in fields}
+
+
+# Ticks per second of each datetime64 unit.
+TICKS_PER_SECOND = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+# Range of int64 tick counts, leaving out the smallest value, which datetime64
+# reserves for NaT.
+MIN_TICKS = -(2 ** 63) + 1
+MAX_TICKS = 2 ** 63 - 1
+
+
+def to_ticks(days, hour, minute, second, microsecond, unit, nanosecond=0):
+    """
+    Count the ticks of a datetime64 unit from 1970-01-01T00:00:00.
+
+    Like `days_from_civil`, this works on ints and on integer arrays alike.
+
+    Parameters
+    ----------
+    days : int or numpy.ndarray
+        The date, as returned by `days_from_civil`.
+    hour, minute, second, microsecond : int or numpy.ndarray
+        The time of day. The fraction of a second is truncated to whole ticks.
+    unit : {"s", "ms", "us", "ns"}
+        The unit of the ticks.
+    nanosecond : int or numpy.ndarray, default 0
+        The nanoseconds beyond the microsecond.
+
+    Returns
+    -------
+    ticks : int or numpy.ndarray
+        The number of ticks. Meaningless for arrays where `in_range` is False.
+    in_range : bool or numpy.ndarray
+        Whether the ticks fit in an int64 datetime64 value.
+    """
+    scale = TICKS_PER_SECOND[unit]
+    seconds = days * 86400 + hour * 3600 + minute * 60 + second
+    fraction = (microsecond * 1_000 + nanosecond) * scale // 1_000_000_000
+    # The fraction is below one second, so only the seconds at either end of
+    # the range need it to decide.
+    highest, highest_fraction = divmod(MAX_TICKS, scale)
+    lowest, lowest_fraction = divmod(MIN_TICKS, scale)
+    in_range = (
+        ((seconds < highest) | ((seconds == highest) & (fraction <= highest_fraction)))
+        & ((seconds > lowest) | ((seconds == lowest) & (fraction >= lowest_fraction)))
+    )
+    return seconds * scale + fraction, in_range
@@ -0,0 +1,86 @@
+"""
+Deferred imports of the heavy dependencies.
+
+pandas and NumPy together take a large part of a second to import, which
+string-only users (command line tools, short-lived workers) should not pay
+for. Modules are therefore bound to `LazyModule` stand-ins that import them
+on first use, and Series are recognised without importing pandas.
+"""
+import importlib
+import sys
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Parameters
+    ----------
+    name : str
+        The absolute name of the module.
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        # Only called for attributes not found on the stand-in itself. Copying
+        # the module namespace makes every later lookup an ordinary one.
+        module = importlib.import_module(self._name)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        return f"<lazily imported module '{self._name}'>"
+
+
+def _is_instance(value, module_name, class_names):
+    """
+    Check the type of a value against classes of a module, if it was imported.
+
+    If the module has not been imported yet, none of its objects can exist,
+    so the check never imports anything.
+
+    Parameters
+    ----------
+    value : object
+        The value to check.
+    module_name : str
+        The module defining the classes.
+    class_names : tuple of str
+        The names of the classes.
+
+    Returns
+    -------
+    bool
+        True if `value` is an instance of one of the classes.
+    """
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(
+        value, tuple(getattr(module, name) for name in class_names)
+    )
+
+
+def is_series(value):
+    """Check whether a value is a pandas Series without importing pandas."""
+    return _is_instance(value, "pandas", ("Series",))
+
+
+def is_array(value):
+    """Check whether a value is a NumPy array without importing NumPy."""
+    return _is_instance(value, "numpy", ("ndarray",))
+
+
+def is_arrow(value):
+    """Check whether a value is a pyarrow Array or ChunkedArray without importing pyarrow."""
+    return _is_instance(value, "pyarrow", ("Array", "ChunkedArray"))
+
+
+def is_polars_series(value):
+    """Check whether a value is a Polars Series without importing Polars."""
+    return _is_instance(value, "polars", ("Series",))
+
+
+def is_dask_series(value):
+    """Check whether a value is a Dask Series without importing Dask."""
+    return _is_instance(value, "dask.dataframe", ("Series",))
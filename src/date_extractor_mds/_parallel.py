@@ -0,0 +1,170 @@
+"""
+Process-pool execution of the NumPy engine.
+
+The parent copies the strings once into a byte buffer held in shared memory.
+Each worker attaches to that buffer, scans one contiguous partition of it
+and writes the decoded components into a second shared array, so neither the
+strings nor the results are pickled. Only the (usually empty) positions of
+invalid rows travel back through the pool.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from date_extractor_mds import _engine
+
+# Below this many rows per worker, starting processes costs more than it saves.
+MIN_ROWS_PER_JOB = 250_000
+
+
+def effective_jobs(n_jobs, n_rows):
+    """
+    Work out how many processes to use for a Series.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        The requested number of processes. None and 1 mean no pool, and -1
+        means one process per CPU.
+    n_rows : int
+        The length of the Series.
+
+    Returns
+    -------
+    int
+        The number of processes, at least 1.
+
+    Raises
+    ------
+    ValueError
+        If `n_jobs` is not None, -1 or a positive integer.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif not isinstance(n_jobs, int) or n_jobs < 1:
+        raise ValueError("n_jobs must be None, -1 or a positive integer.")
+    return max(1, min(n_jobs, n_rows // MIN_ROWS_PER_JOB))
+
+
+def _scan_partition(buffer_name, output_name, n_rows, width, start, stop, fields, validate,
+                    utc, masked, shared_dates):
+    """
+    Scan one partition of the shared buffer in a worker process.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Positions, within the whole buffer, of malformed rows and of rows
+        with out of range components. When `masked` is set, every invalid
+        row is reported in the first array and the second is empty.
+    """
+    # Pool workers share the parent's resource tracker, so attaching here does
+    # not register the blocks a second time; the parent unlinks them.
+    buffer_block = shared_memory.SharedMemory(name=buffer_name)
+    output_block = shared_memory.SharedMemory(name=output_name)
+    try:
+        buffer = np.ndarray((n_rows, width), dtype=np.uint8, buffer=buffer_block.buf)
+        output = np.ndarray((len(fields), n_rows), dtype=np.int64, buffer=output_block.buf)
+        if masked:
+            components, valid = _engine.scan_masked(
+                buffer[start:stop], fields, validate, utc, shared_dates
+            )
+            malformed, out_of_range = np.flatnonzero(~valid), np.array([], dtype=np.intp)
+        else:
+            components, malformed, out_of_range = _engine.scan(
+                buffer[start:stop], fields, validate, utc, shared_dates
+            )
+        if components is not None:
+            for row, field in enumerate(fields):
+                output[row, start:stop] = components[field]
+        del buffer, output
+        return malformed + start, out_of_range + start
+    finally:
+        buffer_block.close()
+        output_block.close()
+
+
+def scan(values, fields, validate, n_jobs, masked=False, utc=False, shared_dates=False):
+    """
+    Run `_engine.scan` over contiguous partitions of `values` in a process pool.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The strings to scan, or a two dimensional byte buffer accepted by
+        `_engine.split`.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}
+        Which checks to run.
+    n_jobs : int
+        The number of processes, as returned by `effective_jobs`.
+    masked : bool, default False
+        Whether to run `_engine.scan_masked` instead of `_engine.scan`.
+    utc, shared_dates : bool, default False
+        As for `_engine.scan`.
+
+    Returns
+    -------
+    tuple
+        The same ``(components, malformed, out_of_range)`` triple as
+        `_engine.scan`, or ``(components, valid)`` pair as
+        `_engine.scan_masked`, for the whole of `values`.
+
+    Raises
+    ------
+    UnicodeEncodeError
+        If a string contains non-ASCII characters.
+    """
+    n_rows = len(values)
+    # Byte buffers, such as those read from Arrow input, are shared at their own width.
+    width = values.shape[1] if values.ndim == 2 else _engine.BUFFER_WIDTH
+    buffer_block = shared_memory.SharedMemory(create=True, size=n_rows * width)
+    output_block = shared_memory.SharedMemory(create=True, size=len(fields) * n_rows * 8)
+    try:
+        if values.ndim == 2:
+            shared = np.ndarray((n_rows, width), dtype=np.uint8, buffer=buffer_block.buf)
+            shared[:] = values
+            del shared
+        else:
+            # Encoding straight into shared memory avoids a second copy of the strings.
+            strings = np.ndarray(n_rows, dtype=f"S{_engine.BUFFER_WIDTH}", buffer=buffer_block.buf)
+            strings[:] = values
+            if validate != "off":
+                _engine.mark_nul_rows(values, strings.view(np.uint8).reshape(n_rows, width))
+            del strings
+
+        bounds = np.linspace(0, n_rows, n_jobs + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(_scan_partition, buffer_block.name, output_block.name, n_rows, width,
+                            start, stop, fields, validate, utc, masked, shared_dates)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            results = [future.result() for future in futures]
+
+        malformed = np.concatenate([result[0] for result in results])
+        out_of_range = np.concatenate([result[1] for result in results])
+        if masked:
+            valid = np.ones(n_rows, dtype=bool)
+            valid[malformed] = False
+        elif len(malformed):
+            # As in the serial scan, range checks only count once every row is well formed.
+            return None, malformed, out_of_range[:0]
+        elif len(out_of_range):
+            return None, malformed, out_of_range
+        output = np.ndarray((len(fields), n_rows), dtype=np.int64, buffer=output_block.buf)
+        components = {field: output[row].copy() for row, field in enumerate(fields)}
+        del output
+        if masked:
+            return components, valid
+        return components, malformed, out_of_range
+    finally:
+        buffer_block.close()
+        buffer_block.unlink()
+        output_block.close()
+        output_block.unlink()
@@ -0,0 +1,238 @@
+"""
+Batched extraction for asyncio services handling one timestamp at a time.
+
+A service decoding the timestamp of each incoming message would call an
+extractor once per string, paying the per-call overhead every time and
+blocking its event loop while it runs. `BatchExtractor` gathers the strings
+awaited by concurrent coroutines and runs the extractor once per batch, on
+a list and in an executor, where the NumPy engine amortises that overhead
+over the whole batch. Each coroutine then gets back what a direct call on
+its own string would have returned or raised. asyncio is only imported
+with this module, which the package loads on first use.
+"""
+import asyncio
+
+from date_extractor_mds.date_extractor_mds import _ERROR_MODES, _check_choice, extract_components
+
+
+def _split_result(result, n_values):
+    """
+    Split the array result of an extractor into one value per element.
+
+    Parameters
+    ----------
+    result : numpy.ndarray or dict of str to numpy.ndarray
+        The result of an extractor for a list of strings.
+    n_values : int
+        The number of strings.
+
+    Returns
+    -------
+    list
+        One value per string, of the type returned for a single string:
+        Python objects, a dict for `extract_components`, and NumPy
+        datetime64 scalars for datetime64 arrays.
+    """
+    if isinstance(result, dict):
+        columns = {field: _split_result(values, n_values) for field, values in result.items()}
+        return [
+            {field: values[position] for field, values in columns.items()}
+            for position in range(n_values)
+        ]
+    if result.dtype.kind == "M":
+        return list(result)
+    return result.tolist()
+
+
+def _extract_batch(function, values, errors, options):
+    """
+    Run an extractor over a batch of strings, as if on each string in turn.
+
+    The batch goes through the vectorized extractor once. Strings that fail
+    its checks, which should be rare, are then passed to the extractor one
+    at a time, so that they give the same result or exception as a direct
+    call on the string. `output` is left out of the vectorized call, since
+    it only applies to containers and a direct call on a string ignores it.
+
+    Parameters
+    ----------
+    function : callable
+        The extractor.
+    values : list
+        The strings.
+    errors : {"raise", "coerce", "mask"}
+        The errors mode of the direct calls being emulated.
+    options : dict
+        Further keyword arguments for the extractor.
+
+    Returns
+    -------
+    list of tuple
+        One ``(result, exception)`` pair per string, exactly one of which
+        is meaningful.
+    """
+    options = {name: value for name, value in options.items() if name != "output"}
+    try:
+        batch, valid = function(values, errors="mask", **options)
+    except (TypeError, ValueError):
+        # Options the extractor rejects are rejected for every string alike.
+        batch, valid = None, [False] * len(values)
+    results = [] if batch is None else _split_result(batch, len(values))
+    outcomes = []
+    for position, (value, ok) in enumerate(zip(values, list(valid))):
+        if ok:
+            result = results[position]
+            outcomes.append(((result, True) if errors == "mask" else result, None))
+            continue
+        try:
+            outcomes.append((function(value, errors=errors, **options), None))
+        except Exception as error:
+            outcomes.append((None, error))
+    return outcomes
+
+
+class BatchExtractor:
+    """
+    Extract components of single strings from asyncio code, in batches.
+
+    Calling an extractor once per message from a coroutine blocks the event
+    loop for the whole parse. `BatchExtractor` instead queues the strings
+    awaited with `extract`, and once `max_batch_size` strings are waiting,
+    or `max_latency` seconds after the first one arrived, hands the whole
+    batch to a single vectorized extractor call in an executor. Each caller
+    gets the result for its own string, exactly as a direct call would give
+    it, including the exception raised for an invalid string.
+
+    Parameters
+    ----------
+    function : callable, default `extract_components`
+        The extractor to run, such as `extract_year`, `extract_time`,
+        `extract_components` or `to_datetime64`.
+    max_batch_size : int, default 1024
+        The largest number of strings processed in one call.
+    max_latency : float, default 0.005
+        The longest time, in seconds, that a string waits for its batch to
+        fill up before the batch is processed anyway.
+    executor : concurrent.futures.Executor, optional
+        Where batches are processed. Defaults to the event loop's default
+        executor, a thread pool. A process pool also works.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid strings are reported, as for a direct call on a string.
+    **options
+        Further keyword arguments for the extractor, such as `fields`,
+        `validate` or `utc`.
+
+    Raises
+    ------
+    ValueError
+        If `max_batch_size` is not positive, `max_latency` is negative, or
+        `errors` is unknown.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> async def main():
+    ...     async with BatchExtractor(fields=["year", "month"]) as extractor:
+    ...         return await asyncio.gather(
+    ...             extractor.extract("2023-07-16T12:34:56"),
+    ...             extractor.extract("2024-03-25T08:15:30"),
+    ...         )
+    >>> asyncio.run(main())
+    [{'year': 2023, 'month': 7}, {'year': 2024, 'month': 3}]
+    """
+
+    def __init__(self, function=extract_components, max_batch_size=1024, max_latency=0.005,
+                 executor=None, errors="raise", **options):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer.")
+        if max_latency < 0:
+            raise ValueError("max_latency must not be negative.")
+        _check_choice(errors, _ERROR_MODES, "errors mode")
+        self.function = function
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.executor = executor
+        self.errors = errors
+        self.options = options
+        self._pending = []
+        self._timer = None
+        self._running = set()
+
+    async def extract(self, datetime_str):
+        """
+        Extract from one string, processed in a batch with other strings.
+
+        Parameters
+        ----------
+        datetime_str : str
+            A datetime string in ISO 8601 format.
+
+        Returns
+        -------
+        object
+            What ``function(datetime_str, errors=errors, **options)`` returns.
+
+        Raises
+        ------
+        TypeError, ValueError
+            What ``function(datetime_str, errors=errors, **options)`` raises.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((datetime_str, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush)
+        return await future
+
+    def _flush(self):
+        """Hand the queued strings to the executor as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(
+            self.executor, _extract_batch, self.function, [value for value, _ in batch],
+            self.errors, self.options,
+        )
+        self._running.add(task)
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+
+    def _resolve(self, batch, task):
+        """Pass the outcome of a processed batch on to the waiting callers."""
+        self._running.discard(task)
+        futures = [future for _, future in batch]
+        if task.cancelled() or task.exception() is not None:
+            for future in futures:
+                if not future.done():
+                    if task.cancelled():
+                        future.cancel()
+                    else:
+                        future.set_exception(task.exception())
+            return
+        for future, (result, error) in zip(futures, task.result()):
+            # A caller that stopped waiting has cancelled its future.
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    async def flush(self):
+        """
+        Process the queued strings now and wait for every batch in progress.
+        """
+        self._flush()
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.flush()
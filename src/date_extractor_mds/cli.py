@@ -0,0 +1,252 @@
+"""
+Command-line entry point, installed as ``date-extractor``.
+
+The input, a file or standard input, is read in chunks; the components of
+one column of each chunk are extracted, possibly in several worker
+processes, and written out in input order as soon as they are ready. Only a
+few chunks are held at a time, so memory use depends on `--chunksize` and
+`--workers` rather than on the size of the input.
+
+Examples
+--------
+Extract the year and month of the "timestamp" column of a CSV file::
+
+    date-extractor events.csv --column timestamp --fields year,month
+
+Parse a log of one timestamp per line from standard input on four cores,
+writing Parquet and reporting throughput::
+
+    cat stamps.txt | date-extractor --format lines --workers 4 --stats -o parts.parquet
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from date_extractor_mds import _format
+from date_extractor_mds.date_extractor_mds import extract_components
+from date_extractor_mds.streaming import _FORMAT_NAMES, _file_format, _read_column, _write_extracted
+
+# Chunks queued per worker process, so that workers never wait for the reader
+# while memory stays bounded.
+_CHUNKS_PER_WORKER = 2
+
+
+def _workers(value):
+    """Parse the --workers option: a positive number of processes, or -1 for one per CPU."""
+    workers = int(value)
+    if workers == -1:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer or -1")
+    return workers
+
+
+def _fields(value):
+    """Parse the --fields option, a comma-separated list of fields."""
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    for field in fields:
+        if field not in _format.FIELDS:
+            raise argparse.ArgumentTypeError(
+                f"unknown field '{field}' (valid fields are: {', '.join(_format.FIELDS)})"
+            )
+    return fields
+
+
+def _build_parser():
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="date-extractor",
+        description="Extract components from the ISO 8601 timestamps of a file or of standard "
+                    "input, in bounded memory.",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-",
+        help="CSV, Parquet, newline-delimited JSON or text file to read, or - for standard "
+             "input (the default)",
+    )
+    parser.add_argument(
+        "-c", "--column",
+        help="column (or JSON key) holding the timestamps; not needed for text input",
+    )
+    parser.add_argument(
+        "--fields", type=_fields, default=list(_format.FIELD_OFFSETS),
+        help="comma-separated components to extract (default: year,month,day,hour,minute,second)",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=_FORMAT_NAMES,
+        help="input format, inferred from the file name by default; standard input defaults "
+             "to csv, and lines holds one timestamp per line",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="file to write the components to, or - for standard output (the default)",
+    )
+    parser.add_argument(
+        "--output-format", choices=("csv", "ndjson", "parquet"),
+        help="output format, inferred from the output file name by default; standard output "
+             "defaults to csv",
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=100_000, help="rows read and processed at a time",
+    )
+    parser.add_argument(
+        "--workers", type=_workers, default=1,
+        help="worker processes extracting chunks in parallel, or -1 for one per CPU",
+    )
+    parser.add_argument(
+        "--errors", choices=("raise", "coerce"), default="raise",
+        help="stop at the first invalid row, or leave its components empty",
+    )
+    parser.add_argument(
+        "--validate", choices=("full", "fast", "off"), default="full",
+        help="how thoroughly timestamps are checked",
+    )
+    parser.add_argument(
+        "--utc", action="store_true", help="convert timestamps with a UTC offset to UTC first",
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="report rows, invalid rows and throughput on standard error",
+    )
+    return parser
+
+
+def _extract_chunk(chunk, fields, options):
+    """
+    Extract the components of one chunk, in a worker process or inline.
+
+    Returns
+    -------
+    components : pandas.DataFrame
+        The components of the chunk.
+    invalid_rows : int
+        The number of invalid rows, left empty in the components.
+    seconds : float
+        The time spent extracting.
+
+    Raises
+    ------
+    ValueError
+        If a row is invalid and `errors` is "raise". The message gives the
+        first row of the chunk, so positions can be mapped back to the input.
+    """
+    start = perf_counter()
+    try:
+        if options["errors"] == "raise":
+            components, invalid_rows = extract_components(chunk, fields, **options), 0
+        else:
+            components, valid = extract_components(chunk, fields, **dict(options, errors="mask"))
+            invalid_rows = len(valid) - int(valid.sum())
+    except ValueError as error:
+        raise ValueError(f"In the chunk starting at row {chunk.index[0]}: {error}") from None
+    return components, invalid_rows, perf_counter() - start
+
+
+def _extract_chunks(chunks, fields, options, workers):
+    """
+    Extract the components of consecutive chunks, in input order.
+
+    With several workers, chunks are handed to a process pool as they are
+    read, keeping at most `_CHUNKS_PER_WORKER` chunks per worker in flight.
+
+    Yields
+    ------
+    tuple
+        What `_extract_chunk` returns, for each chunk in turn.
+    """
+    if workers == 1:
+        for chunk in chunks:
+            yield _extract_chunk(chunk, fields, options)
+        return
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_extract_chunk, chunk, fields, options))
+            if len(pending) >= workers * _CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+class _Stats:
+    """Counts of the rows extracted, for --stats."""
+
+    def __init__(self):
+        self.rows = 0
+        self.invalid_rows = 0
+        self.extraction_seconds = 0.0
+        self.start = perf_counter()
+
+    def count(self, results):
+        """Count the results of `_extract_chunks` as they pass through."""
+        for components, invalid_rows, seconds in results:
+            self.rows += len(components)
+            self.invalid_rows += invalid_rows
+            self.extraction_seconds += seconds
+            yield components
+
+    def report(self, stream):
+        """Write the totals and the throughput."""
+        elapsed = perf_counter() - self.start
+        print(
+            f"date-extractor: {self.rows:,} rows ({self.invalid_rows:,} invalid) in {elapsed:.2f} s, "
+            f"{self.rows / elapsed if elapsed else 0:,.0f} rows/s; "
+            f"{self.extraction_seconds:.2f} s spent extracting",
+            file=stream,
+        )
+
+
+def main(argv=None):
+    """
+    Run the command line.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The arguments, without the program name. Defaults to `sys.argv`.
+
+    Returns
+    -------
+    int
+        The exit status: 0 on success, 1 if the input could not be processed.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.chunksize < 1:
+        parser.error("--chunksize must be a positive integer")
+    source = sys.stdin if args.input == "-" else args.input
+    target = sys.stdout if args.output == "-" else args.output
+    try:
+        input_format = _file_format(source, args.format or ("csv" if source is sys.stdin else None))
+        output_format = _file_format(
+            target, args.output_format or ("csv" if target is sys.stdout else None)
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    if input_format != "lines" and args.column is None:
+        parser.error(f"--column is required for {input_format} input")
+
+    options = {"validate": args.validate, "errors": args.errors, "utc": args.utc}
+    stats = _Stats()
+    try:
+        chunks = _read_column(source, args.column, args.chunksize, input_format)
+        results = _extract_chunks(chunks, args.fields, options, args.workers)
+        _write_extracted(stats.count(results), target, output_format)
+        if target is sys.stdout:
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader of standard output has gone, as with `| head`.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (ImportError, OSError, ValueError) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
+    if args.stats:
+        stats.report(sys.stderr)
+    return 0
@@ -1,15 +1,1575 @@
-import pandas as pd
+"""
+Extract dates, times and their components from ISO 8601 strings.
+
+Every extractor takes a single string, or a column of them, in the format
+YYYY-MM-DDThh:mm:ss, optionally followed by fractional seconds (up to 9
+digits) and by "Z" or a +hh:mm or -hh:mm UTC offset. A column can be a
+Pandas Series; a list, tuple or one dimensional NumPy array (str_, bytes_
+or object), which gives NumPy arrays without building pandas objects; a
+pyarrow Array or ChunkedArray or a Polars Series, decoded on its Arrow
+string buffers and giving the same container type; or a Dask Series, which
+gives a lazy Dask result whose partitions are each checked and decoded by
+the task computing them.
+
+Apart from their own options, the extractors share the following ones.
+
+engine : {"numpy", "python"}, default "numpy"
+    How a Pandas Series is processed. "numpy" validates and decodes the
+    whole Series on a fixed-width byte buffer, while "python" validates
+    with `validate_datetime` and then parses the Series row by row.
+validate : {"full", "fast", "off"}, default "full"
+    How thoroughly the input is checked. "full" checks the format and
+    that the extracted components are in range, "fast" checks the
+    format only, and "off" skips validation for already trusted data.
+    `extract_day` defaults to "fast", as it never checked more.
+output : {None, "compact", "pyarrow"} or integer dtype, default None
+    The dtype of a Pandas Series result. None gives int64, "compact" the
+    smallest integer dtype that holds each component (int16 for years
+    and days of the year, int32 for microseconds, int8 otherwise), and
+    "pyarrow" the compact dtype backed by pyarrow. Any integer dtype wide
+    enough for every requested component is also accepted. Ignored for
+    string input.
+n_jobs : int, optional
+    The number of processes used to process a large Pandas Series with
+    the NumPy engine, or -1 for one per CPU. The Series is split into
+    contiguous partitions that share one memory buffer, and the result
+    keeps the original index. Series too small to benefit use fewer
+    processes, down to none.
+deduplicate : {False, True, "sorted"}, default False
+    Whether to decode each distinct string of a Pandas Series only once
+    and broadcast the results back, which pays off for columns with many
+    repeated timestamps. Categorical Series are always handled this way.
+    "sorted" suits input in time order instead: each date is checked and
+    decoded once per run of consecutive rows sharing it. Input in any
+    other order gives the same result, without the speed-up.
+errors : {"raise", "coerce", "mask"}, default "raise"
+    How invalid input is handled. "raise" raises a ValueError. "coerce"
+    turns invalid rows, missing values and non-strings into <NA> in a
+    nullable result (None for string input). "mask" does the same and
+    also returns a boolean Series, True where a row is valid, as
+    ``(result, mask)``. Which rows are invalid depends on `validate`.
+utc : bool, default False
+    Whether to convert datetimes with a UTC offset ("Z" or +hh:mm) to
+    UTC first, which can change every component but the seconds.
+    Datetimes without an offset are taken to be in UTC already. By
+    default the components are extracted as written, ignoring the offset.
+    Unless `validate` is "off", a datetime moved before year 1 or past
+    year 9999 by the conversion is out of range.
+"""
+import functools
 import re
-from datetime import datetime
+from datetime import date, time
+
+from date_extractor_mds import _format
+from date_extractor_mds._lazy import (
+    LazyModule,
+    is_array,
+    is_arrow,
+    is_dask_series,
+    is_polars_series,
+    is_series,
+)
+from date_extractor_mds.instrumentation import (
+    _count_invalid,
+    _count_invalid_mask,
+    _count_rows,
+    _phase,
+    instrumented,
+)
+
+__all__ = [
+    "validate_datetime",
+    "extract_year",
+    "extract_month",
+    "extract_day",
+    "extract_time",
+    "extract_components",
+    "add_date_parts",
+    "to_datetime64",
+]
+
+# pandas, NumPy and the NumPy engine are only needed for Series input, so they
+# are imported on first use and string-only callers start quickly.
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+_engine = LazyModule("date_extractor_mds._engine")
+_parallel = LazyModule("date_extractor_mds._parallel")
+_arrow = LazyModule("date_extractor_mds._arrow")
+_dask = LazyModule("date_extractor_mds._dask")
+pl = LazyModule("polars")
+
+# The fixed-width YYYY-MM-DDThh:mm:ss part that starts every accepted string.
+# It has no alternatives to backtrack over; what follows it is scanned by hand.
+_ISO8601_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", re.ASCII)
+
+# Maximum number of offending positions listed in a validation error message.
+_MAX_REPORTED_POSITIONS = 10
+
+# What is wrong with the invalid rows of a Series or array, in the order the
+# checks run: input failing both is only reported for the first.
+_MALFORMED = "are not in valid ISO 8601 format"
+_OUT_OF_RANGE = "contain out of range date or time components"
+
+# Engines available to the extractors for Pandas Series input.
+_ENGINES = ("numpy", "python")
+
+# How thoroughly the extractors check their input: "full" checks the format
+# and the ranges of the extracted components, "fast" only the format, and
+# "off" nothing at all.
+_VALIDATE_MODES = ("full", "fast", "off")
+
+# The `deduplicate` value sharing the work on each date between consecutive
+# rows, for time-ordered input.
+_SORTED = "sorted"
+
+# Values of `deduplicate`: False parses every row, True each distinct string
+# once, and "sorted" each run of consecutive rows sharing a date once.
+_DEDUPLICATE_MODES = (False, True, _SORTED)
+
+# How the extractors handle invalid rows: "raise" raises a ValueError, "coerce"
+# turns them into missing values, and "mask" also returns a validity mask.
+_ERROR_MODES = ("raise", "coerce", "mask")
+
+# Smallest integer dtype able to hold each component, used by output="compact".
+_COMPACT_DTYPES = {
+    "year": "int16",
+    "month": "int8",
+    "day": "int8",
+    "hour": "int8",
+    "minute": "int8",
+    "second": "int8",
+    "microsecond": "int32",
+    "weekday": "int8",
+    "iso_week": "int8",
+    "day_of_year": "int16",
+    "quarter": "int8",
+}
+
+# Components of the datetime.time objects returned by `extract_time`.
+_TIME_OF_DAY = _format.TIME_FIELDS + (_format.FRACTION_FIELD,)
+
+# Representations of the time of day accepted by `extract_time`.
+_TIME_OUTPUTS = ("time", "seconds", "timedelta", "pyarrow")
+
+# `extract_time` outputs made of time values (datetime.time objects or Arrow
+# time32 values), which cannot hold an hour of 24 or a 60th minute or second.
+_TIME_VALUE_OUTPUTS = (None, "time", "pyarrow")
+
+# Units of the datetime64 values returned by `to_datetime64`.
+_DATETIME_UNITS = tuple(_format.TICKS_PER_SECOND)
+
+# Raised for input of an unsupported type.
+_TYPE_ERROR_MESSAGE = (
+    "Input must be either a string or a Pandas Series of strings, "
+    "or a list, tuple or NumPy array of strings."
+)
+
+# Number of distinct strings whose parse results are kept for string input.
+_STRING_CACHE_SIZE = 4096
+
+
+def _is_string_series(series):
+    """
+    Check whether every element of a Pandas Series is a string.
+
+    The check is driven by the Series dtype so that no Python-level
+    ``isinstance`` call is made per element.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        The Series to inspect.
+
+    Returns
+    -------
+    bool
+        True if all elements are strings (an empty Series counts), False otherwise.
+    """
+    if series.dtype == object:
+        return pd.api.types.infer_dtype(series, skipna=False) in ("string", "empty")
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        return (
+            pd.api.types.infer_dtype(categories, skipna=False) in ("string", "empty")
+            and not series.hasnans
+        )
+    return pd.api.types.is_string_dtype(series.dtype) and not series.hasnans
+
+
+def _is_string_array(values):
+    """
+    Check whether every element of a NumPy array is a string.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The array to inspect.
+
+    Returns
+    -------
+    bool
+        True for str_ and bytes_ arrays, and for object arrays holding only
+        str and bytes objects.
+    """
+    if values.dtype.kind in "US":
+        return True
+    return values.dtype == object and all(isinstance(value, (str, bytes)) for value in values)
+
+
+def _as_array(datetime_input):
+    """
+    Convert sequence or NumPy array input to a one dimensional array.
+
+    Parameters
+    ----------
+    datetime_input : object
+        The input passed to an extractor.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The elements of a list, tuple or NumPy array, or None for any other
+        input. Lists and tuples become object arrays without copying the
+        strings themselves.
+
+    Raises
+    ------
+    ValueError
+        If a NumPy array is not one dimensional.
+    """
+    if isinstance(datetime_input, (list, tuple)):
+        values = np.empty(len(datetime_input), dtype=object)
+        values[:] = datetime_input
+        return values
+    if is_array(datetime_input):
+        if datetime_input.ndim != 1:
+            raise ValueError("NumPy arrays of datetime strings must be one dimensional.")
+        return datetime_input
+    return None
+
+
+def _format_positions(positions):
+    """
+    Format the index positions of invalid rows for an error message.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Integer positions of the offending rows.
+
+    Returns
+    -------
+    str
+        A comma separated list of positions, truncated after
+        ``_MAX_REPORTED_POSITIONS`` entries.
+    """
+    shown = ", ".join(str(position) for position in positions[:_MAX_REPORTED_POSITIONS])
+    remaining = len(positions) - _MAX_REPORTED_POSITIONS
+    if remaining > 0:
+        shown += f", ... ({remaining} more)"
+    return shown
+
+
+def _raise_invalid_positions(positions, reason=_MALFORMED, container="Pandas Series"):
+    """
+    Raise the ValueError reported for a Series or array with invalid elements.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Integer positions of the offending rows.
+    reason : str, optional
+        What is wrong with the offending rows.
+    container : str, default "Pandas Series"
+        What the input was, as named in the message.
+
+    Raises
+    ------
+    ValueError
+        Always. Its `positions` and `reason` attributes hold the arguments,
+        so that the errors of several partitions can be combined.
+    """
+    _count_invalid(len(positions))
+    error = ValueError(
+        f"One or more elements in the {container} {reason} "
+        f"(positions: {_format_positions(positions)})."
+    )
+    error.positions, error.reason = positions, reason
+    raise error
+
+
+def _resolve_fields(fields):
+    """
+    Check a list of requested component names.
+
+    Parameters
+    ----------
+    fields : list of str or None
+        The requested components. None selects the six components of
+        YYYY-MM-DDThh:mm:ss, leaving out the microsecond.
+
+    Returns
+    -------
+    tuple of str
+        The requested components, in the order given.
+
+    Raises
+    ------
+    ValueError
+        If a field name is unknown or no field is requested.
+    """
+    if fields is None:
+        return tuple(_format.FIELD_OFFSETS)
+    if isinstance(fields, str):
+        fields = [fields]
+    fields = tuple(fields)
+    if not fields:
+        raise ValueError("At least one field must be requested.")
+    for field in fields:
+        if field not in _format.FIELDS:
+            raise ValueError(
+                f"Unknown field '{field}'. Valid fields are: {', '.join(_format.FIELDS)}."
+            )
+    return fields
+
+
+def _is_ascii_digits(text):
+    """Return whether a string is made of ASCII digits only."""
+    return text.isascii() and text.isdigit()
+
+
+def _scan_suffix(suffix):
+    """
+    Scan what follows the seconds of a string.
+
+    The designator is recognised from the end of the string, so that what
+    remains can only be fractional seconds.
+
+    Parameters
+    ----------
+    suffix : str
+        The rest of the string after YYYY-MM-DDThh:mm:ss.
+
+    Returns
+    -------
+    tuple or None
+        None if the suffix is not in an accepted format, otherwise
+        ``(nanoseconds, offset)`` where `nanoseconds` is the fraction of a
+        second and `offset` is the UTC offset in minutes, or None if the
+        string has no designator.
+    """
+    offset = None
+    if suffix.endswith("Z"):
+        suffix, offset = suffix[:-1], 0
+    elif len(suffix) >= _format.OFFSET_WIDTH and suffix[-_format.OFFSET_WIDTH] in "+-":
+        sign, hours, colon, minutes = suffix[-6], suffix[-5:-3], suffix[-3], suffix[-2:]
+        if colon != ":" or not _is_ascii_digits(hours + minutes):
+            return None
+        hours, minutes = int(hours), int(minutes)
+        if hours > 23 or minutes > 59:
+            return None
+        offset = (hours * 60 + minutes) * (1 if sign == "+" else -1)
+        suffix = suffix[:-_format.OFFSET_WIDTH]
+    if not suffix:
+        return 0, offset
+    digits = suffix[1:]
+    if (
+        suffix[0] != "." or not 1 <= len(digits) <= _format.MAX_FRACTION_DIGITS
+        or not _is_ascii_digits(digits)
+    ):
+        return None
+    return int(digits.ljust(_format.MAX_FRACTION_DIGITS, "0")), offset
+
+
+def _scan_string(datetime_str):
+    """
+    Validate a single string and decode all of its components.
+
+    Strings of the common YYYY-MM-DDThh:mm:ss width skip the suffix scan.
+
+    Parameters
+    ----------
+    datetime_str : str
+        The string to scan.
+
+    Returns
+    -------
+    tuple or None
+        None if the string is not in valid ISO 8601 format, otherwise
+        ``(components, date_ok, time_ok, offset)`` where `components` holds
+        the six components in string order followed by the microsecond and
+        the nanoseconds beyond it, the flags tell whether the date and the time of day exist, and `offset`
+        is the UTC offset in minutes, or None if the string has none.
+    """
+    if _ISO8601_PATTERN.match(datetime_str) is None:
+        return None
+    if len(datetime_str) == _format.ISO8601_WIDTH:
+        nanoseconds, offset = 0, None
+    else:
+        suffix = _scan_suffix(datetime_str[_format.ISO8601_WIDTH:])
+        if suffix is None:
+            return None
+        nanoseconds, offset = suffix
+    components = tuple(
+        int(datetime_str[start:stop]) for start, stop in _format.FIELD_OFFSETS.values()
+    ) + divmod(nanoseconds, 1_000)
+    year, month, day, hour, minute, second = components[:len(_format.FIELD_OFFSETS)]
+    date_ok = year >= 1 and 1 <= month <= 12 and 1 <= day <= (
+        _format.DAYS_IN_MONTH[month] + (month == 2 and _format.is_leap_year(year))
+    )
+    time_ok = hour <= 23 and minute <= 59 and second <= 59
+    return components, date_ok, time_ok, offset
+
+
+def _to_utc(components, offset):
+    """
+    Convert the components of a string to UTC.
+
+    Parameters
+    ----------
+    components : tuple of int
+        The components returned by `_scan_string`.
+    offset : int
+        The UTC offset of the string in minutes.
+
+    Returns
+    -------
+    tuple of int
+        The components with the date, hour and minute shifted by the offset.
+    """
+    year, month, day, hour, minute, second, microsecond, nanosecond = components
+    day_shift, minutes = divmod(hour * 60 + minute - offset, _format.MINUTES_PER_DAY)
+    hour, minute = divmod(minutes, 60)
+    if day_shift:
+        year, month, day = _format.civil_from_days(
+            _format.days_from_civil(year, month, day) + day_shift
+        )
+    return year, month, day, hour, minute, second, microsecond, nanosecond
+
+
+# String input is usually a handful of recurring timestamps (for example one
+# per request in a web service), so the scans of recent strings are kept.
+_scan_string_cached = functools.lru_cache(maxsize=_STRING_CACHE_SIZE)(_scan_string)
+
+# Position of each component in the tuples returned by `_scan_string`.
+_FIELD_INDEX = {
+    field: index
+    for index, field in enumerate(_format.DECODED_FIELDS + (_format.NANOSECOND_FIELD,))
+}
+
+
+def _decode_string(datetime_str, fields, validate="full", scan=_scan_string_cached, utc=False):
+    """
+    Validate a single string and decode the requested components.
+
+    Parameters
+    ----------
+    datetime_str : str
+        The string to decode.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}, default "full"
+        Which checks to run before decoding.
+    scan : callable, default `_scan_string_cached`
+        The scanning function. The Python engine passes the uncached
+        `_scan_string` so that long Series do not flush the cache.
+    utc : bool, default False
+        Whether to convert the components to UTC when the string has a UTC
+        offset. Strings without one are taken to be in UTC already. The
+        whole date and time of day are then checked, and unless validation
+        is off, so is the year the conversion gives.
+
+    Returns
+    -------
+    dict of str to int
+        The requested components.
+
+    Raises
+    ------
+    ValueError
+        If the string is not in valid ISO 8601 format, or a checked
+        component is out of range.
+    """
+    if validate == "off" and not utc and all(field in _format.FIELD_OFFSETS for field in fields):
+        return {
+            field: int(datetime_str[slice(*_format.FIELD_OFFSETS[field])]) for field in fields
+        }
+    scanned = scan(datetime_str)
+    if scanned is None:
+        raise ValueError(f"The input string '{datetime_str}' is not in valid ISO 8601 format.")
+    components, date_ok, time_ok, offset = scanned
+    if validate == "full" and not (date_ok and time_ok):
+        checks_date = utc or any(field in _format.CHECKED_DATE_FIELDS for field in fields)
+        checks_time = utc or any(field in _format.TIME_FIELDS for field in fields)
+        if (checks_date and not date_ok) or (checks_time and not time_ok):
+            raise ValueError(
+                f"The input string '{datetime_str}' contains an out of range date or time component."
+            )
+    if utc and offset:
+        components = _to_utc(components, offset)
+        if validate != "off" and not _format.MIN_YEAR <= components[0] <= _format.MAX_YEAR:
+            raise ValueError(
+                f"The input string '{datetime_str}' contains an out of range date or time component."
+            )
+    derived_fields = [field for field in fields if field in _format.DERIVED_FIELDS]
+    if derived_fields:
+        derived = _format.calendar_fields(derived_fields, *components[:3])
+        return {
+            field: derived[field] if field in derived else components[_FIELD_INDEX[field]]
+            for field in fields
+        }
+    return {field: components[_FIELD_INDEX[field]] for field in fields}
+
+
+def _check_choice(value, choices, kind):
+    """
+    Check that an option takes one of its allowed values.
+
+    Parameters
+    ----------
+    value : object
+        The requested value.
+    choices : tuple
+        The allowed values.
+    kind : str
+        What the option selects, used in the error message.
+
+    Raises
+    ------
+    ValueError
+        If the value is not allowed.
+    """
+    if value not in choices:
+        raise ValueError(f"Unknown {kind} '{value}'. Valid {kind}s are: {', '.join(map(str, choices))}.")
+
+
+def _check_input(datetime_input, validate):
+    """
+    Validate extractor input as far as the validate mode asks.
+
+    The input type is checked even when validation is off.
+
+    Parameters
+    ----------
+    datetime_input : object
+        The input passed to an extractor.
+    validate : {"full", "fast", "off"}
+        The validate mode. Anything but "off" runs `validate_datetime`.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a string or a Pandas Series.
+    ValueError
+        If validation is on and the input is not in valid ISO 8601 format.
+    """
+    if validate != "off":
+        with _phase("validation"):
+            validate_datetime(datetime_input)
+    elif not (isinstance(datetime_input, str) or is_series(datetime_input)):
+        raise TypeError(_TYPE_ERROR_MESSAGE)
+
+
+def _blank_invalid_strings(values):
+    """
+    Replace the elements that cannot be encoded for the NumPy engine.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The Series elements.
+
+    Returns
+    -------
+    numpy.ndarray
+        A copy of `values` in which non-strings and non-ASCII strings, none of
+        which can be valid, are replaced by empty strings.
+    """
+    blanked = values.astype(object)
+    for position, value in enumerate(blanked):
+        if not (isinstance(value, (str, bytes)) and value.isascii()):
+            blanked[position] = ""
+    return blanked
+
+
+def _scan_values(values, fields, validate, n_jobs, masked, utc=False, shared_dates=False):
+    """
+    Scan strings with the NumPy engine, in a process pool if worthwhile.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The strings to scan, or a two dimensional byte buffer accepted by
+        `_engine.split`.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}
+        Which checks to run.
+    n_jobs : int or None
+        The requested number of processes.
+    masked : bool
+        Whether to run `_engine.scan_masked` instead of `_engine.scan`.
+    utc : bool, default False
+        Whether to convert the components to UTC.
+    shared_dates : bool, default False
+        Whether to work on each date once per run of rows sharing it.
+
+    Returns
+    -------
+    tuple
+        The result of `_engine.scan` or `_engine.scan_masked`.
+    """
+    n_jobs = _parallel.effective_jobs(n_jobs, len(values))
+    if n_jobs > 1:
+        with _phase("parsing"):
+            return _parallel.scan(values, fields, validate, n_jobs, masked, utc, shared_dates)
+    with _phase("parsing"):
+        buffer = values if values.ndim == 2 else _engine.to_buffer(values, validate != "off")
+    if masked:
+        return _engine.scan_masked(buffer, fields, validate, utc, shared_dates)
+    return _engine.scan(buffer, fields, validate, utc, shared_dates)
+
+
+def _decode_series(datetime_series, fields, validate="full", n_jobs=None, deduplicate=False,
+                   errors="raise", utc=False):
+    """
+    Validate a Series and decode components with the NumPy engine.
+
+    The strings are copied once into a fixed-width byte buffer; separators,
+    digits and component ranges are all checked on that buffer, so the
+    Series does not also need to go through `validate_datetime`.
+
+    A categorical Series, or any Series when `deduplicate` is set, is
+    reduced to its distinct strings first. Only those are validated and
+    decoded, and the results are broadcast back through the codes. With
+    ``deduplicate="sorted"``, the dates of the rows are instead handled once
+    per run of consecutive rows sharing them.
+
+    Parameters
+    ----------
+    datetime_series : pandas.Series
+        The Series to validate and decode.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}, default "full"
+        Which checks to run before decoding.
+    n_jobs : int or None, default None
+        The number of processes to spread the work over, as accepted by
+        `_parallel.effective_jobs`.
+    deduplicate : bool or "sorted", default False
+        Whether to factorize a non-categorical Series before decoding, or
+        "sorted" to share the work on each date between consecutive rows.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        "raise" raises on the first failed check. Otherwise invalid rows,
+        non-strings and missing values included, are flagged instead.
+    utc : bool, default False
+        Whether to convert the components of rows with a UTC offset to UTC.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray
+        The requested components as int64 arrays. Values in invalid rows
+        are meaningless.
+    valid : numpy.ndarray or None
+        Boolean mask, True where a row passed the checks. None when
+        `errors` is "raise", as every row is then valid.
+
+    Raises
+    ------
+    ValueError
+        If `errors` is "raise" and an element is not a string, is not in
+        valid ISO 8601 format, or has an out of range checked component.
+    """
+    with _phase("validation"):
+        mixed = validate != "off" and not _is_string_series(datetime_series)
+    if mixed and errors == "raise":
+        raise ValueError("All elements of the Pandas Series must be strings.")
+    codes = None
+    if isinstance(datetime_series.dtype, pd.CategoricalDtype):
+        # Unused categories are dropped so that they cannot fail validation.
+        categorical = datetime_series.cat.remove_unused_categories()
+        codes = categorical.cat.codes.to_numpy()
+        values = categorical.cat.categories.to_numpy()
+    elif deduplicate and deduplicate != _SORTED:
+        codes, values = pd.factorize(datetime_series.to_numpy())
+    else:
+        values = datetime_series.to_numpy()
+    if mixed:
+        values = _blank_invalid_strings(values)
+    return _decode_values(
+        values, codes, fields, validate, n_jobs, errors, "Pandas Series", utc,
+        deduplicate == _SORTED,
+    )
+
+
+def _decode_array(values, fields, validate="full", n_jobs=None, deduplicate=False,
+                  errors="raise", utc=False):
+    """
+    Validate a NumPy array and decode components with the NumPy engine.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        A one dimensional array of strings, as returned by `_as_array`.
+    fields, validate, n_jobs, deduplicate, errors, utc
+        As for `_decode_series`. Deduplication uses `numpy.unique`.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray
+        The requested components as int64 arrays.
+    valid : numpy.ndarray or None
+        As for `_decode_series`.
+
+    Raises
+    ------
+    ValueError
+        If `errors` is "raise" and an element is not a string, is not in
+        valid ISO 8601 format, or has an out of range checked component.
+    """
+    mixed = validate != "off" and not _is_string_array(values)
+    if mixed:
+        if errors == "raise":
+            raise ValueError("All elements of the array must be strings.")
+        values = _blank_invalid_strings(values)
+    codes = None
+    if deduplicate and deduplicate != _SORTED:
+        values, codes = np.unique(values, return_inverse=True)
+        codes = codes.reshape(-1)
+    return _decode_values(
+        values, codes, fields, validate, n_jobs, errors, "array", utc, deduplicate == _SORTED
+    )
+
+
+def _is_arrow_input(datetime_input):
+    """Return whether the input is a pyarrow Array, ChunkedArray or Polars Series."""
+    return is_arrow(datetime_input) or is_polars_series(datetime_input)
+
+
+def _decode_arrow(datetime_input, fields, validate="full", n_jobs=None, deduplicate=False,
+                  errors="raise", utc=False):
+    """
+    Validate Arrow strings and decode components with the NumPy engine.
+
+    The engine runs on the data buffer of the Arrow string array, which is
+    viewed without a copy when every string is 19 bytes long. Dictionary
+    arrays, such as Categorical Polars Series, are decoded once per
+    dictionary entry.
+
+    Parameters
+    ----------
+    datetime_input : pyarrow.Array, pyarrow.ChunkedArray or polars.Series
+        The strings to decode. Chunks are combined first.
+    fields, validate, n_jobs, deduplicate, errors, utc
+        As for `_decode_series`. Deduplication dictionary-encodes the array.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray
+        The requested components as int64 arrays.
+    valid : numpy.ndarray or None
+        As for `_decode_series`. Null elements are never valid.
+
+    Raises
+    ------
+    ValueError
+        If `errors` is "raise" and an element is null or not a string, is
+        not in valid ISO 8601 format, or has an out of range checked component.
+    """
+    pyarrow = _import_pyarrow()
+    if is_polars_series(datetime_input):
+        container = "Polars Series"
+        array = datetime_input.to_arrow()
+    else:
+        container = "Arrow array"
+        array = datetime_input
+    if isinstance(array, pyarrow.ChunkedArray):
+        array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+
+    indices = None
+    if pyarrow.types.is_dictionary(array.type):
+        indices, array = array.indices, array.dictionary
+    elif deduplicate and deduplicate != _SORTED and _arrow.is_string_type(array.type):
+        encoded = array.dictionary_encode()
+        indices, array = encoded.indices, encoded.dictionary
+    codes = None
+    if indices is not None:
+        codes = indices.fill_null(0).to_numpy().astype(np.intp)
+        if indices.null_count:
+            codes[indices.is_null().to_numpy(zero_copy_only=False)] = -1
+
+    strings = _arrow.is_string_type(array.type)
+    missing = (
+        (codes is not None and bool((codes < 0).any())) or array.null_count > 0
+    )
+    if validate != "off" and errors == "raise" and (missing or not strings):
+        raise ValueError(f"All elements of the {container} must be strings.")
+    if strings:
+        with _phase("parsing"):
+            buffer = _arrow.to_buffer(array)
+    else:
+        # Nothing can be decoded, so every element fails the format check.
+        buffer = np.zeros((len(array), _engine.BUFFER_WIDTH), dtype=np.uint8)
+    components, valid = _decode_values(
+        buffer, codes, fields, validate, n_jobs, errors, container, utc, deduplicate == _SORTED
+    )
+    if valid is not None and array.null_count:
+        nulls = array.is_null().to_numpy(zero_copy_only=False)
+        valid &= ~(nulls if codes is None else nulls[codes])
+    return components, valid
+
+
+def _decode_values(values, codes, fields, validate, n_jobs, errors, container, utc=False,
+                   shared_dates=False):
+    """
+    Scan the strings of a Series or array and apply the errors mode.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The strings to scan, or the distinct strings if `codes` is given.
+    codes : numpy.ndarray or None
+        Position in `values` of each element of the input, with -1 for
+        missing values, or None if `values` holds every element.
+    fields, validate, n_jobs, errors
+        As for `_decode_series`.
+    container : str
+        What the input was, as named in error messages.
+    utc : bool, default False
+        As for `_decode_series`.
+    shared_dates : bool, default False
+        Whether to work on each date once per run of rows sharing it, as
+        ``deduplicate="sorted"`` does.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray
+        The requested components of every element, as int64 arrays.
+    valid : numpy.ndarray or None
+        As for `_decode_series`.
+
+    Raises
+    ------
+    ValueError
+        If `errors` is "raise" and an element fails a check.
+    """
+    masked = errors != "raise"
+    try:
+        scanned = _scan_values(values, fields, validate, n_jobs, masked, utc, shared_dates)
+    except UnicodeEncodeError:
+        if validate == "off" and not masked:
+            raise
+        # Only ASCII strings can be valid, so the others are blanked to fail the format check.
+        scanned = _scan_values(
+            _blank_invalid_strings(values), fields, validate, n_jobs, masked, utc, shared_dates
+        )
+
+    if masked:
+        components, valid = scanned
+        if codes is not None:
+            # Missing values have the code -1 and are never valid.
+            valid = valid[codes] & (codes >= 0)
+            components = {field: values[codes] for field, values in components.items()}
+        return components, valid
+
+    components, malformed, out_of_range = scanned
+    if codes is not None:
+        # Map positions among the distinct strings back to elements of the input.
+        malformed = np.flatnonzero(np.isin(codes, malformed)) if len(malformed) else malformed
+        out_of_range = (
+            np.flatnonzero(np.isin(codes, out_of_range)) if len(out_of_range) else out_of_range
+        )
+    if len(malformed):
+        _raise_invalid_positions(malformed, container=container)
+    if len(out_of_range):
+        _raise_invalid_positions(out_of_range, _OUT_OF_RANGE, container)
+    if codes is not None:
+        components = {field: values[codes] for field, values in components.items()}
+    return components, None
+
+
+def _import_pyarrow():
+    """
+    Import the optional pyarrow dependency.
+
+    Returns
+    -------
+    module
+        The pyarrow module.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "output='pyarrow' requires the optional dependency pyarrow, "
+            "which can be installed with: pip install pyarrow"
+        ) from None
+    return pyarrow
+
+
+def _component_dtype(field, output):
+    """
+    Resolve the dtype of an extracted component.
+
+    Parameters
+    ----------
+    field : str
+        The component being extracted.
+    output : str, numpy.dtype or None
+        None for int64, "compact" for the smallest integer dtype that holds
+        the component, "pyarrow" for the compact dtype backed by pyarrow, or
+        any integer dtype wide enough for the component.
+
+    Returns
+    -------
+    numpy.dtype or pandas.ArrowDtype
+        The dtype of the extracted Series.
+
+    Raises
+    ------
+    ValueError
+        If `output` is not an integer dtype able to hold the component.
+    """
+    if output is None:
+        return np.dtype("int64")
+    if isinstance(output, str) and output == "compact":
+        return np.dtype(_COMPACT_DTYPES[field])
+    if isinstance(output, str) and output == "pyarrow":
+        pyarrow = _import_pyarrow()
+        return pd.ArrowDtype(getattr(pyarrow, _COMPACT_DTYPES[field])())
+    try:
+        dtype = np.dtype(output)
+    except TypeError:
+        raise ValueError(
+            f"Unknown output '{output}'. Use None, 'compact', 'pyarrow' or an integer dtype."
+        ) from None
+    if dtype.kind not in "iu" or np.iinfo(dtype).max < 10 ** _format.FIELD_DIGITS[field] - 1:
+        raise ValueError(f"Output dtype '{dtype}' cannot hold the {field} component.")
+    return dtype
+
+
+def _check_time_output(output):
+    """
+    Check the representation requested from `extract_time`.
+
+    Parameters
+    ----------
+    output : str or None
+        The requested representation.
+
+    Raises
+    ------
+    ValueError
+        If the representation is unknown.
+    """
+    if output is not None:
+        _check_choice(output, _TIME_OUTPUTS, "output")
+    if output == "pyarrow":
+        _import_pyarrow()
+
+
+def _time_series(seconds, index, name, output, valid=None):
+    """
+    Build a compact `extract_time` result from seconds since midnight.
+
+    Parameters
+    ----------
+    seconds : numpy.ndarray
+        Seconds since midnight of each row.
+    index : pandas.Index
+        Index of the result.
+    name : hashable
+        Name of the result.
+    output : {"seconds", "timedelta", "pyarrow"}
+        The requested representation.
+    valid : numpy.ndarray, optional
+        Boolean mask of the valid rows. Other rows become missing values.
+
+    Returns
+    -------
+    pandas.Series
+        int32 seconds, timedelta64[s] durations, or pyarrow time32[s] values.
+        With `valid`, seconds are a nullable Int32 Series.
+    """
+    if output == "seconds":
+        values = _component_array(seconds, np.dtype(np.int32), valid)
+    elif output == "timedelta":
+        values = seconds.astype("timedelta64[s]")
+        if valid is not None:
+            values[~valid] = np.timedelta64("NaT")
+    else:
+        pyarrow = _import_pyarrow()
+        mask = None if valid is None else ~valid
+        values = pd.arrays.ArrowExtensionArray(
+            pyarrow.array(seconds.astype(np.int32), mask=mask).cast(pyarrow.time32("s"))
+        )
+    return pd.Series(values, index=index, name=name)
+
+
+def _component_array(values, dtype, valid=None):
+    """
+    Convert decoded int64 values to the dtype requested for a component.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Decoded int64 values.
+    dtype : numpy.dtype or pandas.ArrowDtype
+        A dtype returned by `_component_dtype`.
+    valid : numpy.ndarray, optional
+        Boolean mask of the valid rows. When given, the other rows become
+        <NA> and a NumPy dtype turns into its nullable counterpart (for
+        example int64 into Int64), whether or not any row is invalid.
+
+    Returns
+    -------
+    numpy.ndarray or pandas.api.extensions.ExtensionArray
+        The converted values.
+    """
+    if valid is None:
+        if isinstance(dtype, np.dtype):
+            return values.astype(dtype, copy=False)
+        return pd.array(values, dtype=dtype)
+    # Invalid rows hold arbitrary values, which could overflow a compact dtype.
+    values = np.where(valid, values, 0)
+    if isinstance(dtype, np.dtype):
+        return pd.arrays.IntegerArray(values.astype(dtype), ~valid)
+    pyarrow = _import_pyarrow()
+    return pd.arrays.ArrowExtensionArray(
+        pyarrow.array(values, mask=~valid).cast(dtype.pyarrow_dtype)
+    )
+
+
+def _array_dtype(field, output):
+    """
+    Resolve the type of a component extracted from a NumPy array.
+
+    Parameters
+    ----------
+    field : str
+        The component being extracted.
+    output : str, numpy.dtype or None
+        As for `_component_dtype`.
+
+    Returns
+    -------
+    numpy.dtype or pyarrow.DataType
+        The NumPy dtype of the result, or its pyarrow type for
+        output="pyarrow", which needs no pandas dtype.
+    """
+    if isinstance(output, str) and output == "pyarrow":
+        return getattr(_import_pyarrow(), _COMPACT_DTYPES[field])()
+    return _component_dtype(field, output)
+
+
+def _array_values(values, dtype, valid=None):
+    """
+    Convert decoded int64 values to the type requested for array input.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Decoded int64 values.
+    dtype : numpy.dtype or pyarrow.DataType
+        A type returned by `_array_dtype`.
+    valid : numpy.ndarray, optional
+        Boolean mask of the valid rows. When given, the other rows are
+        masked out of a numpy.ma.MaskedArray, or null in a pyarrow array.
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ma.MaskedArray or pyarrow.Array
+        The converted values.
+    """
+    if valid is not None:
+        # Invalid rows hold arbitrary values, which could overflow a compact dtype.
+        values = np.where(valid, values, 0)
+    if isinstance(dtype, np.dtype):
+        if valid is None:
+            return values.astype(dtype, copy=False)
+        return np.ma.MaskedArray(values.astype(dtype), mask=~valid)
+    pyarrow = _import_pyarrow()
+    return pyarrow.array(values, mask=None if valid is None else ~valid).cast(dtype)
+
+
+def _arrow_type(field, output):
+    """
+    Resolve the Arrow type of a component extracted from Arrow input.
+
+    Parameters
+    ----------
+    field : str
+        The component being extracted.
+    output : str, numpy.dtype or None
+        As for `_component_dtype`. "compact" and "pyarrow" both give the
+        compact type.
+
+    Returns
+    -------
+    pyarrow.DataType
+        The type of the result.
+    """
+    pyarrow = _import_pyarrow()
+    if isinstance(output, str) and output in ("compact", "pyarrow"):
+        return getattr(pyarrow, _COMPACT_DTYPES[field])()
+    return pyarrow.from_numpy_dtype(_component_dtype(field, output))
+
+
+def _arrow_result(result, datetime_input):
+    """
+    Return an Arrow result in the container type of the Arrow input.
+
+    Parameters
+    ----------
+    result : pyarrow.Array or dict of str to pyarrow.Array
+        One result array, or one array per component.
+    datetime_input : pyarrow.Array, pyarrow.ChunkedArray or polars.Series
+        The input.
+
+    Returns
+    -------
+    pyarrow.Array, pyarrow.ChunkedArray, pyarrow.Table, polars.Series or polars.DataFrame
+        The result as an array for Array input, split into chunks of the
+        same lengths (zero-copy slices) for ChunkedArray input, or converted
+        to a Series named like a Polars input. A dict of arrays becomes a
+        Table, or a Polars DataFrame.
+    """
+    pyarrow = _import_pyarrow()
+
+    def rechunk(array):
+        if not isinstance(datetime_input, pyarrow.ChunkedArray):
+            return array
+        chunks, start = [], 0
+        for chunk in datetime_input.chunks:
+            chunks.append(array.slice(start, len(chunk)))
+            start += len(chunk)
+        return pyarrow.chunked_array(chunks, type=array.type)
+
+    if isinstance(result, dict):
+        table = pyarrow.table({field: rechunk(array) for field, array in result.items()})
+        return pl.from_arrow(table) if is_polars_series(datetime_input) else table
+    if is_polars_series(datetime_input):
+        return pl.from_arrow(result).alias(datetime_input.name)
+    return rechunk(result)
+
+
+def _fit_time_of_day(hours, minutes, seconds, output, valid, container):
+    """
+    Check that decoded times of day fit in the values of an `extract_time` output.
+
+    Times of day are only range checked with validate="full", so an hour
+    of 24 or a 60th second can get here. They are kept as seconds since
+    midnight, but fit in no datetime.time or time32 value.
+
+    Parameters
+    ----------
+    hours, minutes, seconds : numpy.ndarray
+        Decoded components.
+    output : {None, "time", "seconds", "timedelta", "pyarrow"}
+        The requested representation.
+    valid : numpy.ndarray or None
+        Boolean mask of the valid rows, or None if every row is valid.
+    container : str
+        What the input was, as named in error messages.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        `valid`, also excluding the times of day that do not fit.
+
+    Raises
+    ------
+    ValueError
+        If `valid` is None and a time of day does not fit.
+    """
+    if output not in _TIME_VALUE_OUTPUTS:
+        return valid
+    fits = (hours <= 23) & (minutes <= 59) & (seconds <= 59)
+    if valid is None:
+        if not fits.all():
+            _raise_invalid_positions(np.flatnonzero(~fits), _OUT_OF_RANGE, container)
+        return None
+    return valid & fits
+
+
+def _time_objects(hours, minutes, seconds, microseconds, valid, missing):
+    """
+    Build datetime.time objects from decoded components.
+
+    Parameters
+    ----------
+    hours, minutes, seconds, microseconds : numpy.ndarray
+        Decoded components, fitting in a datetime.time in the valid rows.
+    valid : numpy.ndarray or None
+        Boolean mask of the valid rows, or None if every row is valid.
+    missing : object
+        The value of invalid rows.
+
+    Returns
+    -------
+    list
+        One datetime.time object, or `missing`, per row.
+    """
+    parts = (hours.tolist(), minutes.tolist(), seconds.tolist(), microseconds.tolist())
+    if valid is None:
+        return [time(*row) for row in zip(*parts)]
+    return [time(*row) if ok else missing for *row, ok in zip(*parts, valid.tolist())]
+
+
+def _string_time(datetime_str, parts):
+    """
+    Build the datetime.time of a decoded string.
+
+    Raises
+    ------
+    ValueError
+        If the time of day, which may not have been range checked, does not
+        exist.
+    """
+    try:
+        return time(*parts.values())
+    except ValueError:
+        raise ValueError(
+            f"The input string '{datetime_str}' contains an out of range date or time component."
+        ) from None
+
+
+def _time_array(seconds, output, valid=None):
+    """
+    Build a compact `extract_time` result for array input.
+
+    Parameters
+    ----------
+    seconds : numpy.ndarray
+        Seconds since midnight of each row.
+    output : {"seconds", "timedelta", "pyarrow"}
+        The requested representation.
+    valid : numpy.ndarray, optional
+        Boolean mask of the valid rows. Other rows are masked, NaT or null.
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ma.MaskedArray or pyarrow.Array
+        int32 seconds, timedelta64[s] durations, or pyarrow time32[s] values.
+    """
+    if output == "seconds":
+        return _array_values(seconds, np.dtype(np.int32), valid)
+    if output == "timedelta":
+        values = seconds.astype("timedelta64[s]")
+        if valid is not None:
+            values[~valid] = np.timedelta64("NaT")
+        return values
+    pyarrow = _import_pyarrow()
+    mask = None if valid is None else ~valid
+    return pyarrow.array(seconds.astype(np.int32), mask=mask).cast(pyarrow.time32("s"))
+
+
+def _time_arrow(seconds, output, valid=None):
+    """
+    Build an `extract_time` result for Arrow input.
+
+    Parameters
+    ----------
+    seconds : numpy.ndarray
+        Seconds since midnight of each row.
+    output : {None, "time", "seconds", "timedelta", "pyarrow"}
+        The requested representation.
+    valid : numpy.ndarray, optional
+        Boolean mask of the valid rows. Other rows are null.
+
+    Returns
+    -------
+    pyarrow.Array
+        time32[s] values by default and for "time" and "pyarrow", int32
+        seconds, or duration[s] values for "timedelta".
+    """
+    pyarrow = _import_pyarrow()
+    if output == "seconds":
+        return _array_values(seconds, pyarrow.int32(), valid)
+    if output == "timedelta":
+        return _array_values(seconds, pyarrow.duration("s"), valid)
+    return _time_array(seconds, "pyarrow", valid)
+
+
+def _masked_result(result, valid, datetime_input, errors):
+    """
+    Attach the validity mask to a result when `errors` is "mask".
+
+    Parameters
+    ----------
+    result : object
+        The extracted values.
+    valid : numpy.ndarray
+        Boolean mask of the valid rows.
+    datetime_input : pandas.Series, numpy.ndarray or Arrow input
+        The input. A Series passes its index and name on to the mask.
+    errors : {"coerce", "mask"}
+        The errors mode.
+
+    Returns
+    -------
+    object or tuple
+        `result` alone, or ``(result, mask)`` when `errors` is "mask". The
+        mask is a boolean Series for Series input, a boolean Arrow array or
+        Polars Series for Arrow input, and a boolean array otherwise.
+    """
+    _count_invalid_mask(valid)
+    if errors != "mask":
+        return result
+    if is_series(datetime_input):
+        valid = pd.Series(valid, index=datetime_input.index, name=datetime_input.name)
+    elif _is_arrow_input(datetime_input):
+        valid = _arrow_result(_import_pyarrow().array(valid), datetime_input)
+    return result, valid
+
+
+def _extract_array_field(values, field, output, validate, n_jobs, deduplicate, errors, utc):
+    """
+    Extract one component of a NumPy array.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The strings, as returned by `_as_array`.
+    field : str
+        The component to extract.
+    output, validate, n_jobs, deduplicate, errors, utc
+        As for the extractors.
+
+    Returns
+    -------
+    numpy.ndarray or tuple
+        The component, and the validity mask when `errors` is "mask".
+    """
+    dtype = _array_dtype(field, output)
+    components, valid = _decode_array(
+        values, (field,), validate, n_jobs, deduplicate, errors, utc
+    )
+    return _masked_result(_array_values(components[field], dtype, valid), valid, values, errors)
+
+
+def _extract_arrow_field(datetime_input, field, output, validate, n_jobs, deduplicate, errors,
+                         utc):
+    """
+    Extract one component of Arrow input.
+
+    Parameters
+    ----------
+    datetime_input : pyarrow.Array, pyarrow.ChunkedArray or polars.Series
+        The strings.
+    field : str
+        The component to extract.
+    output, validate, n_jobs, deduplicate, errors, utc
+        As for the extractors.
+
+    Returns
+    -------
+    object or tuple
+        The component in the container type of the input, and the validity
+        mask when `errors` is "mask".
+    """
+    arrow_type = _arrow_type(field, output)
+    components, valid = _decode_arrow(
+        datetime_input, (field,), validate, n_jobs, deduplicate, errors, utc
+    )
+    result = _arrow_result(_array_values(components[field], arrow_type, valid), datetime_input)
+    return _masked_result(result, valid, datetime_input, errors)
+
+
+def _string_result(datetime_str, fields, validate, errors, convert, utc=False):
+    """
+    Decode a string for an extractor whose `errors` mode is not "raise".
+
+    Parameters
+    ----------
+    datetime_str : str
+        The string to decode.
+    fields : tuple of str
+        The requested components.
+    validate : {"full", "fast", "off"}
+        Which checks to run before decoding.
+    errors : {"coerce", "mask"}
+        The errors mode.
+    convert : callable
+        Turns the dict returned by `_decode_string` into the extractor's result.
+    utc : bool, default False
+        Whether to convert the components to UTC.
+
+    Returns
+    -------
+    object or tuple
+        The result, or None if the string is invalid. When `errors` is
+        "mask", a ``(result, is_valid)`` pair.
+    """
+    try:
+        result = convert(_decode_string(datetime_str, fields, validate, utc=utc))
+    except ValueError:
+        result = None
+        _count_invalid(1)
+    if errors == "mask":
+        return result, result is not None
+    return result
+
+
+def _parse_rows(datetime_series, parse, validate):
+    """
+    Parse a Series row by row for the Python engine without raising.
+
+    Parameters
+    ----------
+    datetime_series : pandas.Series
+        The Series to parse.
+    parse : callable
+        Parses one well formed string, raising ValueError if a component is
+        out of range.
+    validate : {"full", "fast", "off"}
+        Anything but "off" checks the format of each row first.
+
+    Returns
+    -------
+    parsed : list
+        The parsed value of each row, or None for invalid rows.
+    valid : numpy.ndarray
+        Boolean mask, True where a row was parsed.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a Pandas Series.
+    """
+    if not is_series(datetime_series):
+        raise TypeError(_TYPE_ERROR_MESSAGE)
+    values = datetime_series.tolist()
+    if validate == "off":
+        well_formed = [True] * len(values)
+    else:
+        with _phase("validation"):
+            well_formed = [
+                isinstance(value, str) and _scan_string(value) is not None
+                for value in values
+            ]
+    parsed = []
+    with _phase("parsing"):
+        for value, ok in zip(values, well_formed):
+            try:
+                parsed.append(parse(value) if ok else None)
+            except (TypeError, ValueError):
+                # Unvalidated rows can be anything when validation is off.
+                parsed.append(None)
+    return parsed, np.array([value is not None for value in parsed], dtype=bool)
+
+
+def _extract_series_field(datetime_series, field, dtype, validate, n_jobs, deduplicate, errors,
+                          utc):
+    """
+    Extract one component of a Series with the NumPy engine.
+
+    Parameters
+    ----------
+    datetime_series : pandas.Series
+        The Series to validate and decode.
+    field : str
+        The component to extract.
+    dtype : numpy.dtype or pandas.ArrowDtype
+        The dtype of the result, as returned by `_component_dtype`.
+    validate : {"full", "fast", "off"}
+        Which checks to run before decoding.
+    n_jobs : int or None
+        The number of processes to spread the work over.
+    deduplicate : bool or "sorted"
+        Whether to decode each distinct string only once, or to share the
+        work on each date between consecutive rows.
+    errors : {"raise", "coerce", "mask"}
+        How invalid rows are handled.
+    utc : bool
+        Whether to convert the components to UTC.
+
+    Returns
+    -------
+    pandas.Series or tuple
+        The component, with the index and name of the input, and the
+        validity mask when `errors` is "mask".
+    """
+    components, valid = _decode_series(
+        datetime_series, (field,), validate, n_jobs, deduplicate, errors, utc
+    )
+    result = pd.Series(
+        _component_array(components[field], dtype, valid),
+        index=datetime_series.index,
+        name=datetime_series.name,
+    )
+    return _masked_result(result, valid, datetime_series, errors)
+
+
+def _parse_series_field(datetime_series, parse, dtype, validate, errors):
+    """
+    Extract one component of a Series with the Python engine without raising.
+
+    Parameters
+    ----------
+    datetime_series : pandas.Series
+        The Series to parse.
+    parse : callable
+        Returns the component of one well formed string.
+    dtype : numpy.dtype or pandas.ArrowDtype
+        The dtype of the result, as returned by `_component_dtype`.
+    validate : {"full", "fast", "off"}
+        Which checks to run before parsing.
+    errors : {"coerce", "mask"}
+        The errors mode.
+
+    Returns
+    -------
+    pandas.Series or tuple
+        The nullable component, and the validity mask when `errors` is "mask".
+    """
+    parsed, valid = _parse_rows(datetime_series, parse, validate)
+    values = np.array([0 if value is None else value for value in parsed], dtype=np.int64)
+    result = pd.Series(
+        _component_array(values, dtype, valid),
+        index=datetime_series.index,
+        name=datetime_series.name,
+    )
+    return _masked_result(result, valid, datetime_series, errors)
+
 
+def _utc_parser(field, validate):
+    """
+    Build a Python engine parser that converts each string to UTC first.
+
+    Parameters
+    ----------
+    field : str
+        The component to extract.
+    validate : {"full", "fast", "off"}
+        Which checks to run on each string.
+
+    Returns
+    -------
+    callable
+        Returns the component of one string, after converting it to UTC.
+    """
+    def parse(datetime_str):
+        return _decode_string(datetime_str, (field,), validate, scan=_scan_string, utc=True)[field]
+    return parse
+
+
+@instrumented
 def validate_datetime(input_value):
     """
     Validates ISO 8601 datetime format compliance.
 
     Parameters
     ----------
-    input_value : str or pandas.Series
-        The input to validate. Can be either a single string or a Pandas Series containing strings.
+    input_value : str, pandas.Series, list, tuple, numpy.ndarray, pyarrow.Array, polars.Series or dask.dataframe.Series
+        The input to validate. Can be either a single string or a Pandas Series containing strings,
+        a list, tuple or one dimensional NumPy array of strings, Arrow or Polars strings, or a
+        Dask Series of strings.
 
     Returns
     -------
@@ -19,65 +1579,84 @@ def validate_datetime(input_value):
     Raises
     ------
     TypeError
-        If the input is not a string or a Pandas Series.
+        If the input is not a string, a Pandas Series, a sequence or an array.
     ValueError
         If the input string or Series elements don't match ISO 8601 format.
+        For a Series or array, the message lists the positions of the offending rows.
     ValueError
-        If the Series contains non-string elements.
+        If the Series or array contains non-string elements.
 
     Notes
     -----
-    Valid ISO 8601 format is: YYYY-MM-DDThh:mm:ss
+    Valid ISO 8601 format is: YYYY-MM-DDThh:mm:ss, optionally followed by
+    fractional seconds (a dot and 1 to 9 digits) and then by "Z" or a
+    +hh:mm or -hh:mm UTC offset, such as 2023-07-16T12:34:56.250+05:30.
 
     Any other format will raise a ValueError.
-    """
-    def is_iso8601_compliant(date_str):
-        """
-        Check if a single string is in ISO 8601 format.
-
-        Parameters
-        ----------
-        date_str : str
-            The string to check.
 
-        Returns
-        -------
-        bool
-            True if the string matches the ISO 8601 format, False otherwise.
-
-        Notes
-        -----
-        Valid ISO 8601 format is: YYYY-MM-DDThh:mm:ss
-        """
-        iso8601_regex = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$"
-        return bool(re.match(iso8601_regex, date_str))
-    
+    A Series is validated in a single vectorized pass over the byte buffer
+    of the NumPy engine, and string content is detected from its dtype
+    rather than element by element.
+    Sequences, arrays and Arrow or Polars input are checked on the byte
+    buffer of the NumPy engine without building pandas objects.
+    A Dask Series is computed: its partitions are checked in parallel by
+    the current scheduler, and the message lists the invalid positions of
+    all of them, counted from the start of the whole Series.
+    """
     if isinstance(input_value, str):
         # If input is a string, validate directly
-        if not is_iso8601_compliant(input_value):
+        if _scan_string_cached(input_value) is None:
             raise ValueError(f"The input string '{input_value}' is not in valid ISO 8601 format.")
-    elif isinstance(input_value, pd.Series):
-        # If input is a Series, validate each element
-        if not all(isinstance(item, str) for item in input_value):
-            raise ValueError("All elements of the Pandas Series must be strings.")
-        if not input_value.apply(is_iso8601_compliant).all():
-            raise ValueError("One or more elements in the Pandas Series are not in valid ISO 8601 format.")
+    elif _is_arrow_input(input_value):
+        # Arrow input is checked on its string buffer with the NumPy engine
+        _decode_arrow(input_value, (), validate="fast")
+    elif is_series(input_value):
+        # If input is a Series, validate all elements in one pass
+        _decode_series(input_value, (), validate="fast")
+    elif is_dask_series(input_value):
+        # Dask partitions are checked in parallel and their invalid rows gathered
+        _dask.validate(input_value)
     else:
-        # Raise error if input is neither string nor Series
-        raise TypeError("Input must be either a string or a Pandas Series of strings.")
+        values = _as_array(input_value)
+        if values is None:
+            # Raise error if input is neither string, Series nor array
+            raise TypeError(_TYPE_ERROR_MESSAGE)
+        # Arrays are checked on the fixed-width buffer of the NumPy engine
+        _decode_array(values, (), validate="fast")
 
-def extract_year(iso_date: str) -> int:
+@instrumented
+def extract_year(iso_date: str, engine="numpy", validate="full", output=None, n_jobs=None,
+                deduplicate=False, errors="raise", utc=False) -> int:
     """
     Extract the year from an ISO 8601 date string.
 
     This function accepts either an individual string, or
     a Pandas Series.
 
+    The options shared by every extractor are described in full in the
+    module docstring.
+
     Parameters
     ----------
-    iso_date : str or pandas.Series
+    iso_date : str, pandas.Series, list, tuple or numpy.ndarray
         A date string, or Pandas Series containing strings,
         in ISO 8601 format (YYYY-MM-DDThh:mm:ss).
+        Sequences, arrays, Arrow, Polars and Dask input are also accepted,
+        and fractional seconds and UTC offsets may follow the seconds.
+    engine : {"numpy", "python"}, default "numpy"
+        How a Pandas Series is processed.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly the input is checked.
+    output : {None, "compact", "pyarrow"} or integer dtype, default None
+        The dtype of a Pandas Series result; "compact" gives int16.
+    n_jobs : int, optional
+        The number of processes for a large Pandas Series, or -1 for one per CPU.
+    deduplicate : {False, True, "sorted"}, default False
+        Whether to decode each distinct string, or each date of sorted input, once.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid input is handled.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset to UTC first.
 
     Returns
     -------
@@ -85,6 +1664,17 @@ def extract_year(iso_date: str) -> int:
         The year as a four-digit integer.
     pandas.Series (if input was pandas.Series)
         A pandas.Series containing years as four-digit integers.
+    numpy.ndarray (if input was a sequence or array)
+        The components as integers, in the dtype selected by `output`, or
+        a pyarrow array for output="pyarrow". With errors="coerce" or
+        "mask", a numpy.ma.MaskedArray with the invalid rows masked.
+    pyarrow.Array, pyarrow.ChunkedArray or polars.Series (if input was Arrow or Polars)
+        The same values as Arrow data in the container type of the input,
+        with nulls for invalid rows under errors="coerce" or "mask".
+    dask.dataframe.Series (if input was a Dask Series)
+        The same values, computed partition by partition when asked for.
+    tuple (if errors is "mask")
+        The result and the validity mask (a bool for string input).
 
     Examples
     --------
@@ -118,34 +1708,97 @@ def extract_year(iso_date: str) -> int:
         int
             The year as a four-digit integer.
         """
-        return int(iso_date.split("-")[0])
+        return int(iso_date[:4])
+
+    _check_choice(engine, _ENGINES, "engine")
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
+    if isinstance(iso_date, str):
+        if errors == "raise":
+            return _decode_string(iso_date, ("year",), validate, utc=utc)["year"]
+        return _string_result(
+            iso_date, ("year",), validate, errors, lambda parts: parts["year"], utc
+        )
+    if is_dask_series(iso_date):
+        return _dask.map_extractor(extract_year, iso_date, errors, dict(
+            engine=engine, validate=validate, output=output, n_jobs=n_jobs, deduplicate=deduplicate,
+            utc=utc,
+        ))
+    values = _as_array(iso_date)
+    if values is not None:
+        return _extract_array_field(
+            values, "year", output, validate, n_jobs, deduplicate, errors, utc
+        )
+    if _is_arrow_input(iso_date):
+        return _extract_arrow_field(
+            iso_date, "year", output, validate, n_jobs, deduplicate, errors, utc
+        )
+    dtype = _component_dtype("year", output)
+    if engine == "numpy" and is_series(iso_date):
+        return _extract_series_field(
+            iso_date, "year", dtype, validate, n_jobs, deduplicate, errors, utc
+        )
+    parse = _utc_parser("year", validate) if utc else extract_year_from_string
+    if errors != "raise":
+        return _parse_series_field(iso_date, parse, dtype, validate, errors)
 
     # Validate the input
-    validate_datetime(iso_date)
+    _check_input(iso_date, validate)
 
-    # Handle string or Pandas Series input
-    if isinstance(iso_date, str):
-        return extract_year_from_string(iso_date)
-    else:
-        return iso_date.apply(extract_year_from_string)
+    with _phase("parsing"):
+        years = iso_date.apply(parse)
+    return years.astype(dtype)
 
-def extract_month(input_data) -> str:
+@instrumented
+def extract_month(input_data, engine="numpy", validate="full", output=None, n_jobs=None,
+                deduplicate=False, errors="raise", utc=False) -> int:
     """
     Extract the month from an ISO 8601 date string or a DataFrame column.
 
     This function accepts either an individual string, or a Pandas Series.
 
+    The options shared by every extractor are described in full in the
+    module docstring.
+
     Parameters
     ----------
-    input_data : str or pandas.Series
+    input_data : str, pandas.Series, list, tuple or numpy.ndarray
         A single ISO 8601 date string (YYYY-MM-DDThh:mm:ss) or a Pandas Series 
         containing a column with such date strings.
+        Sequences, arrays, Arrow, Polars and Dask input are also accepted,
+        and fractional seconds and UTC offsets may follow the seconds.
+    engine : {"numpy", "python"}, default "numpy"
+        How a Pandas Series is processed.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly the input is checked.
+    output : {None, "compact", "pyarrow"} or integer dtype, default None
+        The dtype of a Pandas Series result; "compact" gives int8.
+    n_jobs : int, optional
+        The number of processes for a large Pandas Series, or -1 for one per CPU.
+    deduplicate : {False, True, "sorted"}, default False
+        Whether to decode each distinct string, or each date of sorted input, once.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid input is handled.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset to UTC first.
 
     Returns
     -------
     int or pandas.Series
         If input is a string, returns the month as an integer (1-12).
         If input is a pandas.Series, returns a Pandas Series with the extracted months.
+    numpy.ndarray (if input was a sequence or array)
+        The components as integers, in the dtype selected by `output`, or
+        a pyarrow array for output="pyarrow". With errors="coerce" or
+        "mask", a numpy.ma.MaskedArray with the invalid rows masked.
+    pyarrow.Array, pyarrow.ChunkedArray or polars.Series (if input was Arrow or Polars)
+        The same values as Arrow data in the container type of the input,
+        with nulls for invalid rows under errors="coerce" or "mask".
+    dask.dataframe.Series (if input was a Dask Series)
+        The same values, computed partition by partition when asked for.
+    tuple (if errors is "mask")
+        The result and the validity mask (a bool for string input).
 
     Examples
     --------
@@ -161,17 +1814,48 @@ def extract_month(input_data) -> str:
     >>> df = pd.DataFrame(data)
     >>> months = extract_month(df["dates"])
     >>> print(months)
-    0    7.0
-    1    3.0
-    dtype: float64
+    0    7
+    1    3
+    Name: dates, dtype: int64
     """
+    _check_choice(engine, _ENGINES, "engine")
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
+    if isinstance(input_data, str):
+        if errors == "raise":
+            return _decode_string(input_data, ("month",), validate, utc=utc)["month"]
+        return _string_result(
+            input_data, ("month",), validate, errors, lambda parts: parts["month"], utc
+        )
+    if is_dask_series(input_data):
+        return _dask.map_extractor(extract_month, input_data, errors, dict(
+            engine=engine, validate=validate, output=output, n_jobs=n_jobs, deduplicate=deduplicate,
+            utc=utc,
+        ))
+    values = _as_array(input_data)
+    if values is not None:
+        return _extract_array_field(
+            values, "month", output, validate, n_jobs, deduplicate, errors, utc
+        )
+    if _is_arrow_input(input_data):
+        return _extract_arrow_field(
+            input_data, "month", output, validate, n_jobs, deduplicate, errors, utc
+        )
+    dtype = _component_dtype("month", output)
+    if engine == "numpy" and is_series(input_data):
+        return _extract_series_field(
+            input_data, "month", dtype, validate, n_jobs, deduplicate, errors, utc
+        )
+
     # Validate the datetime input
-    validate_datetime(input_data)
+    if errors == "raise":
+        _check_input(input_data, validate)
 
     # Define function to extract a single datetime string
     def extract_single_month(datetime_str):
         """
-        Given a valid ISO 8601 format string, return the time as a datetime
+        Given a valid ISO 8601 format string, return the month as an integer
 
         Parameters
         ----------
@@ -188,26 +1872,56 @@ def extract_month(input_data) -> str:
         >>> extract_single_month("2023-07-16T12:34:56")
         7
         """
-        time_obj = datetime.strptime(datetime_str.split('T')[0], "%Y-%m-%d")
+        if validate != "full":
+            return int(datetime_str[5:7])
 
-        return time_obj.month
+        # fromisoformat checks the month and day-of-month like strptime did,
+        # without going through the _strptime regex machinery.
+        date_obj = date.fromisoformat(datetime_str[:10])
 
-    if isinstance(input_data, str):
-        return extract_single_month(input_data)
-    else:
-        return input_data.apply(extract_single_month)
+        return date_obj.month
+
+    parse = _utc_parser("month", validate) if utc else extract_single_month
+    if errors != "raise":
+        return _parse_series_field(input_data, parse, dtype, validate, errors)
+    with _phase("parsing"):
+        months = input_data.apply(parse)
+    return months.astype(dtype)
 
-def extract_day(datetime_input):
+@instrumented
+def extract_day(datetime_input, engine="numpy", validate="fast", output=None, n_jobs=None,
+                deduplicate=False, errors="raise", utc=False):
     """
     Extract the day from an ISO 8601 date string.
 
     This function can handle both individual strings and Pandas Series.
 
+    The options shared by every extractor are described in full in the
+    module docstring.
+
     Parameters
     ----------
-    iso_date : str or pandas.Series
+    datetime_input : str, pandas.Series, list, tuple or numpy.ndarray
         A date string, or Pandas Series containing strings,
         in ISO 8601 format (YYYY-MM-DDThh:mm:ss).
+        Sequences, arrays, Arrow, Polars and Dask input are also accepted,
+        and fractional seconds and UTC offsets may follow the seconds.
+    engine : {"numpy", "python"}, default "numpy"
+        How a Pandas Series is processed.
+    validate : {"full", "fast", "off"}, default "fast"
+        How thoroughly the input is checked. Unlike the other extractors,
+        only the format is checked by default, so the day of "2023-02-30"
+        is returned as written; "full" also checks that the day exists.
+    output : {None, "compact", "pyarrow"} or integer dtype, default None
+        The dtype of a Pandas Series result; "compact" gives int8.
+    n_jobs : int, optional
+        The number of processes for a large Pandas Series, or -1 for one per CPU.
+    deduplicate : {False, True, "sorted"}, default False
+        Whether to decode each distinct string, or each date of sorted input, once.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid input is handled.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset to UTC first.
 
     Returns
     -------
@@ -216,6 +1930,17 @@ def extract_day(datetime_input):
         
     pandas.Series
         A pandas.Series containing day as two-digit integers if input was pandas.Series.
+    numpy.ndarray (if input was a sequence or array)
+        The components as integers, in the dtype selected by `output`, or
+        a pyarrow array for output="pyarrow". With errors="coerce" or
+        "mask", a numpy.ma.MaskedArray with the invalid rows masked.
+    pyarrow.Array, pyarrow.ChunkedArray or polars.Series (if input was Arrow or Polars)
+        The same values as Arrow data in the container type of the input,
+        with nulls for invalid rows under errors="coerce" or "mask".
+    dask.dataframe.Series (if input was a Dask Series)
+        The same values, computed partition by partition when asked for.
+    tuple (if errors is "mask")
+        The result and the validity mask (a bool for string input).
 
     Examples
     --------
@@ -233,35 +1958,109 @@ def extract_day(datetime_input):
     1    25
     Name: dates, dtype: int64
     """
-    validate_datetime(datetime_input)  # Validate fuction
-    
-    
+    _check_choice(engine, _ENGINES, "engine")
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
     if isinstance(datetime_input, str):
-        day = int(datetime_input[8:10])
-        return day
-    else:
-        datetime_input.apply(validate_datetime)  # Validate each date in the Series
-        days = datetime_input.apply(lambda x: int(x[8:10]))
-        return days
+        if errors == "raise":
+            return _decode_string(datetime_input, ("day",), validate, utc=utc)["day"]
+        return _string_result(
+            datetime_input, ("day",), validate, errors, lambda parts: parts["day"], utc
+        )
+    if is_dask_series(datetime_input):
+        return _dask.map_extractor(extract_day, datetime_input, errors, dict(
+            engine=engine, validate=validate, output=output, n_jobs=n_jobs, deduplicate=deduplicate,
+            utc=utc,
+        ))
+    values = _as_array(datetime_input)
+    if values is not None:
+        return _extract_array_field(
+            values, "day", output, validate, n_jobs, deduplicate, errors, utc
+        )
+    if _is_arrow_input(datetime_input):
+        return _extract_arrow_field(
+            datetime_input, "day", output, validate, n_jobs, deduplicate, errors, utc
+        )
+    dtype = _component_dtype("day", output)
+    if engine == "numpy" and is_series(datetime_input):
+        return _extract_series_field(
+            datetime_input, "day", dtype, validate, n_jobs, deduplicate, errors, utc
+        )
+
+    if errors == "raise":
+        _check_input(datetime_input, validate)  # Validate fuction
+
+    def extract_single_day(datetime_str):
+        # Given a valid ISO 8601 format string, return the day as an integer
+        if validate != "full":
+            return int(datetime_str[8:10])
+        # fromisoformat also checks that the day exists in its month
+        return date.fromisoformat(datetime_str[:10]).day
 
-def extract_time(datetime_input) -> str:
+    parse = _utc_parser("day", validate) if utc else extract_single_day
+    if errors != "raise":
+        return _parse_series_field(datetime_input, parse, dtype, validate, errors)
+    with _phase("parsing"):
+        days = datetime_input.apply(parse)
+    return days.astype(dtype)
+
+@instrumented
+def extract_time(datetime_input, engine="numpy", validate="full", output=None,
+                 n_jobs=None, deduplicate=False, errors="raise", utc=False) -> time:
     """
     Extract the time from an ISO 8601 datetime string or a Pandas Series of ISO 8601 datetime strings.
     
     This function accepts either an individual string, or a Pandas Series.
 
+    The options shared by every extractor are described in full in the
+    module docstring.
+
     Parameters
     ----------
-    datetime_input : str or pandas.Series
+    datetime_input : str, pandas.Series, list, tuple or numpy.ndarray
         A datetime string, or a Pandas Series containing datetime strings,
         in ISO 8601 format (YYYY-MM-DDThh:mm:ss).
+        Sequences, arrays, Arrow, Polars and Dask input are also accepted,
+        and fractional seconds and UTC offsets may follow the seconds.
+    engine : {"numpy", "python"}, default "numpy"
+        How a Pandas Series is processed.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly the input is checked.
+    output : {None, "time", "seconds", "timedelta", "pyarrow"}, default None
+        The representation of a Pandas Series result. None and "time" give
+        datetime.time objects, "seconds" int32 seconds since midnight,
+        "timedelta" timedelta64[s] durations since midnight, and "pyarrow"
+        pyarrow-backed time32[s] values. Fractional seconds are only kept
+        in datetime.time objects. Ignored for string input.
+    n_jobs : int, optional
+        The number of processes for a large Pandas Series, or -1 for one per CPU.
+    deduplicate : {False, True, "sorted"}, default False
+        Whether to decode each distinct string, or each date of sorted input, once.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid input is handled.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset to UTC first.
 
     Returns
     -------
     datetime.time (if input was string)
         The time as a datetime.time object.
     pandas.Series (if input was pandas.Series)
-        A pandas.Series containing rows of datetime.time objects.
+        A pandas.Series containing rows of datetime.time objects, or the
+        representation selected by `output`.
+    numpy.ndarray (if input was a sequence or array)
+        An object array of datetime.time objects (None for invalid rows),
+        or the representation selected by `output` as for a Series, with
+        seconds in a numpy.ma.MaskedArray and "pyarrow" as a pyarrow array.
+    pyarrow.Array, pyarrow.ChunkedArray or polars.Series (if input was Arrow or Polars)
+        time32[s] values in the container type of the input, or int32
+        seconds or duration[s] values for output="seconds" or "timedelta",
+        with nulls for invalid rows under errors="coerce" or "mask".
+    dask.dataframe.Series (if input was a Dask Series)
+        The same values, computed partition by partition when asked for.
+    tuple (if errors is "mask")
+        The result and the validity mask (a bool for string input).
 
     Examples
     --------
@@ -281,18 +2080,580 @@ def extract_time(datetime_input) -> str:
     1    08:15:30
     Name: dates, dtype: object
     """
+    _check_choice(engine, _ENGINES, "engine")
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
+    if isinstance(datetime_input, str):
+        if errors == "raise":
+            return _string_time(
+                datetime_input, _decode_string(datetime_input, _TIME_OF_DAY, validate, utc=utc)
+            )
+        return _string_result(
+            datetime_input, _TIME_OF_DAY, validate, errors, lambda parts: time(*parts.values()), utc
+        )
+    if is_dask_series(datetime_input):
+        return _dask.map_extractor(extract_time, datetime_input, errors, dict(
+            engine=engine, validate=validate, output=output, n_jobs=n_jobs, deduplicate=deduplicate,
+            utc=utc,
+        ))
+    _check_time_output(output)
+    values = _as_array(datetime_input)
+    if values is not None:
+        components, valid = _decode_array(
+            values, _TIME_OF_DAY, validate, n_jobs, deduplicate, errors, utc
+        )
+        hours, minutes, seconds = components["hour"], components["minute"], components["second"]
+        valid = _fit_time_of_day(hours, minutes, seconds, output, valid, "array")
+        if output not in (None, "time"):
+            result = _time_array(hours * 3600 + minutes * 60 + seconds, output, valid)
+        else:
+            times = _time_objects(hours, minutes, seconds, components["microsecond"], valid, None)
+            result = np.empty(len(times), dtype=object)
+            result[:] = times
+        return _masked_result(result, valid, values, errors)
+    if _is_arrow_input(datetime_input):
+        components, valid = _decode_arrow(
+            datetime_input, _format.TIME_FIELDS, validate, n_jobs, deduplicate, errors, utc
+        )
+        hours, minutes, seconds = components["hour"], components["minute"], components["second"]
+        container = "Polars Series" if is_polars_series(datetime_input) else "Arrow array"
+        valid = _fit_time_of_day(hours, minutes, seconds, output, valid, container)
+        result = _time_arrow(hours * 3600 + minutes * 60 + seconds, output, valid)
+        return _masked_result(_arrow_result(result, datetime_input), valid, datetime_input, errors)
+    if engine == "numpy" and is_series(datetime_input):
+        components, valid = _decode_series(
+            datetime_input, _TIME_OF_DAY, validate, n_jobs, deduplicate, errors, utc
+        )
+        hours, minutes, seconds = components["hour"], components["minute"], components["second"]
+        valid = _fit_time_of_day(hours, minutes, seconds, output, valid, "Pandas Series")
+        if output not in (None, "time"):
+            result = _time_series(
+                hours * 3600 + minutes * 60 + seconds,
+                datetime_input.index, datetime_input.name, output, valid,
+            )
+            return _masked_result(result, valid, datetime_input, errors)
+        times = _time_objects(hours, minutes, seconds, components["microsecond"], valid, pd.NA)
+        result = pd.Series(times, index=datetime_input.index, name=datetime_input.name, dtype=object)
+        return _masked_result(result, valid, datetime_input, errors)
+
     # Validate the datetime input
-    validate_datetime(datetime_input)
+    if errors == "raise":
+        _check_input(datetime_input, validate)
 
     # Define function to extract a single datetime string
     def extract_single_time(datetime_str):
         # Given a valid ISO 8601 format string, return the time as a datetime
-        time_string = datetime_str.split('T')[1]
-        time_obj = datetime.strptime(time_string, "%H:%M:%S").time()
+        if not utc and len(datetime_str) == _format.ISO8601_WIDTH:
+            # Without a fraction or an offset, fromisoformat reads and checks
+            # the time of day at a fraction of the cost of a full scan.
+            try:
+                return time.fromisoformat(datetime_str[11:])
+            except ValueError:
+                # The full scan below reports the row as the other paths do.
+                pass
+        return _string_time(datetime_str, _decode_string(
+            datetime_str, _TIME_OF_DAY, validate, scan=_scan_string, utc=utc
+        ))
+
+    if errors != "raise":
+        parsed, valid = _parse_rows(datetime_input, extract_single_time, validate)
+        if output in (None, "time"):
+            result = pd.Series(
+                [pd.NA if time_obj is None else time_obj for time_obj in parsed],
+                index=datetime_input.index, name=datetime_input.name, dtype=object,
+            )
+        else:
+            seconds = np.array(
+                [0 if time_obj is None else
+                 time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second
+                 for time_obj in parsed],
+                dtype=np.int64,
+            )
+            result = _time_series(seconds, datetime_input.index, datetime_input.name, output, valid)
+        return _masked_result(result, valid, datetime_input, errors)
+
+    with _phase("parsing"):
+        times = datetime_input.apply(extract_single_time)
+    if output in (None, "time"):
+        return times
+    seconds = np.fromiter(
+        (time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second for time_obj in times),
+        dtype=np.int64,
+        count=len(times),
+    )
+    return _time_series(seconds, datetime_input.index, datetime_input.name, output)
+
+
+@instrumented
+def extract_components(datetime_input, fields=None, engine="numpy", validate="full",
+                       output=None, n_jobs=None, deduplicate=False, errors="raise", utc=False):
+    """
+    Extract several components from ISO 8601 datetime strings at once.
+
+    The input is validated a single time and every requested component is
+    decoded in the same fixed-offset pass, which is much cheaper than calling
+    `extract_year`, `extract_month`, `extract_day` and `extract_time` in turn.
+
+    The options shared by every extractor are described in full in the
+    module docstring.
+
+    Parameters
+    ----------
+    datetime_input : str, pandas.Series, list, tuple or numpy.ndarray
+        A datetime string, or a Pandas Series containing datetime strings,
+        in ISO 8601 format (YYYY-MM-DDThh:mm:ss).
+        Sequences, arrays, Arrow, Polars and Dask input are also accepted,
+        and fractional seconds and UTC offsets may follow the seconds.
+    fields : list of str, optional
+        The components to extract, any of "year", "month", "day", "hour",
+        "minute", "second" and "microsecond", and the calendar features
+        "weekday" (Monday is 0), "iso_week" (ISO 8601 week number),
+        "day_of_year" (January 1st is 1) and "quarter", which are computed
+        from the date. Defaults to the six components of
+        YYYY-MM-DDThh:mm:ss, in that order.
+    engine : {"numpy", "python"}, default "numpy"
+        How a Pandas Series is processed.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly the input is checked.
+    output : {None, "compact", "pyarrow"} or integer dtype, default None
+        The dtype of a Pandas Series result, for every component.
+    n_jobs : int, optional
+        The number of processes for a large Pandas Series, or -1 for one per CPU.
+    deduplicate : {False, True, "sorted"}, default False
+        Whether to decode each distinct string, or each date of sorted input, once.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid input is handled.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset to UTC first.
+
+    Returns
+    -------
+    dict (if input was string)
+        A dictionary mapping each requested field to its integer value.
+    pandas.DataFrame (if input was pandas.Series)
+        A DataFrame with one integer column per requested field, sharing
+        the index of the input. Columns are int64 unless `output` says otherwise.
+    dict of numpy.ndarray (if input was a sequence or array)
+        One array per requested field, as returned by `extract_year`.
+    pyarrow.Table or polars.DataFrame (if input was Arrow or Polars)
+        One column per requested field, as returned by `extract_year`.
+    dask.dataframe.DataFrame (if input was a Dask Series)
+        The same columns, computed partition by partition when asked for.
+    tuple (if errors is "mask")
+        The result and the validity mask (a bool for string input).
+
+    Raises
+    ------
+    TypeError
+        If the input is not a string, a Pandas Series, a sequence or an array.
+    ValueError
+        If the input is not valid ISO 8601, if an unknown field is requested,
+        or if a requested component is out of range.
 
-        return time_obj
+    Notes
+    -----
+    Requesting the month, the day or a calendar feature checks that the
+    whole date exists, and requesting any time component checks that the
+    whole time of day is valid, matching the checks made by `extract_month`
+    and `extract_time`. With ``utc=True``, calendar features are those of
+    the UTC date.
+
+    Examples
+    --------
+    >>> extract_components("2023-07-16T12:34:56", fields=["year", "hour"])
+    {'year': 2023, 'hour': 12}
+    >>> extract_components("2023-07-16T12:34:56", fields=["weekday", "iso_week", "day_of_year"])
+    {'weekday': 6, 'iso_week': 28, 'day_of_year': 197}
+
+    Apply the function to a Pandas Series:
 
+    >>> import pandas as pd
+    >>> dates = pd.Series(["2023-07-16T12:34:56", "2024-03-25T08:15:30"])
+    >>> print(extract_components(dates, fields=["year", "month", "day"]))
+       year  month  day
+    0  2023      7   16
+    1  2024      3   25
+    """
+    fields = _resolve_fields(fields)
+    _check_choice(engine, _ENGINES, "engine")
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
     if isinstance(datetime_input, str):
-        return extract_single_time(datetime_input)
-    else:
-        return datetime_input.apply(extract_single_time)
\ No newline at end of file
+        if errors == "raise":
+            return _decode_string(datetime_input, fields, validate, utc=utc)
+        return _string_result(datetime_input, fields, validate, errors, lambda parts: parts, utc)
+    if is_dask_series(datetime_input):
+        return _dask.map_extractor(extract_components, datetime_input, errors, dict(
+            fields=fields, engine=engine, validate=validate, output=output, n_jobs=n_jobs,
+            deduplicate=deduplicate, utc=utc,
+        ))
+    values = _as_array(datetime_input)
+    if values is not None:
+        types = {field: _array_dtype(field, output) for field in fields}
+        components, valid = _decode_array(
+            values, fields, validate, n_jobs, deduplicate, errors, utc
+        )
+        result = {field: _array_values(components[field], types[field], valid) for field in fields}
+        return _masked_result(result, valid, values, errors)
+    if _is_arrow_input(datetime_input):
+        types = {field: _arrow_type(field, output) for field in fields}
+        components, valid = _decode_arrow(
+            datetime_input, fields, validate, n_jobs, deduplicate, errors, utc
+        )
+        result = {field: _array_values(components[field], types[field], valid) for field in fields}
+        return _masked_result(_arrow_result(result, datetime_input), valid, datetime_input, errors)
+    dtypes = {field: _component_dtype(field, output) for field in fields}
+    if engine == "numpy" and is_series(datetime_input):
+        components, valid = _decode_series(
+            datetime_input, fields, validate, n_jobs, deduplicate, errors, utc
+        )
+        result = pd.DataFrame(
+            {field: _component_array(components[field], dtypes[field], valid) for field in fields},
+            index=datetime_input.index,
+        )
+        return _masked_result(result, valid, datetime_input, errors)
+
+    if errors != "raise":
+        parsed, valid = _parse_rows(
+            datetime_input,
+            lambda value: tuple(
+                _decode_string(value, fields, validate, scan=_scan_string, utc=utc).values()
+            ),
+            validate,
+        )
+        values = np.array(
+            [(0,) * len(fields) if row is None else row for row in parsed], dtype=np.int64
+        ).reshape(len(parsed), len(fields))
+        result = pd.DataFrame(
+            {
+                field: _component_array(values[:, column], dtypes[field], valid)
+                for column, field in enumerate(fields)
+            },
+            index=datetime_input.index,
+        )
+        return _masked_result(result, valid, datetime_input, errors)
+
+    _check_input(datetime_input, validate)
+
+    with _phase("parsing"):
+        rows = [
+            tuple(_decode_string(value, fields, validate, scan=_scan_string, utc=utc).values())
+            for value in datetime_input
+        ]
+    components = pd.DataFrame(rows, columns=list(fields), index=datetime_input.index, dtype="int64")
+    return components.astype(dtypes)
+
+
+@instrumented
+def add_date_parts(df, columns, fields=None, prefix="{column}_", output="compact", validate="full",
+                   n_jobs=None, deduplicate=False, errors="raise", utc=False):
+    """
+    Add the components of ISO 8601 timestamp columns to a DataFrame in place.
+
+    Each column is validated and decoded a single time with the NumPy
+    engine, and one column per requested component is appended to `df`.
+    The existing columns are neither copied nor modified.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to extend.
+    columns : str or list of str
+        The columns holding datetime strings in ISO 8601 format
+        (YYYY-MM-DDThh:mm:ss).
+    fields : list of str, optional
+        The components to add for each column, any of the fields accepted
+        by `extract_components`. Defaults to the six components of
+        YYYY-MM-DDThh:mm:ss.
+    prefix : str, default "{column}_"
+        The prefix of the new column names, where "{column}" is replaced by
+        the name of the source column. For example, the year of a column
+        "created" is added as "created_year" by default.
+    output : {"compact", None, "pyarrow"} or integer dtype, default "compact"
+        The dtype of the new columns, as for `extract_components`. The
+        default gives int16 years and days of the year, int32 microseconds
+        and int8 for the other components.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly each column is checked, as for `extract_components`.
+    n_jobs : int, optional
+        The number of processes used to decode each column, or -1 for one
+        per CPU.
+    deduplicate : bool or "sorted", default False
+        Whether to decode each distinct string of a column only once, or
+        "sorted" to share the work on each date between consecutive rows,
+        as for `extract_components`.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        "raise" raises a ValueError and leaves `df` unchanged. "coerce" puts
+        <NA> in the new columns for invalid rows, and "mask" also adds a
+        boolean column named after the prefix (for example "created_valid"),
+        True where the row is valid.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset to UTC first, as for
+        `extract_components`.
+
+    Returns
+    -------
+    None
+        `df` is modified in place.
+
+    Raises
+    ------
+    TypeError
+        If `df` is not a Pandas DataFrame.
+    KeyError
+        If a column is not in `df`.
+    ValueError
+        If a column is not valid ISO 8601 and `errors` is "raise", if an
+        unknown field is requested, or if two new columns would have the
+        same name. The message names the offending column.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({"created": ["2023-07-16T12:34:56", "2024-03-25T08:15:30"]})
+    >>> add_date_parts(df, "created", fields=["year", "month"])
+    >>> print(df)
+                   created  created_year  created_month
+    0  2023-07-16T12:34:56          2023              7
+    1  2024-03-25T08:15:30          2024              3
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a Pandas DataFrame.")
+    fields = _resolve_fields(fields)
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
+    dtypes = {field: _component_dtype(field, output) for field in fields}
+    if isinstance(columns, str):
+        columns = [columns]
+
+    new_columns = {}
+    for column in columns:
+        series = df[column]
+        try:
+            components, valid = _decode_series(
+                series, fields, validate, n_jobs, deduplicate, errors, utc
+            )
+        except ValueError as error:
+            raise ValueError(f"Column '{column}': {error}") from None
+        _count_rows(len(series))
+        _count_invalid_mask(valid)
+        column_prefix = prefix.format(column=column)
+        for field in fields:
+            new_columns[f"{column_prefix}{field}"] = _component_array(
+                components[field], dtypes[field], valid
+            )
+        if errors == "mask":
+            new_columns[f"{column_prefix}valid"] = valid
+    n_names = len(fields) + (errors == "mask")
+    if len(new_columns) < len(columns) * n_names:
+        raise ValueError(
+            "Several new columns would have the same name; "
+            "use '{column}' in the prefix to tell the source columns apart."
+        )
+
+    # Every column is decoded before any is added, so a failure leaves df unchanged.
+    for name, values in new_columns.items():
+        df[name] = values
+
+
+def _datetime_ticks(components, unit, valid, container):
+    """
+    Convert decoded components to datetime64 ticks.
+
+    Parameters
+    ----------
+    components : dict of str to numpy.ndarray
+        Every component, as decoded by the NumPy engine.
+    unit : {"s", "ms", "us", "ns"}
+        The unit of the ticks.
+    valid : numpy.ndarray or None
+        Boolean mask of the valid rows, or None if every row must be valid.
+    container : str
+        What the input was, as named in error messages.
+
+    Returns
+    -------
+    ticks : numpy.ndarray
+        The int64 ticks of each row, with the NaT value in invalid rows.
+    valid : numpy.ndarray or None
+        `valid`, also excluding the rows outside the range of the unit.
+
+    Raises
+    ------
+    ValueError
+        If `valid` is None and a row is outside the range of the unit.
+    """
+    days = _engine.days_from_civil(components["year"], components["month"], components["day"])
+    ticks, in_range = _format.to_ticks(
+        days, *(components[field] for field in _TIME_OF_DAY), unit,
+        components.get(_format.NANOSECOND_FIELD, 0),
+    )
+    if valid is None:
+        if not in_range.all():
+            _raise_invalid_positions(
+                np.flatnonzero(~in_range), f"are out of the range of datetime64[{unit}]", container
+            )
+        return ticks, None
+    valid = valid & in_range
+    return np.where(valid, ticks, np.iinfo(np.int64).min), valid
+
+
+def _string_datetime64(datetime_str, components, unit):
+    """Convert the components of a string to a datetime64 value."""
+    days = _format.days_from_civil(components["year"], components["month"], components["day"])
+    ticks, in_range = _format.to_ticks(
+        days, *(components[field] for field in _TIME_OF_DAY), unit,
+        components.get(_format.NANOSECOND_FIELD, 0),
+    )
+    if not in_range:
+        raise ValueError(
+            f"The input string '{datetime_str}' is out of the range of datetime64[{unit}]."
+        )
+    return np.datetime64(ticks, unit)
+
+
+@instrumented
+def to_datetime64(datetime_input, unit="ns", validate="full", n_jobs=None, deduplicate=False,
+                  errors="raise", utc=False):
+    """
+    Convert ISO 8601 datetime strings to datetime64 values.
+
+    Every component is decoded in the same fixed-offset pass as
+    `extract_components`, and the timestamps are computed from them with
+    integer arithmetic (days from 1970-01-01 in the proleptic Gregorian
+    calendar, then seconds and ticks), so they follow exactly the rules of
+    the extractors, whatever the input type.
+
+    Parameters
+    ----------
+    datetime_input : str, pandas.Series, list, tuple or numpy.ndarray
+        A datetime string, or a Pandas Series containing datetime strings,
+        in ISO 8601 format (YYYY-MM-DDThh:mm:ss).
+        Lists, tuples and one dimensional NumPy arrays (str_, bytes_ or
+        object) are also accepted and give NumPy arrays.
+        pyarrow Arrays and ChunkedArrays and Polars Series are decoded on
+        their Arrow string buffers and give the same container type.
+        A Dask Series gives a lazy Dask result; each partition is checked
+        and decoded by the task that computes it.
+        The seconds may be followed by fractional seconds (up to 9 digits)
+        and by "Z" or a +hh:mm or -hh:mm UTC offset.
+    unit : {"s", "ms", "us", "ns"}, default "ns"
+        The unit of the result. Fractional seconds are truncated to the
+        unit; "ns" keeps all nine digits.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly the input is checked. "full" checks the format and
+        that the date and time of day exist, "fast" checks the format only,
+        and "off" skips validation for already trusted data. Without range
+        checks, impossible dates and times give meaningless timestamps.
+    n_jobs : int, optional
+        The number of processes used to decode a large Series or array, or
+        -1 for one per CPU, as for `extract_components`.
+    deduplicate : bool or "sorted", default False
+        Whether to decode each distinct string only once, or "sorted" to
+        share the work on each date between consecutive rows, as for
+        `extract_components`.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How invalid input is handled. "raise" raises a ValueError. "coerce"
+        turns invalid rows, missing values, non-strings and timestamps
+        outside the range of `unit` into NaT (null for Arrow input, None
+        for string input). "mask" does the same and also returns the
+        validity mask, as ``(result, mask)``.
+    utc : bool, default False
+        Whether to convert datetimes with a UTC offset ("Z" or +hh:mm) to
+        UTC. Datetimes without an offset are taken to be in UTC already, and
+        Series and Arrow results are marked as UTC. By default the local
+        date and time are kept as written, ignoring the offset.
+
+    Returns
+    -------
+    numpy.datetime64 (if input was string)
+        The timestamp.
+    pandas.Series (if input was pandas.Series)
+        A datetime64[unit] Series sharing the index and name of the input,
+        or datetime64[unit, UTC] when `utc` is set.
+    numpy.ndarray (if input was a sequence or array)
+        A datetime64[unit] array.
+    pyarrow.Array, pyarrow.ChunkedArray or polars.Series (if input was Arrow or Polars)
+        timestamp[unit] values, with the UTC time zone when `utc` is set.
+    dask.dataframe.Series (if input was a Dask Series)
+        The same values, computed partition by partition when asked for.
+    tuple (if errors is "mask")
+        The result and the validity mask (a bool for string input).
+
+    Raises
+    ------
+    TypeError
+        If the input is not a string, a Pandas Series, a sequence or an array.
+    ValueError
+        If the input is not valid ISO 8601, if a date or time of day does not
+        exist, or if a timestamp is outside the range of `unit` (for "ns",
+        roughly the years 1678 to 2262).
+
+    Notes
+    -----
+    Most of the time spent on an object Series goes into copying its Python
+    strings to bytes, so ``pandas.to_datetime(format="ISO8601")`` is about
+    as fast or faster there. Arrow and Polars input is decoded without that
+    copy.
+
+    Examples
+    --------
+    >>> print(to_datetime64("2023-07-16T12:34:56.5"))
+    2023-07-16T12:34:56.500000000
+
+    >>> import pandas as pd
+    >>> dates = pd.Series(["2023-07-16T12:34:56", "2024-03-25T08:15:30+01:00"])
+    >>> print(to_datetime64(dates, unit="s", utc=True))
+    0   2023-07-16 12:34:56+00:00
+    1   2024-03-25 07:15:30+00:00
+    dtype: datetime64[s, UTC]
+    """
+    _check_choice(unit, _DATETIME_UNITS, "unit")
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    _check_choice(deduplicate, _DEDUPLICATE_MODES, "deduplicate mode")
+    fields = _format.DECODED_FIELDS
+    if unit == "ns":
+        fields += (_format.NANOSECOND_FIELD,)
+    if isinstance(datetime_input, str):
+        convert = functools.partial(_string_datetime64, datetime_input, unit=unit)
+        if errors == "raise":
+            return convert(_decode_string(datetime_input, fields, validate, utc=utc))
+        return _string_result(datetime_input, fields, validate, errors, convert, utc)
+    if is_dask_series(datetime_input):
+        return _dask.map_extractor(to_datetime64, datetime_input, errors, dict(
+            unit=unit, validate=validate, n_jobs=n_jobs, deduplicate=deduplicate, utc=utc,
+        ))
+    dtype = f"datetime64[{unit}]"
+    values = _as_array(datetime_input)
+    if values is not None:
+        components, valid = _decode_array(
+            values, fields, validate, n_jobs, deduplicate, errors, utc
+        )
+        ticks, valid = _datetime_ticks(components, unit, valid, "array")
+        return _masked_result(ticks.view(dtype), valid, values, errors)
+    if _is_arrow_input(datetime_input):
+        components, valid = _decode_arrow(
+            datetime_input, fields, validate, n_jobs, deduplicate, errors, utc
+        )
+        container = "Polars Series" if is_polars_series(datetime_input) else "Arrow array"
+        ticks, valid = _datetime_ticks(components, unit, valid, container)
+        pyarrow = _import_pyarrow()
+        result = pyarrow.array(
+            ticks, type=pyarrow.timestamp(unit, tz="UTC" if utc else None),
+            mask=None if valid is None else ~valid,
+        )
+        return _masked_result(_arrow_result(result, datetime_input), valid, datetime_input, errors)
+    if not is_series(datetime_input):
+        raise TypeError(_TYPE_ERROR_MESSAGE)
+    components, valid = _decode_series(
+        datetime_input, fields, validate, n_jobs, deduplicate, errors, utc
+    )
+    ticks, valid = _datetime_ticks(components, unit, valid, "Pandas Series")
+    result = pd.Series(ticks.view(dtype), index=datetime_input.index, name=datetime_input.name)
+    if utc:
+        result = result.dt.tz_localize("UTC")
+    return _masked_result(result, valid, datetime_input, errors)
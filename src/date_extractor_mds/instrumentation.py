@@ -0,0 +1,272 @@
+"""
+Opt-in instrumentation of the validators and extractors.
+
+Register a listener with `add_listener`, or collect records in a block with
+`recording`, and every call to `validate_datetime`, the `extract_*`
+functions, `to_datetime64` and `add_date_parts` produces a `CallRecord`:
+how many rows it processed, how many were invalid, and how long it spent
+validating, parsing and building its result. Records can then be exported
+to a metrics system.
+
+Without listeners, an instrumented call only checks that the list of
+listeners is empty: the hooks cost a fraction of a microsecond per call,
+which only shows on single strings.
+"""
+import functools
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from time import perf_counter
+
+from date_extractor_mds._lazy import is_arrow, is_dask_series, is_polars_series, is_series
+
+# What an instrumented call did.
+CallRecord = namedtuple(
+    "CallRecord",
+    ["function", "input_type", "rows", "invalid_rows", "seconds", "validation", "parsing",
+     "result", "error"],
+)
+CallRecord.__doc__ = """
+Measurements of one call to an instrumented function.
+
+Attributes
+----------
+function : str
+    The name of the function, such as "extract_year".
+input_type : str
+    "str", "Series", "array" (lists, tuples and NumPy arrays), "Arrow"
+    (pyarrow and Polars), "Dask", "DataFrame" or the name of another type.
+rows : int
+    The number of strings processed (1 for a single string, and the number
+    of rows times the number of columns for `add_date_parts`). Extracting
+    from a Dask Series only builds the lazy result and processes 0 rows;
+    its partitions produce records of their own as they are computed.
+invalid_rows : int
+    The number of rows found invalid. When the call raised, only the rows
+    listed in the error are counted.
+seconds : float
+    The duration of the call.
+validation, parsing, result : float
+    How `seconds` splits between checking the strings, decoding their
+    components, and everything else (mostly building the result). For a
+    single string, and when `n_jobs` spreads the work over processes,
+    validation is done in the same pass as the parsing and counted there
+    (or in validation for `validate_datetime`).
+error : str or None
+    The name of the exception raised by the call, if any.
+"""
+
+# Callbacks receiving a CallRecord after each instrumented call.
+_listeners = []
+
+# The measurements of the call in progress in each thread, if it is recorded.
+_state = threading.local()
+
+
+class _Measurement:
+    """The measurements of a call in progress."""
+
+    __slots__ = ("rows", "invalid_rows", "phases", "phase")
+
+    def __init__(self):
+        self.rows = None
+        self.invalid_rows = 0
+        self.phases = {"validation": 0.0, "parsing": 0.0}
+        self.phase = None
+
+
+class _Phase:
+    """Context manager adding the time spent in its block to a phase."""
+
+    __slots__ = ("measurement", "name", "start")
+
+    def __init__(self, measurement, name):
+        self.measurement = measurement
+        self.name = name
+
+    def __enter__(self):
+        self.measurement.phase = self.name
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.measurement.phases[self.name] += perf_counter() - self.start
+        self.measurement.phase = None
+
+
+class _NoPhase:
+    """Context manager doing nothing, used when no call is being recorded."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def add_listener(callback):
+    """
+    Start passing a `CallRecord` to `callback` after each instrumented call.
+
+    Parameters
+    ----------
+    callback : callable
+        Called with the `CallRecord` of each call, in the thread that made
+        the call, once the call has returned or raised. Exceptions raised
+        by the callback propagate to the caller.
+    """
+    _listeners.append(callback)
+
+
+def remove_listener(callback):
+    """
+    Stop passing records to a callback registered with `add_listener`.
+
+    Parameters
+    ----------
+    callback : callable
+        The callback to remove.
+
+    Raises
+    ------
+    ValueError
+        If the callback is not registered.
+    """
+    _listeners.remove(callback)
+
+
+@contextmanager
+def recording():
+    """
+    Collect the records of the instrumented calls made within a block.
+
+    Yields
+    ------
+    list of CallRecord
+        The records, appended as the calls complete.
+
+    Examples
+    --------
+    >>> from date_extractor_mds import extract_year
+    >>> with recording() as records:
+    ...     extract_year(["2023-07-16T12:34:56", "2024-03-25T08:15:30"])
+    array([2023, 2024])
+    >>> records[0].function, records[0].rows, records[0].invalid_rows
+    ('extract_year', 2, 0)
+    """
+    records = []
+    add_listener(records.append)
+    try:
+        yield records
+    finally:
+        remove_listener(records.append)
+
+
+def _input_type(value):
+    """Name the kind of input of a call for its record."""
+    if isinstance(value, str):
+        return "str"
+    if is_series(value):
+        return "Series"
+    if is_dask_series(value):
+        return "Dask"
+    if is_arrow(value) or is_polars_series(value):
+        return "Arrow"
+    if isinstance(value, (list, tuple)) or type(value).__name__ == "ndarray":
+        return "array"
+    return type(value).__name__
+
+
+def _input_rows(value):
+    """Count the strings passed to a call."""
+    if isinstance(value, str):
+        return 1
+    if is_dask_series(value):
+        # Taking the length of a Dask Series would compute it.
+        return 0
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+def instrumented(function):
+    """
+    Make a public function produce a `CallRecord` when listeners are registered.
+
+    Calls made while another instrumented call is in progress in the same
+    thread, such as the validation done by the Python engine, are counted
+    as part of the outer call.
+    """
+    name = function.__name__
+    listeners = _listeners
+    # The phase of calls on a single string, which are not timed in detail.
+    whole_call = "validation" if name == "validate_datetime" else "parsing"
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not listeners or getattr(_state, "measurement", None) is not None:
+            return function(*args, **kwargs)
+        measurement = _state.measurement = _Measurement()
+        error = None
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception as exception:
+            error = type(exception).__name__
+            raise
+        finally:
+            seconds = perf_counter() - start
+            _state.measurement = None
+            value = args[0] if args else next(iter(kwargs.values()), None)
+            phases = measurement.phases
+            if isinstance(value, str):
+                phases = {"validation": 0.0, "parsing": 0.0, whole_call: seconds}
+            validation, parsing = phases["validation"], phases["parsing"]
+            rows = _input_rows(value) if measurement.rows is None else measurement.rows
+            record = CallRecord(
+                name, _input_type(value), rows, measurement.invalid_rows, seconds,
+                validation, parsing, max(seconds - validation - parsing, 0.0), error,
+            )
+            for listener in list(listeners):
+                listener(record)
+
+    return wrapper
+
+
+def _phase(name):
+    """
+    Time a block as part of the "validation" or "parsing" phase of the call.
+
+    Blocks nested in another timed block count towards the outer phase.
+    Outside a recorded call, the returned context manager does nothing.
+    """
+    measurement = getattr(_state, "measurement", None)
+    if measurement is None or measurement.phase is not None:
+        return _NO_PHASE
+    return _Phase(measurement, name)
+
+
+def _count_rows(count):
+    """Add rows to the record of the call in progress, instead of counting its input."""
+    measurement = getattr(_state, "measurement", None)
+    if measurement is not None:
+        measurement.rows = (measurement.rows or 0) + count
+
+
+def _count_invalid(count):
+    """Add invalid rows to the record of the call in progress, if any."""
+    measurement = getattr(_state, "measurement", None)
+    if measurement is not None:
+        measurement.invalid_rows += int(count)
+
+
+def _count_invalid_mask(valid):
+    """Add the rows flagged in a validity mask (None if all are valid) to the call in progress."""
+    measurement = getattr(_state, "measurement", None)
+    if measurement is not None and valid is not None:
+        measurement.invalid_rows += int(valid.size - valid.sum())
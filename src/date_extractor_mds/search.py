@@ -0,0 +1,210 @@
+"""
+Search free text for embedded ISO 8601 timestamps.
+
+The extractors expect each string to be a timestamp and nothing else.
+`find_datetimes` instead locates the timestamps anywhere in a column of
+text, such as log messages or notes, and decodes them. The strings are
+joined into a single byte array, which the NumPy engine scans in one pass
+for the "T" between a date and a time; only the bytes around those
+separators are checked and decoded, with the same rules as the extractors.
+"""
+from date_extractor_mds import _format
+from date_extractor_mds._lazy import LazyModule, is_series
+from date_extractor_mds.date_extractor_mds import (
+    _as_array,
+    _check_choice,
+    _component_array,
+    _component_dtype,
+    _resolve_fields,
+)
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+_engine = LazyModule("date_extractor_mds._engine")
+
+# How thoroughly `find_datetimes` checks what it finds. The format is what
+# is searched for, so it is always checked.
+_FIND_VALIDATE_MODES = ("full", "fast")
+
+# Separator of the strings joined for the search, which no timestamp contains.
+_SEPARATOR = "\n"
+
+
+def _text_series(text):
+    """
+    Convert the input of `find_datetimes` to a Series of strings.
+
+    Parameters
+    ----------
+    text : pandas.Series, list, tuple or numpy.ndarray
+        The text to search.
+
+    Returns
+    -------
+    series : pandas.Series
+        The input, or a Series holding its elements.
+    strings : list of str
+        The elements, with missing values replaced by empty strings.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a Series, a sequence or an array.
+    ValueError
+        If an element is neither a string nor a missing value.
+    """
+    if is_series(text):
+        series = text
+    else:
+        values = _as_array(text)
+        if values is None:
+            raise TypeError(
+                "Input must be a Pandas Series, a list, a tuple or a NumPy array of strings."
+            )
+        series = pd.Series(values, dtype=object)
+    missing = series.isna().to_numpy()
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values[~missing], skipna=False) not in ("string", "empty"):
+        raise ValueError("All elements of the text must be strings or missing values.")
+    if missing.any():
+        values = np.where(missing, "", values)
+    return series, values.tolist()
+
+
+def _first_of_overlaps(starts, ends):
+    """
+    Keep the first of any overlapping matches.
+
+    Two timestamps can only overlap when fractional seconds look like the
+    year of a second timestamp, as in ``...:56.2023-07-16T...``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask of the matches to keep.
+    """
+    kept = np.ones(len(starts), dtype=bool)
+    if not (starts[1:] < ends[:-1]).any():
+        return kept
+    end = 0
+    for match, (start, stop) in enumerate(zip(starts.tolist(), ends.tolist())):
+        if start < end:
+            kept[match] = False
+        else:
+            end = stop
+    return kept
+
+
+def find_datetimes(text, fields=None, validate="full", output=None, utc=False):
+    """
+    Find and decode the ISO 8601 timestamps embedded in free text.
+
+    Unlike the extractors, which reject any string that is not exactly a
+    timestamp, this locates every timestamp within each string, such as
+    the one in "deployed at 2023-07-16T12:34:56 by ci", in a single
+    vectorized pass over the whole column.
+
+    Parameters
+    ----------
+    text : pandas.Series, list, tuple or numpy.ndarray
+        The strings to search. Missing values hold no timestamps.
+    fields : list of str, optional
+        The components to decode, as for `extract_components`. Defaults to
+        the six components of YYYY-MM-DDThh:mm:ss.
+    validate : {"full", "fast"}, default "full"
+        "full" only reports timestamps whose date and time of day exist,
+        whichever fields are requested, and "fast" every well formed one,
+        such as 2023-02-30T00:00:00.
+    output : {None, "compact", "pyarrow"} or integer dtype, default None
+        The dtype of the component columns, as for `extract_components`.
+    utc : bool, default False
+        Whether to convert timestamps with a UTC offset to UTC first, as for
+        `extract_components`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per timestamp found, in text order, indexed like the result
+        of `pandas.Series.str.extractall`: by the index of the string it was
+        found in and by its number within that string, in a "match" level.
+        The "start" and "end" columns give its position in the string, so
+        that ``string[start:end]`` is the timestamp, and are followed by one
+        column per requested component.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a Series, a sequence or an array.
+    ValueError
+        If an element is neither a string nor a missing value, if an
+        unknown field is requested, or if an option is invalid.
+
+    Notes
+    -----
+    A timestamp is a YYYY-MM-DDThh:mm:ss run of characters, followed by
+    fractional seconds and then by "Z" or a +hh:mm or -hh:mm UTC offset
+    when they are well formed. Runs preceded or followed by a digit, as in
+    "12023-07-16T12:34:56", are not timestamps. A sentence may end right
+    after one: in "at 2023-07-16T12:34:56.", the final dot is left out.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> notes = pd.Series([
+    ...     "deployed at 2023-07-16T12:34:56 by ci",
+    ...     "no timestamp here",
+    ...     "down from 2024-03-25T08:15:30Z to 2024-03-25T09:00:00Z",
+    ... ])
+    >>> print(find_datetimes(notes, fields=["day", "hour"]))  # doctest: +NORMALIZE_WHITESPACE
+             start  end  day  hour
+      match
+    0 0         12   31   16    12
+    2 0         10   30   25     8
+      1         34   54   25     9
+    """
+    fields = _resolve_fields(fields)
+    _check_choice(validate, _FIND_VALIDATE_MODES, "validate mode")
+    dtypes = {field: _component_dtype(field, output) for field in fields}
+    series, strings = _text_series(text)
+
+    joined = _SEPARATOR.join(strings)
+    char_lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    if joined.isascii():
+        encoded, byte_lengths = joined.encode("ascii"), char_lengths
+    else:
+        encoded = joined.encode("utf-8", "surrogatepass")
+        byte_lengths = np.fromiter(
+            (len(string.encode("utf-8", "surrogatepass")) for string in strings),
+            dtype=np.int64, count=len(strings),
+        )
+    row_starts = np.cumsum(byte_lengths + len(_SEPARATOR)) - byte_lengths - len(_SEPARATOR)
+
+    starts, buffer = _engine.find_stamps(np.frombuffer(encoded, dtype=np.uint8))
+    # Every component is decoded and checked, so that what counts as a
+    # timestamp does not depend on the requested fields.
+    scanned_fields = tuple(dict.fromkeys(_format.DECODED_FIELDS + fields))
+    components, valid = _engine.scan_masked(buffer, scanned_fields, validate, utc)
+    matches = np.flatnonzero(valid)
+    starts = starts[matches]
+    lengths = np.count_nonzero(buffer[matches], axis=1)
+    kept = _first_of_overlaps(starts, starts + lengths)
+    matches, starts, lengths = matches[kept], starts[kept], lengths[kept]
+
+    rows = np.searchsorted(row_starts, starts, side="right") - 1
+    offsets = starts - row_starts[rows]
+    # Strings with non-ASCII characters have byte offsets beyond their
+    # character offsets.
+    for match in np.flatnonzero((byte_lengths != char_lengths)[rows]):
+        row_start = row_starts[rows[match]]
+        offsets[match] = len(encoded[row_start:starts[match]].decode("utf-8", "surrogatepass"))
+
+    found_in = series.index.take(rows)
+    numbers = np.arange(len(rows)) - np.searchsorted(rows, rows)
+    index = pd.MultiIndex.from_arrays(
+        [found_in.get_level_values(level) for level in range(found_in.nlevels)] + [numbers],
+        names=list(series.index.names) + ["match"],
+    )
+    columns = {"start": offsets, "end": offsets + lengths}
+    for field in fields:
+        columns[field] = _component_array(components[field][matches], dtypes[field])
+    return pd.DataFrame(columns, index=index)
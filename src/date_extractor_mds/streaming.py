@@ -0,0 +1,587 @@
+"""
+Chunked extraction from files too large to hold in memory.
+
+`extract_from_file` reads one column of a CSV, Parquet, newline-delimited
+JSON or plain text file a chunk of rows at a time and runs each chunk
+through `extract_components`, yielding the components or writing them to
+another file. `extract_from_log` skips the parsing of a text format
+altogether: it memory-maps a log file and copies the timestamp that starts
+each line straight into the byte buffer of the NumPy engine, a block of
+lines at a time. Both check their options when called, before any of the
+file is read, even though the work itself is only done as the chunks are
+consumed.
+"""
+import contextlib
+import importlib
+import itertools
+import mmap
+import os
+
+from date_extractor_mds._lazy import LazyModule
+from date_extractor_mds.date_extractor_mds import (
+    _DEDUPLICATE_MODES,
+    _ENGINES,
+    _ERROR_MODES,
+    _OUT_OF_RANGE,
+    _VALIDATE_MODES,
+    _array_dtype,
+    _array_values,
+    _check_choice,
+    _component_dtype,
+    _import_pyarrow,
+    _masked_result,
+    _raise_invalid_positions,
+    _resolve_fields,
+    _scan_values,
+    extract_components,
+)
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+_engine = LazyModule("date_extractor_mds._engine")
+
+# File formats understood by `extract_from_file`, keyed by file extension.
+# "ndjson" files hold one JSON object per line, and "lines" files one
+# timestamp per line.
+_FILE_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".txt": "lines",
+}
+_FORMAT_NAMES = ("csv", "parquet", "ndjson", "lines")
+
+# Bytes of a log file mapped and scanned at a time by `extract_from_log`.
+_LOG_BLOCK_SIZE = 64 * 2 ** 20
+
+# Openers of the compressed files that pandas would otherwise decompress.
+_COMPRESSION_MODULES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+
+
+def _file_format(path, file_format):
+    """
+    Work out the format of a file from its name.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file path.
+    file_format : {"csv", "parquet", "ndjson", "lines"} or None
+        An explicit format, which takes precedence over the file name.
+
+    Returns
+    -------
+    str
+        One of "csv", "parquet", "ndjson" and "lines".
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown or cannot be inferred.
+    """
+    if file_format is None:
+        name = str(path).lower()
+        if name.endswith((".gz", ".bz2", ".zip", ".xz", ".zst")):
+            name = name.rsplit(".", 1)[0]
+        file_format = next(
+            (fmt for extension, fmt in _FILE_FORMATS.items() if name.endswith(extension)), None
+        )
+        if file_format is None:
+            raise ValueError(
+                f"Cannot infer the format of '{path}'. "
+                f"Pass file_format as one of: {', '.join(_FORMAT_NAMES)}."
+            )
+    if file_format not in _FORMAT_NAMES:
+        raise ValueError(
+            f"Unknown file format '{file_format}'. Valid file formats are: {', '.join(_FORMAT_NAMES)}."
+        )
+    return file_format
+
+
+def _open_text(path):
+    """Open a possibly compressed text file for reading, or pass an open stream through."""
+    if hasattr(path, "read"):
+        return contextlib.nullcontext(path)
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in _COMPRESSION_MODULES:
+        module = importlib.import_module(_COMPRESSION_MODULES[extension])
+        return module.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _read_lines(path, chunksize):
+    """
+    Read a file holding one timestamp per line in chunks.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or file-like
+        The file to read, or an open text stream such as `sys.stdin`.
+    chunksize : int
+        The number of lines per chunk.
+
+    Yields
+    ------
+    pandas.Series
+        Consecutive chunks of lines, without their line endings, indexed by
+        line number in the file.
+    """
+    start = 0
+    with _open_text(path) as stream:
+        while True:
+            lines = [line.rstrip("\r\n") for line in itertools.islice(stream, chunksize)]
+            if not lines:
+                return
+            yield pd.Series(lines, index=pd.RangeIndex(start, start + len(lines)), dtype=object)
+            start += len(lines)
+
+
+def _read_column(path, column, chunksize, file_format):
+    """
+    Read one column of a file in chunks.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or file-like
+        The file to read. Every format but Parquet can also be read from an
+        open stream, such as `sys.stdin`.
+    column : str
+        The column holding the ISO 8601 strings. Ignored for "lines" files.
+    chunksize : int
+        The number of rows per chunk.
+    file_format : {"csv", "parquet", "ndjson", "lines"}
+        The format of the file.
+
+    Yields
+    ------
+    pandas.Series
+        Consecutive chunks of the column, indexed by row number in the file.
+
+    Raises
+    ------
+    ValueError
+        If a Parquet file is given as a stream.
+    """
+    if file_format == "lines":
+        yield from _read_lines(path, chunksize)
+        return
+    if file_format == "csv":
+        reader = pd.read_csv(
+            path, usecols=[column], dtype={column: object}, keep_default_na=False, chunksize=chunksize
+        )
+        with reader:
+            for chunk in reader:
+                yield chunk[column]
+        return
+    if file_format == "ndjson":
+        reader = pd.read_json(
+            path, lines=True, chunksize=chunksize, dtype={column: object}, convert_dates=False
+        )
+        with reader:
+            for chunk in reader:
+                # Objects without the key are missing values, as in a CSV file.
+                if column in chunk:
+                    yield chunk[column]
+                else:
+                    yield pd.Series(None, index=chunk.index, dtype=object, name=column)
+        return
+
+    if hasattr(path, "read"):
+        raise ValueError("Parquet input must be a file, not a stream.")
+    pyarrow = _import_pyarrow()
+    import pyarrow.parquet
+
+    start = 0
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=[column]):
+        series = batch.column(0).to_pandas()
+        series.index = pd.RangeIndex(start, start + len(series))
+        series.name = column
+        start += len(series)
+        yield series
+
+
+def _check_extract_options(fields, extract_options):
+    """
+    Check the arguments `extract_from_file` passes on to `extract_components`.
+
+    Parameters
+    ----------
+    fields : list of str or None
+        The requested components.
+    extract_options : dict
+        The other keyword arguments for `extract_components`.
+
+    Raises
+    ------
+    TypeError
+        If an option is not an argument of `extract_components`.
+    ValueError
+        If a field or an option value is unknown, or `output` is a dtype
+        unable to hold a requested component.
+    """
+    # inspect takes longer to import than the package itself, so it is only
+    # imported by the callers that need it.
+    import inspect
+
+    bound = inspect.signature(extract_components).bind("", fields, **extract_options)
+    bound.apply_defaults()
+    options = bound.arguments
+    _check_choice(options["engine"], _ENGINES, "engine")
+    _check_choice(options["validate"], _VALIDATE_MODES, "validate mode")
+    _check_choice(options["errors"], _ERROR_MODES, "errors mode")
+    _check_choice(options["deduplicate"], _DEDUPLICATE_MODES, "deduplicate mode")
+    for field in _resolve_fields(fields):
+        _component_dtype(field, options["output"])
+
+
+def _iter_extracted(path, column, fields, chunksize, file_format, extract_options):
+    """
+    Extract components from each chunk of a file.
+
+    Parameters
+    ----------
+    path, column, fields, chunksize, file_format
+        As for `extract_from_file`.
+    extract_options : dict
+        Keyword arguments passed on to `extract_components`.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The components of consecutive chunks.
+
+    Raises
+    ------
+    ValueError
+        If a chunk contains invalid rows. The message gives the first row
+        of the chunk, so positions can be mapped back to the file.
+    """
+    for chunk in _read_column(path, column, chunksize, file_format):
+        try:
+            yield extract_components(chunk, fields, **extract_options)
+        except ValueError as error:
+            raise ValueError(f"In the chunk starting at row {chunk.index[0]}: {error}") from None
+
+
+def _write_extracted(chunks, output_path, file_format):
+    """
+    Write extracted chunks to a single file.
+
+    Parameters
+    ----------
+    chunks : iterable of pandas.DataFrame
+        The chunks to write, all with the same columns.
+    output_path : str, os.PathLike or file-like
+        The file to create, or an open stream such as `sys.stdout` for the
+        text formats.
+    file_format : {"csv", "ndjson", "parquet"}
+        The format of the file to create.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If `file_format` is "lines", which holds a single column, or if a
+        Parquet file is given as a stream.
+    """
+    rows = 0
+    if file_format == "lines":
+        raise ValueError("Components cannot be written to a plain text file; use csv, ndjson or parquet.")
+    if file_format in ("csv", "ndjson"):
+        stream = hasattr(output_path, "write")
+        for chunk in chunks:
+            first = rows == 0
+            # Streams get each chunk in a single write rather than one per row.
+            destination = None if stream else output_path
+            if file_format == "csv":
+                text = chunk.to_csv(destination, mode="w" if first else "a", header=first, index=False)
+            else:
+                text = chunk.to_json(destination, orient="records", lines=True, mode="w" if first else "a")
+            if stream:
+                output_path.write(text)
+            rows += len(chunk)
+        return rows
+
+    if hasattr(output_path, "write"):
+        raise ValueError("Parquet output must be a file, not a stream.")
+
+    pyarrow = _import_pyarrow()
+    import pyarrow.parquet
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def extract_from_file(path, column, fields=None, chunksize=100_000, output_path=None,
+                      file_format=None, output_format=None, **extract_options):
+    """
+    Extract components from an ISO 8601 column of a file in chunks.
+
+    The file is read `chunksize` rows at a time and each chunk goes through
+    `extract_components`, so peak memory depends on the chunk size rather
+    than on the size of the file.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or file-like
+        The CSV, Parquet, newline-delimited JSON or plain text file to read.
+        Compressed text files are supported, and every format but Parquet
+        can also be read from an open stream such as `sys.stdin`, given
+        with `file_format`.
+    column : str
+        The column holding datetime strings in ISO 8601 format
+        (YYYY-MM-DDThh:mm:ss), or the key holding them in JSON objects.
+        Ignored for plain text files, which hold one string per line.
+    fields : list of str, optional
+        The components to extract, as for `extract_components`.
+        Defaults to all of them.
+    chunksize : int, default 100_000
+        The number of rows read and processed at a time.
+    output_path : str, os.PathLike or file-like, optional
+        If given, the extracted components are written to this file, or to
+        this open stream such as `sys.stdout`, instead of being returned.
+    file_format : {"csv", "parquet", "ndjson", "lines"}, optional
+        The format of `path`. Inferred from its extension by default:
+        .csv, .parquet or .pq, .ndjson or .jsonl, and .txt.
+    output_format : {"csv", "parquet", "ndjson"}, optional
+        The format of `output_path`, inferred from its extension by default.
+    **extract_options
+        Further keyword arguments for `extract_components`, such as
+        `validate`, `output` or `errors`.
+
+    Returns
+    -------
+    iterator of pandas.DataFrame (if output_path is None)
+        One DataFrame of components per chunk, indexed by row number in
+        the file. With ``errors="mask"``, one ``(components, mask)`` pair
+        per chunk.
+    int (if output_path is given)
+        The number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If a file format cannot be determined or does not suit its use, if
+        ``errors="mask"`` is combined with `output_path`, if a field or an
+        option is invalid, or if a chunk contains invalid rows (the message
+        gives the first row of that chunk). Every error but the last is
+        raised by the call itself, before the file is read.
+    TypeError
+        If an option is not an argument of `extract_components`.
+    ImportError
+        If a Parquet file is involved and pyarrow is not installed.
+
+    Examples
+    --------
+    >>> for chunk in extract_from_file("events.csv", "timestamp", fields=["year", "month"]):  # doctest: +SKIP
+    ...     print(chunk.groupby("month").size())
+
+    Write the components of a large file to a Parquet file:
+
+    >>> extract_from_file("events.csv", "timestamp", output_path="parts.parquet", output="compact")  # doctest: +SKIP
+    1000000
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    if output_path is not None and extract_options.get("errors") == "mask":
+        raise ValueError("errors='mask' cannot be written to a file; use errors='coerce' instead.")
+    _check_extract_options(fields, extract_options)
+    chunks = _iter_extracted(
+        path, column, fields, chunksize, _file_format(path, file_format), extract_options
+    )
+    if output_path is None:
+        return chunks
+    return _write_extracted(chunks, output_path, _file_format(output_path, output_format))
+
+
+def _log_blocks(mapped, block_size):
+    """
+    Split a memory-mapped file into blocks of whole lines.
+
+    Parameters
+    ----------
+    mapped : mmap.mmap
+        The file.
+    block_size : int
+        The size of the blocks, which are extended to the end of their last
+        line.
+
+    Yields
+    ------
+    tuple of int
+        The start and stop offsets of consecutive blocks.
+    """
+    start, size = 0, len(mapped)
+    while start < size:
+        if start + block_size >= size:
+            yield start, size
+            return
+        newline = mapped.rfind(b"\n", start, start + block_size)
+        if newline < 0:
+            # A line longer than the block ends the block, wherever it ends.
+            newline = mapped.find(b"\n", start + block_size)
+        stop = size if newline < 0 else newline + 1
+        yield start, stop
+        start = stop
+
+
+def _scan_log_block(data, first_line, fields, validate, n_jobs, errors, utc):
+    """
+    Decode the timestamps starting the lines of a block of a log file.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The bytes of the block, made of whole lines.
+    first_line : int
+        The number of lines before the block, counting from 0.
+    fields, validate, n_jobs, errors, utc
+        As for `extract_from_log`.
+
+    Returns
+    -------
+    components : dict of str to numpy.ndarray
+        The requested components of every line, as int64 arrays.
+    valid : numpy.ndarray or None
+        Boolean mask of the valid lines, or None when `errors` is "raise".
+
+    Raises
+    ------
+    ValueError
+        If `errors` is "raise" and a line does not start with a valid
+        timestamp. Positions are line numbers in the file.
+    """
+    starts = np.flatnonzero(data == ord("\n")) + 1
+    starts = np.concatenate(([0], starts[starts < len(data)]))
+    buffer = _engine.line_stamps(data, starts)
+    # Log lines are written in time order, so consecutive lines mostly share their date.
+    if errors != "raise":
+        return _scan_values(buffer, fields, validate, n_jobs, True, utc, shared_dates=True)
+    components, malformed, out_of_range = _scan_values(
+        buffer, fields, validate, n_jobs, False, utc, shared_dates=True
+    )
+    if len(malformed):
+        _raise_invalid_positions(malformed + first_line, container="log file")
+    if len(out_of_range):
+        _raise_invalid_positions(out_of_range + first_line, _OUT_OF_RANGE, "log file")
+    return components, None
+
+
+def _iter_log(path, fields, block_size, types, validate, n_jobs, errors, utc):
+    """
+    Extract components from the lines of a log file, a block at a time.
+
+    Parameters
+    ----------
+    path, fields, block_size, validate, n_jobs, errors, utc
+        As for `extract_from_log`, already checked.
+    types : dict of str to numpy.dtype or pyarrow.DataType
+        The type of the array of each field.
+
+    Yields
+    ------
+    dict of numpy.ndarray or tuple
+        As for `extract_from_log`.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        # The map stays valid once the file is closed. It is not closed
+        # explicitly, as arrays viewing it can outlive the loop (in the
+        # traceback of an error), and is unmapped once they are gone.
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    first_line = 0
+    for start, stop in _log_blocks(mapped, block_size):
+        data = np.frombuffer(mapped, dtype=np.uint8, count=stop - start, offset=start)
+        components, valid = _scan_log_block(data, first_line, fields, validate, n_jobs, errors, utc)
+        del data
+        n_lines = len(next(iter(components.values())))
+        result = {field: _array_values(components[field], types[field], valid) for field in fields}
+        yield _masked_result(result, valid, None, errors)
+        first_line += n_lines
+
+def extract_from_log(path, fields=None, block_size=_LOG_BLOCK_SIZE, output=None, validate="full",
+                     n_jobs=None, errors="raise", utc=False):
+    """
+    Extract components from the timestamps that start the lines of a log file.
+
+    The file is memory-mapped and read a block of lines at a time. The
+    timestamp at the start of each line, up to the first space or tab, is
+    copied straight from the mapped bytes into the buffer of the NumPy
+    engine, so no line is decoded into a Python string and memory use
+    depends on `block_size` rather than on the size of the file. Timestamps
+    are checked with the same rules as `validate_datetime`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The log file. Every line must start with a timestamp in ISO 8601
+        format (YYYY-MM-DDThh:mm:ss, optionally with fractional seconds and
+        a UTC offset), followed by a space, a tab or the end of the line.
+    fields : list of str, optional
+        The components to extract, as for `extract_components`.
+    block_size : int, default 64 MiB
+        The number of bytes scanned at a time. Blocks are extended to the
+        end of their last line.
+    output : {None, "compact", "pyarrow"} or integer dtype, default None
+        The type of the arrays, as for list input to `extract_components`.
+    validate : {"full", "fast", "off"}, default "full"
+        How thoroughly the timestamps are checked.
+    n_jobs : int, optional
+        The number of processes used to decode each block, or -1 for one
+        per CPU.
+    errors : {"raise", "coerce", "mask"}, default "raise"
+        How lines that do not start with a valid timestamp, such as blank
+        lines or the continuation lines of a stack trace, are handled:
+        "raise" raises a ValueError, "coerce" masks them out of the arrays,
+        and "mask" also yields a boolean array, True where a line is valid.
+    utc : bool, default False
+        Whether to convert timestamps with a UTC offset to UTC first.
+
+    Returns
+    -------
+    iterator of dict of numpy.ndarray
+        For each block, one array per requested field with one value per
+        line, in file order. With ``errors="mask"``, ``(components, mask)``
+        pairs.
+
+    Raises
+    ------
+    ValueError
+        If an option is invalid, which is raised by the call itself, or if
+        `errors` is "raise" and a line does not start with a valid
+        timestamp. The positions in the message are line numbers, counting
+        from 0.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> hours = np.concatenate(  # doctest: +SKIP
+    ...     [block["hour"] for block in extract_from_log("app.log", fields=["hour"])]
+    ... )
+    >>> np.bincount(hours, minlength=24)  # doctest: +SKIP
+    """
+    fields = _resolve_fields(fields)
+    _check_choice(validate, _VALIDATE_MODES, "validate mode")
+    _check_choice(errors, _ERROR_MODES, "errors mode")
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer.")
+    types = {field: _array_dtype(field, output) for field in fields}
+    return _iter_log(path, fields, block_size, types, validate, n_jobs, errors, utc)
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from date_extractor_mds.date_extractor_mds import *
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "created": ["2023-07-16T12:34:56", "2024-02-29T08:15:30"],
+        "updated": ["2024-01-01T00:00:00", "2024-01-01T00:00:00"],
+        "count": [1, 2],
+    }, index=[10, 20]).astype({"updated": "category"})
+
+
+def test_adds_compact_columns(df):
+    """Test that every field of every column is added with a compact dtype."""
+    assert add_date_parts(df, ["created", "updated"]) is None
+    assert df.columns.tolist()[:3] == ["created", "updated", "count"]
+    assert df["created_year"].tolist() == [2023, 2024]
+    assert df["created_year"].dtype == np.int16
+    assert df["updated_second"].dtype == np.int8
+    assert df["updated_day"].tolist() == [1, 1]
+    assert len(df.columns) == 3 + 2 * 6
+
+
+def test_existing_columns_not_copied(df):
+    """Test that the existing columns keep their memory."""
+    before = df["count"].to_numpy()
+    add_date_parts(df, "created", fields=["year"])
+    assert np.shares_memory(df["count"].to_numpy(), before)
+
+
+def test_fields_prefix_and_output(df):
+    """Test that fields, prefix and output choose the new columns."""
+    add_date_parts(df, ["created"], fields=["hour"], prefix="{column}.", output=None)
+    assert df["created.hour"].tolist() == [12, 8]
+    assert df["created.hour"].dtype == np.int64
+
+
+def test_invalid_column_leaves_frame_unchanged(df):
+    """Test that a failure names the column and adds nothing."""
+    df["bad"] = ["2023-07-16T12:34:56", "2023-02-30T00:00:00"]
+    with pytest.raises(ValueError, match=r"Column 'bad': .*out of range .*\(positions: 1\)"):
+        add_date_parts(df, ["created", "bad"])
+    assert df.columns.tolist() == ["created", "updated", "count", "bad"]
+
+
+def test_coerce_and_mask(df):
+    """Test that errors="coerce" and "mask" give nullable columns and a validity column."""
+    df["bad"] = ["2023-07-16T12:34:56", "nope"]
+    add_date_parts(df, "bad", fields=["month"], errors="mask")
+    assert df["bad_month"].dtype == "Int8"
+    assert df["bad_month"].isna().tolist() == [False, True]
+    assert df["bad_valid"].tolist() == [True, False]
+
+
+def test_rejected_arguments(df):
+    """Test that other inputs and clashing names are rejected."""
+    with pytest.raises(TypeError, match="Input must be a Pandas DataFrame."):
+        add_date_parts(df["created"], "created")
+    with pytest.raises(KeyError):
+        add_date_parts(df, "missing")
+    with pytest.raises(ValueError, match="same name"):
+        add_date_parts(df, ["created", "updated"], prefix="ts_")
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from datetime import time
+from date_extractor_mds.date_extractor_mds import *
+
+ISO_DATES = ["2023-07-16T12:34:56", "2024-02-29T08:15:30", "2023-07-16T12:34:56"]
+
+
+@pytest.mark.parametrize("container", [list, tuple, np.array, lambda values: np.array(values, dtype="S"),
+                                       lambda values: np.array(values, dtype=object)])
+def test_sequences_give_arrays(container):
+    """Test that lists, tuples and str_, bytes_ and object arrays give NumPy arrays."""
+    iso_dates = container(ISO_DATES)
+    np.testing.assert_array_equal(extract_year(iso_dates), np.array([2023, 2024, 2023]))
+    np.testing.assert_array_equal(extract_month(iso_dates), np.array([7, 2, 7]))
+    np.testing.assert_array_equal(extract_day(iso_dates), np.array([16, 29, 16]))
+    assert extract_time(iso_dates).tolist() == [time(12, 34, 56), time(8, 15, 30), time(12, 34, 56)]
+
+
+def test_output_and_options():
+    """Test that output, deduplicate and validate apply to array input."""
+    assert extract_month(ISO_DATES, output="compact").dtype == np.int8
+    assert extract_time(ISO_DATES, output="seconds").tolist() == [45296, 29730, 45296]
+    assert extract_time(ISO_DATES, output="timedelta").dtype == np.dtype("timedelta64[s]")
+    np.testing.assert_array_equal(extract_day(ISO_DATES, deduplicate=True), np.array([16, 29, 16]))
+    np.testing.assert_array_equal(extract_day(["2023-02-30T00:00:00"], validate="fast"), np.array([30]))
+
+
+def test_components_give_dict_of_arrays():
+    """Test that extract_components gives one array per field."""
+    result = extract_components(ISO_DATES, fields=["year", "hour"], output="compact")
+    assert list(result) == ["year", "hour"]
+    assert result["year"].dtype == np.int16
+    np.testing.assert_array_equal(result["hour"], np.array([12, 8, 12]))
+
+
+def test_pyarrow_output():
+    """Test that output="pyarrow" gives pyarrow arrays for array input."""
+    pyarrow = pytest.importorskip("pyarrow")
+    assert extract_year(ISO_DATES, output="pyarrow").type == pyarrow.int16()
+    assert extract_time(ISO_DATES, output="pyarrow").type == pyarrow.time32("s")
+
+
+def test_invalid_elements_report_positions():
+    """Test that invalid elements raise with their positions."""
+    with pytest.raises(ValueError, match=r"elements in the array are not in valid ISO 8601 format \(positions: 1, 2\)"):
+        extract_day(["2023-07-16T12:34:56", "2023/07/16T12:34:56", "2023-07-16T12:34:5é"])
+    with pytest.raises(ValueError, match=r"contain out of range date or time components \(positions: 0\)"):
+        extract_month(np.array(["2023-02-30T00:00:00"]))
+    with pytest.raises(ValueError, match="All elements of the array must be strings."):
+        extract_year(["2023-07-16T12:34:56", None])
+
+
+def test_coerce_gives_masked_arrays():
+    """Test that errors="coerce" masks invalid elements."""
+    result = extract_day(["2023-07-16T12:34:56", "bad", None], errors="coerce")
+    assert isinstance(result, np.ma.MaskedArray)
+    assert result.mask.tolist() == [False, True, True]
+    times, valid = extract_time(["2023-07-16T12:34:56", "2023-07-16T24:00:00"], errors="mask")
+    assert times.tolist() == [time(12, 34, 56), None]
+    assert valid.tolist() == [True, False]
+
+
+def test_validate_datetime_accepts_arrays():
+    """Test that validate_datetime checks sequences and arrays."""
+    validate_datetime(ISO_DATES)
+    validate_datetime(np.array(ISO_DATES, dtype="S"))
+    with pytest.raises(ValueError, match=r"\(positions: 1\)"):
+        validate_datetime(np.array(["2023-07-16T12:34:56", "2023-07-16"]))
+
+
+def test_two_dimensional_array_rejected():
+    """Test that only one dimensional arrays are accepted."""
+    with pytest.raises(ValueError, match="one dimensional"):
+        extract_year(np.array([ISO_DATES]))
+
+
+def test_other_types_still_rejected():
+    """Test that other types keep raising a TypeError."""
+    with pytest.raises(TypeError, match="Input must be either a string or a Pandas Series of strings"):
+        extract_year({"date": "2023-07-16T12:34:56"})
@@ -0,0 +1,112 @@
+import importlib
+import numpy as np
+import pytest
+from datetime import time
+from date_extractor_mds import _arrow
+from date_extractor_mds.date_extractor_mds import *
+
+pyarrow = pytest.importorskip("pyarrow")
+
+ISO_DATES = ["2023-07-16T12:34:56", "2024-02-29T08:15:30", "2023-07-16T12:34:56"]
+MIXED = ["2023-07-16T12:34:56", None, "bad", "2023-02-30T00:00:00", "2024-01-01T00:00:0é"]
+
+
+def test_arrow_array_gives_arrow_array():
+    """Test that a pyarrow Array gives pyarrow arrays."""
+    array = pyarrow.array(ISO_DATES)
+    assert extract_year(array).equals(pyarrow.array([2023, 2024, 2023]))
+    assert extract_month(array, output="compact").type == pyarrow.int8()
+    assert extract_day(array, output="uint16").type == pyarrow.uint16()
+    assert extract_time(array).type == pyarrow.time32("s")
+    assert extract_time(array, output="seconds").to_pylist() == [45296, 29730, 45296]
+    assert extract_time(array, output="timedelta").type == pyarrow.duration("s")
+
+
+@pytest.mark.parametrize("data_type", ["string", "large_string", "string_view", "binary"])
+def test_string_types(data_type):
+    """Test that every Arrow string and binary layout is read."""
+    if not hasattr(pyarrow, data_type):
+        pytest.skip(f"pyarrow {pyarrow.__version__} has no {data_type} type")
+    array = pyarrow.array(ISO_DATES).cast(getattr(pyarrow, data_type)())
+    assert extract_day(array).to_pylist() == [16, 29, 16]
+
+
+def test_pyarrow_without_view_types(monkeypatch):
+    """Test that pyarrow versions before 16, which have no view types, are supported."""
+    try:
+        with monkeypatch.context() as patch:
+            patch.delattr(pyarrow.types, "is_string_view")
+            patch.delattr(pyarrow.types, "is_binary_view")
+            importlib.reload(_arrow)
+            assert extract_day(pyarrow.array(ISO_DATES)).to_pylist() == [16, 29, 16]
+            assert extract_day(pyarrow.array(ISO_DATES, pyarrow.binary())).to_pylist() == [16, 29, 16]
+    finally:
+        importlib.reload(_arrow)
+
+
+def test_fixed_width_strings_are_not_copied():
+    """Test that the engine views the data buffer when every string is 19 bytes long."""
+    array = pyarrow.array(ISO_DATES)
+    buffer = _arrow.to_buffer(array)
+    assert buffer.shape == (3, 19)
+    assert np.shares_memory(buffer, np.frombuffer(array.buffers()[2], dtype=np.uint8))
+    # A slice starts part way through the buffers.
+    assert extract_year(pyarrow.array(["x"] + ISO_DATES).slice(1)).to_pylist() == [2023, 2024, 2023]
+
+
+def test_chunked_array_keeps_chunks():
+    """Test that a ChunkedArray gives a ChunkedArray with the same chunk lengths."""
+    chunked = pyarrow.chunked_array([ISO_DATES[:1], ISO_DATES[1:]])
+    result = extract_month(chunked)
+    assert isinstance(result, pyarrow.ChunkedArray)
+    assert [len(chunk) for chunk in result.chunks] == [1, 2]
+    assert result.to_pylist() == [7, 2, 7]
+    table = extract_components(chunked, fields=["year", "hour"])
+    assert table.column_names == ["year", "hour"]
+    assert table.column("hour").to_pylist() == [12, 8, 12]
+
+
+def test_invalid_elements_report_positions():
+    """Test that invalid and null elements raise."""
+    with pytest.raises(ValueError, match=r"elements in the Arrow array are not in valid ISO 8601 format \(positions: 1\)"):
+        extract_day(pyarrow.array(["2023-07-16T12:34:56", "2023-07-16T12:34:56Q"]))
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 0\)"):
+        extract_month(pyarrow.array(["2023-02-30T00:00:00"]))
+    with pytest.raises(ValueError, match="All elements of the Arrow array must be strings."):
+        extract_year(pyarrow.array(["2023-07-16T12:34:56", None]))
+    with pytest.raises(ValueError, match="All elements of the Arrow array must be strings."):
+        validate_datetime(pyarrow.array([1, 2]))
+
+
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_coerce_and_mask(deduplicate):
+    """Test that errors="coerce" and "mask" give nulls and a boolean array."""
+    array = pyarrow.array(MIXED)
+    assert extract_month(array, errors="coerce", deduplicate=deduplicate).to_pylist() == [7, None, None, None, None]
+    times, valid = extract_time(array, errors="mask", deduplicate=deduplicate)
+    assert times.to_pylist() == [time(12, 34, 56), None, None, time(0, 0, 0), None]
+    assert valid.to_pylist() == [True, False, False, True, False]
+
+
+def test_dictionary_array():
+    """Test that a dictionary array is decoded through its dictionary."""
+    array = pyarrow.array(MIXED).dictionary_encode()
+    assert extract_day(array, validate="full", errors="coerce").to_pylist() == [16, None, None, None, None]
+
+
+def test_polars_series():
+    """Test that a Polars Series gives a Polars Series or DataFrame."""
+    polars = pytest.importorskip("polars")
+    series = polars.Series("ts", MIXED)
+    days, valid = extract_day(series, validate="full", errors="mask", output="compact")
+    assert isinstance(days, polars.Series)
+    assert days.name == "ts" and days.dtype == polars.Int8
+    assert days.to_list() == [16, None, None, None, None]
+    assert valid.to_list() == [True, False, False, False, False]
+    frame = extract_components(polars.Series(ISO_DATES), fields=["year", "second"])
+    assert isinstance(frame, polars.DataFrame)
+    assert frame["second"].to_list() == [56, 30, 56]
+    categorical = polars.Series(ISO_DATES, dtype=polars.Categorical)
+    assert extract_year(categorical).to_list() == [2023, 2024, 2023]
+    with pytest.raises(ValueError, match=r"Polars Series are not in valid ISO 8601 format \(positions: 2\)"):
+        validate_datetime(polars.Series(["2023-07-16T12:34:56", "2023-07-16T12:34:56", "2023-07-16"]))
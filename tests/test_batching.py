@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import time
+from date_extractor_mds.batching import BatchExtractor
+from date_extractor_mds.date_extractor_mds import *
+
+
+def run_batch(strings, **batch_options):
+    """Await every string through one BatchExtractor and return the outcomes."""
+    async def main():
+        async with BatchExtractor(**batch_options) as extractor:
+            return await asyncio.gather(
+                *(extractor.extract(string) for string in strings), return_exceptions=True
+            )
+    return asyncio.run(main())
+
+
+def test_results_match_direct_calls():
+    """Test that each caller gets what a direct call on its string gives."""
+    strings = ["2023-07-16T12:34:56", "2024-02-29T08:15:30+01:00", "2023-07-16T12:34:56.25"]
+    assert run_batch(strings, fields=["year", "month"]) == [
+        extract_components(string, fields=["year", "month"]) for string in strings
+    ]
+    assert run_batch(strings, function=extract_time, utc=True) == [
+        extract_time(string, utc=True) for string in strings
+    ]
+    assert run_batch(strings, function=to_datetime64, unit="s") == [
+        to_datetime64(string, unit="s") for string in strings
+    ]
+
+
+def test_pyarrow_output_matches_direct_calls():
+    """Test that output="pyarrow", which only applies to containers, gives the scalar results."""
+    pytest.importorskip("pyarrow")
+    strings = ["2023-07-16T12:34:56", "2024-03-25T08:15:30"]
+    assert run_batch(strings, function=extract_year, output="pyarrow") == [2023, 2024]
+    assert run_batch(strings, fields=["year", "day"], output="pyarrow") == [
+        extract_components(string, fields=["year", "day"], output="pyarrow") for string in strings
+    ]
+
+
+def test_time_output_matches_direct_calls():
+    """Test that output="seconds" gives the time objects of a direct call on a string."""
+    string = "2023-07-16T12:34:56"
+    assert run_batch([string], function=extract_time, output="seconds") == [
+        extract_time(string, output="seconds")
+    ] == [time(12, 34, 56)]
+
+
+def test_invalid_strings_raise_for_their_caller_only():
+    """Test that an invalid string fails its own future and not the rest of its batch."""
+    outcomes = run_batch(["2023-07-16T12:34:56", "bad", "2023-02-30T00:00:00", 5], function=extract_day,
+                         validate="full")
+    assert outcomes[0] == 16
+    assert isinstance(outcomes[1], ValueError) and "not in valid ISO 8601 format" in str(outcomes[1])
+    assert isinstance(outcomes[2], ValueError) and "out of range" in str(outcomes[2])
+    assert isinstance(outcomes[3], TypeError)
+
+
+def test_errors_modes():
+    """Test that coerce and mask give the values of direct calls."""
+    assert run_batch(["2023-07-16T12:34:56", "bad"], function=extract_day, errors="coerce") == [16, None]
+    assert run_batch(["2023-07-16T12:34:56", "2023-07-16T24:00:00"], function=extract_time, errors="mask") == [
+        (time(12, 34, 56), True), (None, False)
+    ]
+
+
+def test_batches_are_bounded():
+    """Test that no batch holds more than max_batch_size strings."""
+    sizes = []
+    original = extract_month
+
+    def recording_month(values, **options):
+        if not isinstance(values, str):
+            sizes.append(len(values))
+        return original(values, **options)
+
+    strings = [f"2023-{month:02d}-01T00:00:00" for month in range(1, 13)] * 5
+    assert run_batch(strings, function=recording_month, max_batch_size=8) == list(range(1, 13)) * 5
+    assert max(sizes) == 8 and sum(sizes) == len(strings)
+
+
+def test_latency_flushes_partial_batch():
+    """Test that a lone string is processed after max_latency instead of waiting for a full batch."""
+    async def main():
+        extractor = BatchExtractor(function=extract_year, max_batch_size=1000, max_latency=0.01)
+        return await asyncio.wait_for(extractor.extract("2023-07-16T12:34:56"), timeout=5)
+    assert asyncio.run(main()) == 2023
+
+
+def test_custom_executor():
+    """Test that batches can run in a given executor."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert run_batch(["2023-07-16T12:34:56"], function=extract_year, executor=executor) == [2023]
+
+
+def test_loop_is_not_blocked():
+    """Test that the event loop keeps running while a batch is processed."""
+    released = threading.Event()
+
+    def waiting_year(values, **options):
+        # Only returns once a coroutine has run during the batch.
+        if not isinstance(values, str):
+            assert released.wait(timeout=5)
+        return extract_year(values, **options)
+
+    async def main():
+        extractor = BatchExtractor(function=waiting_year, max_latency=0)
+        pending = asyncio.ensure_future(extractor.extract("2023-07-16T12:34:56"))
+        await asyncio.sleep(0.05)
+        released.set()
+        return await pending
+    assert asyncio.run(main()) == 2023
+
+
+def test_invalid_options():
+    """Test that invalid batching options are rejected."""
+    with pytest.raises(ValueError, match="max_batch_size must be a positive integer"):
+        BatchExtractor(max_batch_size=0)
+    with pytest.raises(ValueError, match="max_latency must not be negative"):
+        BatchExtractor(max_latency=-1)
+    with pytest.raises(ValueError, match="Unknown errors mode 'ignore'"):
+        BatchExtractor(errors="ignore")
+    outcomes = run_batch(["2023-07-16T12:34:56"], fields=["week"])
+    assert isinstance(outcomes[0], ValueError)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date, timedelta
+from date_extractor_mds.date_extractor_mds import *
+
+CALENDAR_FIELDS = ["weekday", "iso_week", "day_of_year", "quarter"]
+
+
+def expected_fields(day):
+    """Compute the calendar fields of a date with the datetime module."""
+    return {
+        "weekday": day.weekday(),
+        "iso_week": day.isocalendar()[1],
+        "day_of_year": day.timetuple().tm_yday,
+        "quarter": (day.month - 1) // 3 + 1,
+    }
+
+
+# Every day around New Year in a range of years, where ISO weeks change year,
+# plus leap days and the ends of the supported range.
+DAYS = sorted({
+    date(year, 12, 25) + timedelta(days=offset) for year in range(1998, 2030) for offset in range(14)
+} | {date(2000, 2, 29), date(2024, 2, 29), date(1900, 3, 1), date(1, 1, 1), date(9999, 12, 31)})
+STRINGS = [f"{day.isoformat()}T12:00:00" for day in DAYS]
+
+
+def test_string_input():
+    """Test the calendar fields of single strings against the datetime module."""
+    for day, string in zip(DAYS, STRINGS):
+        assert extract_components(string, fields=CALENDAR_FIELDS) == expected_fields(day)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_series_input(engine):
+    """Test that both engines compute the calendar fields of a Series."""
+    result = extract_components(pd.Series(STRINGS), fields=CALENDAR_FIELDS, engine=engine)
+    expected = pd.DataFrame([expected_fields(day) for day in DAYS])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_mixed_with_decoded_fields():
+    """Test that calendar fields can be requested alongside decoded components."""
+    result = extract_components(STRINGS[:3], fields=["day", "weekday", "year"], validate="fast")
+    assert list(result) == ["day", "weekday", "year"]
+    np.testing.assert_array_equal(result["weekday"], [day.weekday() for day in DAYS[:3]])
+
+
+def test_utc():
+    """Test that with utc=True the calendar fields are those of the UTC date."""
+    strings = ["2024-12-31T23:30:00-01:00", "2021-01-01T00:30:00+01:00"]
+    assert extract_components(strings[0], fields=["iso_week", "day_of_year", "quarter"], utc=True) == {
+        "iso_week": 1, "day_of_year": 1, "quarter": 1
+    }
+    result = extract_components(pd.Series(strings), fields=CALENDAR_FIELDS, utc=True)
+    assert result.to_dict("records") == [expected_fields(date(2025, 1, 1)), expected_fields(date(2020, 12, 31))]
+
+
+def test_nonexistent_dates():
+    """Test that calendar fields check that the whole date exists."""
+    with pytest.raises(ValueError, match="out of range"):
+        extract_components("2023-02-29T00:00:00", fields=["quarter"])
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 1\)"):
+        extract_components(pd.Series(["2023-02-28T00:00:00", "2023-02-29T00:00:00"]), fields=["weekday"])
+    result, valid = extract_components(["2023-02-28T00:00:00", "2023-13-01T00:00:00"], fields=["iso_week"],
+                                       errors="mask")
+    assert valid.tolist() == [True, False] and result["iso_week"][0] == 9
+
+
+def test_compact_output():
+    """Test the compact dtypes of the calendar fields."""
+    df = pd.DataFrame({"ts": STRINGS})
+    add_date_parts(df, "ts", fields=CALENDAR_FIELDS)
+    assert df.dtypes[1:].astype(str).tolist() == ["int8", "int8", "int16", "int8"]
+    with pytest.raises(ValueError, match="cannot hold the day_of_year component"):
+        extract_components(pd.Series(STRINGS), fields=["day_of_year"], output="int8")
@@ -0,0 +1,72 @@
+import io
+import pandas as pd
+import pytest
+from date_extractor_mds.cli import main
+
+TIMESTAMPS = [f"2024-{month:02d}-{day:02d}T{day % 24:02d}:30:00" for month in range(1, 13) for day in range(1, 29)]
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """A CSV file with an ISO 8601 column and an unrelated column."""
+    path = tmp_path / "events.csv"
+    pd.DataFrame({"id": range(len(TIMESTAMPS)), "timestamp": TIMESTAMPS}).to_csv(path, index=False)
+    return path
+
+
+def read_csv_output(capsys):
+    """Parse what the command wrote to standard output."""
+    return pd.read_csv(io.StringIO(capsys.readouterr().out))
+
+
+def test_csv_to_stdout(csv_file, capsys):
+    """Test extracting fields of a CSV column to standard output."""
+    assert main([str(csv_file), "--column", "timestamp", "--fields", "month,weekday", "--chunksize", "50"]) == 0
+    result = read_csv_output(capsys)
+    assert list(result.columns) == ["month", "weekday"]
+    assert result["month"].tolist() == [month for month in range(1, 13) for _ in range(28)]
+    assert result["weekday"].tolist()[:3] == [0, 1, 2]
+
+
+def test_lines_from_stdin(monkeypatch, capsys):
+    """Test reading one timestamp per line from standard input."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(TIMESTAMPS[:3]) + "\r\nbad\n"))
+    assert main(["--format", "lines", "--fields", "day", "--errors", "coerce", "--stats"]) == 0
+    captured = capsys.readouterr()
+    assert pd.read_csv(io.StringIO(captured.out))["day"].tolist()[:3] == [1, 2, 3]
+    assert captured.out.count("\n") == 5
+    assert "4 rows (1 invalid)" in captured.err
+
+
+def test_ndjson_to_parquet(tmp_path):
+    """Test reading newline-delimited JSON and writing Parquet with several workers."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "events.jsonl"
+    pd.DataFrame({"ts": TIMESTAMPS}).to_json(path, orient="records", lines=True)
+    output_path = tmp_path / "parts.parquet"
+    assert main([str(path), "-c", "ts", "--workers", "2", "--chunksize", "40", "-o", str(output_path)]) == 0
+    written = pd.read_parquet(output_path)
+    assert len(written) == len(TIMESTAMPS)
+    assert written["day"].tolist() == list(range(1, 29)) * 12
+
+
+def test_invalid_row(tmp_path, capsys):
+    """Test that an invalid row stops the command with its chunk in the message."""
+    path = tmp_path / "stamps.txt"
+    path.write_text("\n".join(TIMESTAMPS[:5] + ["not-a-date"]) + "\n")
+    assert main([str(path), "--chunksize", "4"]) == 1
+    assert "error: In the chunk starting at row 4: " in capsys.readouterr().err
+
+
+def test_usage_errors(csv_file, capsys):
+    """Test that invalid options are rejected before reading the input."""
+    for arguments in (
+        [str(csv_file)],
+        [str(csv_file), "-c", "timestamp", "--fields", "week"],
+        [str(csv_file), "-c", "timestamp", "--workers", "0"],
+        [str(csv_file), "-c", "timestamp", "-o", "parts.json"],
+    ):
+        with pytest.raises(SystemExit) as exit_info:
+            main(arguments)
+        assert exit_info.value.code == 2
+    assert "--column is required for csv input" in capsys.readouterr().err
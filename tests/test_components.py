@@ -0,0 +1,85 @@
+import pandas as pd
+import pytest
+from date_extractor_mds.date_extractor_mds import *
+
+
+def test_extract_components_from_string():
+    """Test extracting all components from a single ISO 8601 datetime string."""
+    result = extract_components("2025-01-15T10:20:30")
+    expected = {"year": 2025, "month": 1, "day": 15, "hour": 10, "minute": 20, "second": 30}
+    assert result == expected, f"Expected {expected}, but got {result}"
+
+
+def test_extract_components_from_series():
+    """Test extracting components from a Pandas Series of ISO 8601 datetime strings."""
+    iso_dates = pd.Series([
+        "2025-01-15T10:20:30",
+        "2024-12-25T15:45:00",
+        "2023-07-16T08:00:59"
+    ], index=[3, 1, 2])
+    result = extract_components(iso_dates)
+    expected = pd.DataFrame({
+        "year": [2025, 2024, 2023],
+        "month": [1, 12, 7],
+        "day": [15, 25, 16],
+        "hour": [10, 15, 8],
+        "minute": [20, 45, 0],
+        "second": [30, 0, 59]
+    }, index=[3, 1, 2])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_selected_fields_keep_requested_order():
+    """Test that only the requested fields are returned, in the requested order."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30"])
+    result = extract_components(iso_dates, fields=["second", "year"])
+    assert list(result.columns) == ["second", "year"]
+    assert extract_components("2025-01-15T10:20:30", fields="day") == {"day": 15}
+
+
+def test_matches_single_extractors():
+    """Test that the combined result agrees with the individual extractors."""
+    iso_dates = pd.Series(["2024-02-29T23:59:59", "2000-01-01T00:00:00"])
+    result = extract_components(iso_dates)
+    pd.testing.assert_series_equal(result["year"], extract_year(iso_dates), check_names=False)
+    pd.testing.assert_series_equal(result["month"], extract_month(iso_dates), check_names=False)
+    pd.testing.assert_series_equal(result["day"], extract_day(iso_dates), check_names=False)
+
+
+def test_empty_series():
+    """Test handling of an empty Pandas Series."""
+    result = extract_components(pd.Series([], dtype="object"), fields=["year", "month"])
+    expected = pd.DataFrame({"year": pd.Series([], dtype="int64"), "month": pd.Series([], dtype="int64")})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_invalid_iso_date_series():
+    """Test invalid ISO 8601 datetime strings in a Pandas Series."""
+    iso_dates = pd.Series(["2025-01-17T10:20:30", "invalid-date"])
+    with pytest.raises(ValueError, match="One or more elements in the Pandas Series are not in valid ISO 8601 format"):
+        extract_components(iso_dates)
+
+
+def test_out_of_range_components():
+    """Test that impossible dates and times are rejected."""
+    with pytest.raises(ValueError, match="out of range"):
+        extract_components("2023-02-29T12:00:00", fields=["month"])
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 1\)"):
+        extract_components(pd.Series(["2025-01-01T23:59:59", "2025-01-01T24:00:00"]), fields=["hour"])
+
+
+def test_year_only_is_not_range_checked():
+    """Test that requesting only the year does not check the rest of the date."""
+    assert extract_components("2023-02-30T25:00:00", fields=["year"]) == {"year": 2023}
+
+
+def test_unknown_field():
+    """Test requesting a field that does not exist."""
+    with pytest.raises(ValueError, match="Unknown field 'week'"):
+        extract_components("2025-01-15T10:20:30", fields=["year", "week"])
+
+
+def test_invalid_type():
+    """Test invalid input type."""
+    with pytest.raises(TypeError, match="Input must be either a string or a Pandas Series of strings"):
+        extract_components(12345)
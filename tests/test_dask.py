@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+from date_extractor_mds.date_extractor_mds import *
+
+dd = pytest.importorskip("dask.dataframe")
+dask = pytest.importorskip("dask")
+
+ISO_DATES = pd.Series(
+    ["2023-07-16T12:34:56", "2024-03-25T08:15:30", "2025-01-15T10:20:30.5+05:30"] * 4,
+    index=range(100, 112),
+    name="dates",
+)
+
+
+@pytest.fixture
+def dask_dates():
+    """The sample Series in three partitions."""
+    return dd.from_pandas(ISO_DATES, npartitions=3)
+
+
+@pytest.mark.parametrize("extractor", [extract_year, extract_month, extract_day, extract_time, to_datetime64])
+def test_dask_matches_pandas(extractor, dask_dates):
+    """Test that a Dask Series gives the pandas result once computed."""
+    result = extractor(dask_dates)
+    assert isinstance(result, dd.Series)
+    pd.testing.assert_series_equal(result.compute(), extractor(ISO_DATES))
+
+
+def test_dask_meta_dtypes(dask_dates):
+    """Test that the lazy result describes its dtypes without computing."""
+    result = extract_components(dask_dates, fields=["year", "hour"], output="compact", utc=True)
+    assert isinstance(result, dd.DataFrame)
+    assert result.dtypes.to_dict() == {"year": "int16", "hour": "int8"}
+    pd.testing.assert_frame_equal(
+        result.compute(), extract_components(ISO_DATES, fields=["year", "hour"], output="compact", utc=True)
+    )
+
+
+def test_dask_invalid_option(dask_dates):
+    """Test that invalid options are reported before anything is computed."""
+    with pytest.raises(ValueError, match="Unknown errors mode"):
+        extract_year(dask_dates, errors="ignore")
+    with pytest.raises(ValueError, match="Unknown field"):
+        extract_components(dask_dates, fields=["century"])
+
+
+@pytest.mark.parametrize("scheduler", ["synchronous", "threads", "processes"])
+def test_dask_errors_cover_every_partition(scheduler):
+    """Test that the invalid rows of all partitions are reported in one error."""
+    dates = pd.Series(["2023-07-16T12:34:56", "2023-02-30T00:00:00"] * 6)
+    result = extract_day(dd.from_pandas(dates, npartitions=3), validate="full")
+    with dask.config.set(scheduler=scheduler):
+        with pytest.raises(ValueError, match=r"Dask Series contain out of range .*\(positions: 1, 3, 5, 7, 9, 11\)"):
+            result.compute()
+        with pytest.raises(ValueError, match=r"positions: 1, 3, 5, 7, 9, 11"):
+            result.sum().compute()
+        pd.testing.assert_series_equal(extract_day(dd.from_pandas(dates.iloc[::2], npartitions=3)).compute(),
+                                       extract_day(dates.iloc[::2]))
+
+
+def test_dask_errors_cover_many_partitions():
+    """Test that invalid rows are reported with their global positions across many partitions."""
+    dates = pd.Series(["2023-07-16T12:34:56"] * 200)
+    invalid = [0, 17, 18, 99, 150, 199]
+    dates[invalid] = "2023-07-16 12:34"
+    series = dd.from_pandas(dates, npartitions=25)
+    assert series.npartitions == 25
+    with pytest.raises(ValueError, match=r"positions: 0, 17, 18, 99, 150, 199\)"):
+        extract_month(series).compute()
+    with pytest.raises(ValueError, match=r"positions: 0, 17, 18, 99, 150, 199\)"):
+        validate_datetime(series)
+    valid = dates.drop(invalid)
+    pd.testing.assert_series_equal(extract_month(dd.from_pandas(valid, npartitions=25)).compute(),
+                                   extract_month(valid))
+    pd.testing.assert_series_equal(extract_month(series, errors="coerce").compute(),
+                                   extract_month(dates, errors="coerce"))
+
+
+def test_dask_errors_follow_check_order():
+    """Test that malformed rows are reported before out of range ones, whatever their partition."""
+    dates = pd.Series(["2023-02-30T00:00:00"] * 4 + ["2023-07-16T12:34:56", "bad"])
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 5\)"):
+        extract_month(dd.from_pandas(dates, npartitions=3)).compute()
+    with pytest.raises(ValueError, match=r"In partition 1: All elements of the Pandas Series must be strings"):
+        extract_month(dd.from_pandas(pd.Series(["bad", "2023-07-16T12:34:56", 5, None], dtype=object),
+                                     npartitions=2)).compute()
+
+
+def test_dask_mask():
+    """Test that errors="mask" gives a lazy result and mask."""
+    dates = pd.Series(["2023-07-16T12:34:56", "invalid", None, "2024-03-25T08:15:30"], name="dates")
+    result, valid = extract_month(dd.from_pandas(dates, npartitions=2), errors="mask")
+    expected, expected_valid = extract_month(dates, errors="mask")
+    pd.testing.assert_series_equal(result.compute(), expected)
+    pd.testing.assert_series_equal(valid.compute(), expected_valid)
+
+    components, valid = extract_components(dd.from_pandas(dates, npartitions=2), errors="mask")
+    expected, expected_valid = extract_components(dates, errors="mask")
+    pd.testing.assert_frame_equal(components.compute(), expected)
+    pd.testing.assert_series_equal(valid.compute(), expected_valid)
+
+
+@pytest.mark.parametrize("scheduler", ["synchronous", "threads", "processes"])
+def test_dask_validate_gathers_partitions(scheduler):
+    """Test that validate_datetime reports the invalid rows of every partition."""
+    dates = pd.Series(["2023-07-16T12:34:56", "bad"] * 6)
+    with dask.config.set(scheduler=scheduler):
+        validate_datetime(dd.from_pandas(dates.iloc[::2], npartitions=3))
+        with pytest.raises(ValueError, match=r"positions: 1, 3, 5, 7, 9, 11"):
+            validate_datetime(dd.from_pandas(dates, npartitions=3))
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+from date_extractor_mds import _engine, date_extractor_mds
+from date_extractor_mds.date_extractor_mds import *
+
+ISO_DATES = pd.Series(
+    ["2025-01-15T10:20:30", "2024-12-25T15:45:00", "2025-01-15T10:20:30", "2024-12-25T15:45:00"] * 3,
+    index=range(100, 112),
+    name="dates"
+)
+
+
+@pytest.mark.parametrize("extractor", [extract_year, extract_month, extract_day, extract_time])
+def test_deduplicate_matches_default(extractor):
+    """Test that deduplicating repeated timestamps does not change the result."""
+    pd.testing.assert_series_equal(extractor(ISO_DATES, deduplicate=True), extractor(ISO_DATES))
+
+
+def test_deduplicate_components():
+    """Test deduplication with extract_components."""
+    result = extract_components(ISO_DATES, deduplicate=True, output="compact")
+    pd.testing.assert_frame_equal(result, extract_components(ISO_DATES, output="compact"))
+
+
+def test_deduplicate_reports_every_invalid_row():
+    """Test that an invalid repeated string is reported at each of its rows."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30", "2023-02-29T00:00:00"] * 3)
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 1, 3, 5\)"):
+        extract_month(iso_dates, deduplicate=True)
+
+
+# A time-ordered stream: runs of rows sharing a date, with offsets, fractions and invalid rows.
+SORTED_DATES = pd.Series(
+    [f"2024-02-28T{hour:02d}:{minute:02d}:00" for hour in (22, 23) for minute in range(0, 60, 7)]
+    + ["2024-02-29T00:00:00.5+01:00", "2024-02-29T23:30:00-01:00", "2024-02-29T25:00:00"]
+    + ["2024-02-30T00:00:00"] * 5 + ["2024-03-01T00:00:00Z", "2024-03-01", "2024-03-01T08:00:00"] * 3
+)
+
+
+@pytest.mark.parametrize("utc", [False, True])
+@pytest.mark.parametrize("validate", ["full", "fast"])
+@pytest.mark.parametrize("order", ["sorted", "shuffled"])
+def test_sorted_matches_default(utc, validate, order):
+    """Test that sharing the work on each date gives the default result, whatever the order."""
+    dates = SORTED_DATES if order == "sorted" else SORTED_DATES.sample(frac=1, random_state=0)
+    fields = ["year", "month", "day", "hour", "minute", "microsecond", "weekday", "iso_week"]
+    expected, expected_mask = extract_components(dates, fields, validate=validate, errors="mask", utc=utc)
+    result, mask = extract_components(
+        dates, fields, validate=validate, errors="mask", utc=utc, deduplicate="sorted"
+    )
+    pd.testing.assert_series_equal(mask, expected_mask)
+    pd.testing.assert_frame_equal(result, expected)
+    values = dates.to_numpy(dtype=str)
+    np.testing.assert_array_equal(
+        extract_day(values, validate=validate, errors="coerce", utc=utc, deduplicate="sorted"),
+        extract_day(values, validate=validate, errors="coerce", utc=utc),
+    )
+
+
+def test_sorted_reports_every_invalid_row():
+    """Test that an invalid date shared by consecutive rows is reported at each of them."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30"] * 4 + ["2023-02-29T00:00:00"] * 4)
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 4, 5, 6, 7\)"):
+        extract_month(iso_dates, deduplicate="sorted")
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 8\)"):
+        extract_month(pd.concat([iso_dates[:4]] * 2 + [pd.Series(["2025-01-15 10:20:30"])]), deduplicate="sorted")
+
+
+@pytest.mark.parametrize("extractor", [extract_year, extract_components, to_datetime64])
+def test_unknown_deduplicate_mode(extractor):
+    """Test that a misspelt deduplicate mode is rejected rather than treated as True."""
+    with pytest.raises(ValueError, match="Unknown deduplicate mode 'sort'. Valid deduplicate modes are: False, True, sorted."):
+        extractor(ISO_DATES, deduplicate="sort")
+    with pytest.raises(ValueError, match="Unknown deduplicate mode"):
+        add_date_parts(ISO_DATES.to_frame(), "dates", deduplicate="Sorted")
+
+
+def test_date_runs():
+    """Test that runs are found in time-ordered rows and given up on otherwise."""
+    body, _ = _engine.split(_engine.to_buffer(["2024-01-01T00:00:00"] * 5 + ["2024-01-02T00:00:00"] * 3))
+    runs = _engine.date_runs(body)
+    assert runs.starts.tolist() == [0, 5] and runs.lengths.tolist() == [5, 3]
+    body, _ = _engine.split(_engine.to_buffer([f"2024-01-{day:02d}T00:00:00" for day in range(1, 9)]))
+    assert _engine.date_runs(body) is None
+
+
+def test_categorical_input():
+    """Test that a categorical Series is accepted and decoded per category."""
+    categorical = ISO_DATES.astype("category")
+    pd.testing.assert_series_equal(extract_day(categorical), extract_day(ISO_DATES))
+    pd.testing.assert_series_equal(
+        extract_time(categorical, output="seconds"), extract_time(ISO_DATES, output="seconds")
+    )
+    validate_datetime(categorical)
+
+
+def test_categorical_unused_invalid_category():
+    """Test that an invalid category which no row uses is ignored."""
+    categorical = pd.Series(pd.Categorical(
+        ["2025-01-15T10:20:30"], categories=["2025-01-15T10:20:30", "invalid-date"]
+    ))
+    pd.testing.assert_series_equal(extract_year(categorical), pd.Series([2025]))
+
+
+def test_categorical_invalid_rows_reported():
+    """Test that rows holding an invalid category are reported by position."""
+    categorical = pd.Series(["invalid-date", "2025-01-15T10:20:30", "invalid-date"], dtype="category")
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 0, 2\)"):
+        extract_year(categorical)
+
+
+def test_categorical_missing_value():
+    """Test a categorical Series containing a missing value."""
+    categorical = pd.Series(["2025-01-15T10:20:30", None], dtype="category")
+    with pytest.raises(ValueError, match="All elements of the Pandas Series must be strings"):
+        extract_year(categorical)
+
+
+def test_string_results_are_cached():
+    """Test that repeated string input is served from the bounded cache."""
+    date_extractor_mds._scan_string_cached.cache_clear()
+    for _ in range(3):
+        assert extract_month("2025-01-15T10:20:30") == 1
+        assert extract_time("2025-01-15T10:20:30").hour == 10
+    info = date_extractor_mds._scan_string_cached.cache_info()
+    assert info.misses == 1 and info.hits == 5
+    assert info.maxsize == date_extractor_mds._STRING_CACHE_SIZE
+
+
+def test_cached_invalid_string_still_raises():
+    """Test that an invalid string raises every time it is seen."""
+    for _ in range(2):
+        with pytest.raises(ValueError, match="is not in valid ISO 8601 format"):
+            extract_year("2025/01/15T10:20:30")
+        with pytest.raises(ValueError, match="out of range"):
+            extract_day("2025-02-30T10:20:30", validate="full")
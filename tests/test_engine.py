@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+from date_extractor_mds.date_extractor_mds import *
+
+EXTRACTORS = [extract_year, extract_month, extract_day, extract_time]
+
+
+@pytest.mark.parametrize("extractor", EXTRACTORS)
+def test_engines_agree(extractor):
+    """Test that the NumPy and Python engines give the same result."""
+    iso_dates = pd.Series([
+        "2025-01-15T10:20:30",
+        "2024-02-29T23:59:59",
+        "0001-12-31T00:00:00"
+    ], index=[5, 6, 7], name="dates")
+    pd.testing.assert_series_equal(
+        extractor(iso_dates, engine="numpy"), extractor(iso_dates, engine="python")
+    )
+
+
+@pytest.mark.parametrize("extractor", EXTRACTORS)
+@pytest.mark.parametrize("invalid_date", [
+    "2025-01-15T10:20:30Q",   # Unknown designator
+    "2025-01-15T10:20:3",     # Too short
+    "2025-01-15 10:20:30",    # Wrong separator
+    "２025-01-15T10:20:30",   # Non-ASCII digit
+    ""
+])
+def test_malformed_rows_reported(extractor, invalid_date):
+    """Test that malformed rows are reported with their positions."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30", invalid_date])
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 1\)"):
+        extractor(iso_dates)
+
+
+@pytest.mark.parametrize("extractor, invalid_date", [
+    (extract_month, "2023-02-29T10:20:30"),
+    (extract_month, "2024-13-01T10:20:30"),
+    (extract_day, "2024-04-31T10:20:30"),
+    (extract_time, "2024-04-30T23:60:00"),
+    (extract_time, "2024-04-30T24:00:00")
+])
+def test_out_of_range_rows_reported(extractor, invalid_date):
+    """Test that impossible dates and times are rejected by the NumPy engine."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30", invalid_date])
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 1\)"):
+        extractor(iso_dates, validate="full")
+
+
+def test_year_ignores_rest_of_date():
+    """Test that the year is extracted without checking the rest of the date."""
+    result = extract_year(pd.Series(["2023-02-30T25:00:00"]))
+    pd.testing.assert_series_equal(result, pd.Series([2023]))
+
+
+def test_non_string_in_series():
+    """Test a Pandas Series containing non-string elements."""
+    with pytest.raises(ValueError, match="All elements of the Pandas Series must be strings"):
+        extract_year(pd.Series(["2025-01-15T10:20:30", 12345]))
+
+
+def test_unknown_engine():
+    """Test requesting an engine that does not exist."""
+    with pytest.raises(ValueError, match="Unknown engine 'rust'"):
+        extract_year(pd.Series(["2025-01-15T10:20:30"]), engine="rust")
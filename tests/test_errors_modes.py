@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+from datetime import time
+from date_extractor_mds import _parallel
+from date_extractor_mds.date_extractor_mds import *
+
+# Valid, malformed, missing, impossible date, impossible time, non-ASCII.
+MIXED = pd.Series(
+    ["2023-07-16T12:34:56", "bad", None, "2023-02-30T00:00:00", "2024-01-01T25:00:00", "2024-01-01T00:00:0é"],
+    index=range(10, 16),
+    name="dates"
+)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_coerce_components(engine):
+    """Test that errors="coerce" turns invalid rows into <NA> in a nullable dtype."""
+    months = extract_month(MIXED, engine=engine, errors="coerce")
+    expected = pd.Series([7, None, None, None, 1, None], index=MIXED.index, name="dates", dtype="Int64")
+    pd.testing.assert_series_equal(months, expected)
+    # The year alone is not range-checked, so only malformed rows are missing.
+    assert extract_year(MIXED, engine=engine, errors="coerce").isna().tolist() == [False, True, True, False, False, True]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_coerce_keeps_output_dtype(engine):
+    """Test that coercion picks the nullable counterpart of the requested dtype."""
+    assert extract_day(MIXED, engine=engine, errors="coerce", output="compact").dtype == "Int8"
+    assert extract_day(MIXED, engine=engine, errors="coerce", output="uint16").dtype == "UInt16"
+    frame = extract_components(MIXED, engine=engine, errors="coerce", output="compact")
+    assert frame.dtypes.tolist() == ["Int16"] + ["Int8"] * 5
+
+
+def test_coerce_all_valid_is_still_nullable():
+    """Test that the dtype does not depend on whether any row is invalid."""
+    result = extract_day(pd.Series(["2023-07-16T12:34:56"]), errors="coerce")
+    assert result.dtype == "Int64"
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_mask_returns_validity(engine):
+    """Test that errors="mask" returns the coerced result and a validity mask."""
+    components, valid = extract_components(MIXED, engine=engine, errors="mask")
+    expected = pd.Series([True, False, False, False, False, False], index=MIXED.index, name="dates")
+    pd.testing.assert_series_equal(valid, expected)
+    assert components.loc[10].tolist() == [2023, 7, 16, 12, 34, 56]
+    assert components.loc[11:].isna().all().all()
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+@pytest.mark.parametrize("output", [None, "seconds", "timedelta"])
+def test_coerce_time(engine, output):
+    """Test that every extract_time representation marks invalid rows as missing."""
+    times = extract_time(MIXED, engine=engine, errors="coerce", output=output)
+    # Only the time of day is checked, so the impossible date does not count.
+    assert times.isna().tolist() == [False, True, True, False, True, True]
+    if output is None:
+        assert times.iloc[0] == time(12, 34, 56)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_coerce_time_without_range_checks(engine):
+    """Test that times of day that cannot exist are missing even with validate="fast"."""
+    times, valid = extract_time(MIXED, engine=engine, validate="fast", errors="mask")
+    assert valid.tolist() == [True, False, False, True, False, False]
+    assert times.iloc[3] == time(0, 0, 0)
+
+
+def test_coerce_categorical_and_deduplicate():
+    """Test that coercion also works through the distinct-value paths."""
+    expected = extract_day(MIXED, errors="coerce")
+    pd.testing.assert_series_equal(extract_day(MIXED.astype("category"), errors="coerce"), expected)
+    pd.testing.assert_series_equal(extract_day(MIXED, errors="coerce", deduplicate=True), expected)
+
+
+def test_coerce_in_process_pool(monkeypatch):
+    """Test that coercion gives the same result when the Series is split over processes."""
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_JOB", 2)
+    iso_dates = pd.Series(["2023-07-16T12:34:56", "bad", "2023-02-30T00:00:00", "2024-03-25T08:15:30"] * 3)
+    pd.testing.assert_series_equal(
+        extract_day(iso_dates, errors="coerce", n_jobs=3), extract_day(iso_dates, errors="coerce")
+    )
+
+
+def test_coerce_non_string_series():
+    """Test that a Series without strings is entirely coerced instead of raising."""
+    assert extract_year(pd.Series([1, 2]), errors="coerce").isna().all()
+
+
+def test_string_input():
+    """Test that string input gives None, or a (value, is_valid) pair with errors="mask"."""
+    assert extract_year("bad", errors="coerce") is None
+    assert extract_time("2023-07-16T24:00:00", errors="mask") == (None, False)
+    assert extract_day("2023-07-16T12:34:56", errors="mask") == (16, True)
+    assert extract_components("2023-02-30T00:00:00", errors="coerce") is None
+
+
+def test_wrong_input_type_still_raises():
+    """Test that errors only covers invalid rows, not a wrong input type."""
+    with pytest.raises(TypeError, match="Input must be either a string or a Pandas Series of strings."):
+        extract_year(5, errors="coerce")
+
+
+def test_invalid_errors_mode():
+    """Test that an unknown errors mode is rejected."""
+    with pytest.raises(ValueError, match="Unknown errors mode 'ignore'"):
+        extract_month("2023-07-16T12:34:56", errors="ignore")
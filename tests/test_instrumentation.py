@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from date_extractor_mds.date_extractor_mds import *
+from date_extractor_mds.instrumentation import CallRecord, add_listener, recording, remove_listener
+
+DATES = pd.Series(["2023-07-16T12:34:56", "bad", "2023-02-30T00:00:00", "2024-03-25T08:15:30"] * 50)
+
+
+def test_counts_rows_and_invalid_rows():
+    """Test that records count the rows and the invalid rows in every errors mode."""
+    with recording() as records:
+        extract_month(DATES, errors="mask")
+        extract_components(DATES.tolist(), fields=["year", "day"], errors="coerce")
+        with pytest.raises(ValueError):
+            extract_day(DATES)
+        validate_datetime("2023-07-16T12:34:56")
+    assert [(record.function, record.input_type, record.rows, record.invalid_rows, record.error)
+            for record in records] == [
+        ("extract_month", "Series", 200, 100, None),
+        ("extract_components", "array", 200, 100, None),
+        ("extract_day", "Series", 200, 50, "ValueError"),
+        ("validate_datetime", "str", 1, 0, None),
+    ]
+
+
+def test_phases_add_up():
+    """Test that the validation, parsing and result times split the duration of the call."""
+    with recording() as records:
+        extract_year(DATES, errors="coerce")
+        extract_time("2023-07-16T12:34:56")
+    for record in records:
+        assert min(record.validation, record.parsing, record.result) >= 0
+        assert record.validation + record.parsing + record.result == pytest.approx(record.seconds)
+    assert records[0].validation > 0 and records[0].parsing > 0
+    assert records[1].parsing == records[1].seconds
+
+
+def test_nested_calls_are_not_recorded():
+    """Test that the validation done inside an extractor is part of its own record."""
+    with recording() as records:
+        extract_year(DATES.iloc[:1], engine="python")
+    assert [record.function for record in records] == ["extract_year"]
+    assert records[0].validation > 0
+
+
+def test_add_date_parts_counts_every_column():
+    """Test that add_date_parts counts the rows of each decoded column."""
+    df = pd.DataFrame({"created": DATES, "updated": DATES})
+    with recording() as records:
+        add_date_parts(df, ["created", "updated"], fields=["year", "day"], errors="coerce")
+    assert (records[0].input_type, records[0].rows, records[0].invalid_rows) == ("DataFrame", 400, 200)
+
+
+def test_listeners():
+    """Test that listeners receive records until they are removed."""
+    received = []
+    add_listener(received.append)
+    try:
+        to_datetime64(["2023-07-16T12:34:56"])
+    finally:
+        remove_listener(received.append)
+    extract_year("2023-07-16T12:34:56")
+    assert len(received) == 1 and isinstance(received[0], CallRecord)
+    assert received[0].function == "to_datetime64"
+    with pytest.raises(ValueError):
+        remove_listener(received.append)
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import time
+from date_extractor_mds import _parallel
+from date_extractor_mds.date_extractor_mds import *
+
+VARIANTS = [
+    "2023-07-16T12:34:56",
+    "2023-07-16T12:34:56Z",
+    "2023-07-16T12:34:56.5",
+    "2023-07-16T12:34:56.123456789",
+    "2023-07-16T12:34:56+05:30",
+    "2023-07-16T12:34:56.250-08:00",
+]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_variants_keep_local_components(engine):
+    """Test that fractions, Z and offsets are accepted and leave the local components unchanged."""
+    frame = extract_components(pd.Series(VARIANTS), engine=engine)
+    assert (frame.values == [2023, 7, 16, 12, 34, 56]).all()
+    assert extract_time(pd.Series(VARIANTS), engine=engine).tolist() == [
+        time(12, 34, 56), time(12, 34, 56), time(12, 34, 56, 500000),
+        time(12, 34, 56, 123456), time(12, 34, 56), time(12, 34, 56, 250000)
+    ]
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_string_input(variant):
+    """Test that single strings accept every variant."""
+    validate_datetime(variant)
+    assert extract_day(variant) == 16
+    assert extract_time(variant).replace(microsecond=0) == time(12, 34, 56)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+@pytest.mark.parametrize("date_string, expected", [
+    ("2023-07-16T12:34:56+05:30", [2023, 7, 16, 7, 4, 56]),
+    ("2023-07-16T01:00:00+02:00", [2023, 7, 15, 23, 0, 0]),
+    ("2023-12-31T23:30:00-01:00", [2024, 1, 1, 0, 30, 0]),
+    ("2024-02-28T23:00:00-02:00", [2024, 2, 29, 1, 0, 0]),
+    ("2023-07-16T12:34:56Z", [2023, 7, 16, 12, 34, 56]),
+    ("2023-07-16T12:34:56", [2023, 7, 16, 12, 34, 56]),
+])
+def test_utc_conversion(engine, date_string, expected):
+    """Test that utc=True shifts the components by the offset, across days, months and years."""
+    frame = extract_components(pd.Series([date_string]), engine=engine, utc=True)
+    assert frame.iloc[0].tolist() == expected
+    assert extract_day(pd.Series([date_string]), engine=engine, utc=True).iloc[0] == expected[2]
+    assert list(extract_components(date_string, utc=True).values()) == expected
+
+
+def test_utc_across_containers():
+    """Test that lists and Arrow arrays convert to UTC like a Series."""
+    expected = extract_day(pd.Series(VARIANTS + ["2023-07-16T01:00:00+02:00"]), utc=True).tolist()
+    values = VARIANTS + ["2023-07-16T01:00:00+02:00"]
+    assert extract_day(values, utc=True).tolist() == expected
+    pyarrow = pytest.importorskip("pyarrow")
+    assert extract_day(pyarrow.array(values), utc=True).to_pylist() == expected
+
+
+@pytest.mark.parametrize("validate", ["full", "fast"])
+@pytest.mark.parametrize("date_string", ["0001-01-01T00:10:56+05:30", "9999-12-31T23:50:00-05:00"])
+def test_utc_outside_four_digit_years(date_string, validate, monkeypatch):
+    """Test that a conversion to UTC leaving years 1 to 9999 is reported as out of range."""
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_JOB", 2)
+    iso_dates = pd.Series(["2023-07-16T12:34:56", date_string] * 2)
+    with pytest.raises(ValueError, match="contains an out of range date or time component"):
+        extract_year(date_string, validate=validate, utc=True)
+    for options in ({}, {"engine": "python"}, {"n_jobs": 2}, {"deduplicate": "sorted"}):
+        with pytest.raises(ValueError, match="out of range date or time component"):
+            extract_components(iso_dates, validate=validate, utc=True, **options)
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 1, 3\)"):
+        extract_time(list(iso_dates), validate=validate, utc=True)
+    years, valid = extract_year(iso_dates, validate=validate, utc=True, errors="mask")
+    assert valid.tolist() == [True, False, True, False]
+    # Without validation, the converted components are returned as they come out.
+    assert extract_year(date_string, validate="off", utc=True) in (0, 10000)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_utc_year_check_ignores_rows_without_offset(engine):
+    """Test that a row without an offset is accepted whatever the offsets of its neighbours."""
+    iso_dates = pd.Series(["0000-04-01T00:00:59", "2023-01-01T00:00:00Z", "2023-01-01T00:00:00+01:00"])
+    expected = [extract_year(date_string, validate="fast", utc=True) for date_string in iso_dates]
+    assert expected == [0, 2023, 2022]
+    assert extract_year(iso_dates, engine=engine, validate="fast", utc=True).tolist() == expected
+    assert extract_year(list(iso_dates), validate="fast", utc=True).tolist() == expected
+
+
+def test_microsecond_field():
+    """Test that the microsecond can be requested and is truncated to six digits."""
+    parts = extract_components(pd.Series(VARIANTS), fields=["second", "microsecond"], output="compact")
+    assert parts["microsecond"].tolist() == [0, 0, 500000, 123456, 0, 250000]
+    assert parts["microsecond"].dtype == np.int32
+    assert extract_components("2023-07-16T12:34:56.000001Z", fields=["microsecond"]) == {"microsecond": 1}
+
+
+@pytest.mark.parametrize("invalid_date", [
+    "2023-07-16T12:34:56.",               # Fraction without digits
+    "2023-07-16T12:34:56.1234567890",     # More than nine fraction digits
+    "2023-07-16T12:34:56Z+05:30",         # Both Z and an offset
+    "2023-07-16T12:34:56.+05:30",         # Empty fraction before an offset
+    "2023-07-16T12:34:56+24:00",          # Offset hours out of range
+    "2023-07-16T12:34:56+05:60",          # Offset minutes out of range
+    "2023-07-16T12:34:56+0530",           # Offset without a colon
+    "2023-07-16T12:34:56+05:30Z",         # Trailing characters
+    "2023-07-16T12:34:56z",               # Lowercase designator
+])
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_malformed_variants(invalid_date, engine):
+    """Test that malformed suffixes are reported as malformed rows."""
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 1\)"):
+        extract_year(pd.Series(["2023-07-16T12:34:56Z", invalid_date]), engine=engine)
+    with pytest.raises(ValueError, match="not in valid ISO 8601 format"):
+        validate_datetime(invalid_date)
+
+
+def test_mask_with_variants():
+    """Test that errors="mask" flags malformed suffixes only."""
+    days, valid = extract_day(pd.Series(["2023-07-16T12:34:56.5Z", "2023-07-16T12:34:56+99:00"]), errors="mask")
+    assert valid.tolist() == [True, False]
+    assert days.isna().tolist() == [False, True]
+
+
+def test_utc_in_process_pool(monkeypatch):
+    """Test that the UTC conversion gives the same result when split over processes."""
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_JOB", 2)
+    iso_dates = pd.Series(VARIANTS * 2 + ["2023-12-31T23:30:00-01:00"])
+    pd.testing.assert_frame_equal(
+        extract_components(iso_dates, utc=True, n_jobs=3), extract_components(iso_dates, utc=True)
+    )
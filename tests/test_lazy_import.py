@@ -0,0 +1,81 @@
+import subprocess
+import sys
+import pandas as pd
+from date_extractor_mds._lazy import LazyModule, is_series
+
+
+def run_fresh(code):
+    """Run code in a fresh interpreter and return its standard output."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_string_input_does_not_import_pandas():
+    """Test that importing the package and extracting from strings leaves pandas and numpy unloaded."""
+    output = run_fresh(
+        "import sys, date_extractor_mds as d\n"
+        "d.validate_datetime('2024-02-29T08:15:30')\n"
+        "d.extract_components('2024-02-29T08:15:30')\n"
+        "d.extract_time('2024-02-29T08:15:30')\n"
+        "print('pandas' in sys.modules, 'numpy' in sys.modules)"
+    )
+    assert output == "False False"
+
+
+def test_list_input_does_not_import_pandas():
+    """Test that list input is processed with NumPy alone."""
+    output = run_fresh(
+        "import sys, date_extractor_mds as d\n"
+        "print(d.extract_day(['2024-02-29T08:15:30']).tolist(), 'pandas' in sys.modules)"
+    )
+    assert output == "[29] False"
+
+
+def test_series_input_after_lazy_import():
+    """Test that a Series still works when pandas is imported after the package."""
+    output = run_fresh(
+        "import date_extractor_mds as d\n"
+        "import pandas as pd\n"
+        "print(d.extract_day(pd.Series(['2024-02-29T08:15:30'])).tolist())"
+    )
+    assert output == "[29]"
+
+
+def test_lazy_module():
+    """Test that a lazy module resolves attributes of the real module."""
+    lazy_json = LazyModule("json")
+    assert lazy_json.loads("[1]") == [1]
+    assert "json" in repr(LazyModule("json"))
+
+
+def test_is_series():
+    """Test Series detection."""
+    assert is_series(pd.Series(["2024-02-29T08:15:30"]))
+    assert not is_series("2024-02-29T08:15:30")
+    assert not is_series(pd.DataFrame())
+
+
+def test_batch_extractor_imported_on_request():
+    """Test that asyncio is only imported once BatchExtractor is requested."""
+    output = run_fresh(
+        "import sys, date_extractor_mds as d\n"
+        "before = 'date_extractor_mds.batching' in sys.modules\n"
+        "print(before, d.BatchExtractor.__name__)"
+    )
+    assert output == "False BatchExtractor"
+
+
+def test_inspect_not_imported():
+    """Test that importing the package leaves inspect, slow to import, unloaded."""
+    assert run_fresh("import sys, date_extractor_mds\nprint('inspect' in sys.modules)") == "False"
+
+
+def test_star_import_exports_only_the_api():
+    """Test that a star import brings in the extractors, not the modules they use."""
+    namespace = {}
+    exec("from date_extractor_mds.date_extractor_mds import *", namespace)
+    assert sorted(name for name in namespace if name != "__builtins__") == [
+        "add_date_parts", "extract_components", "extract_day", "extract_month",
+        "extract_time", "extract_year", "to_datetime64", "validate_datetime",
+    ]
+    output = run_fresh("import date_extractor_mds as d\nprint(hasattr(d, 'pd'), hasattr(d, 're'))")
+    assert output == "False False"
@@ -83,3 +83,12 @@ def test_edge_case_february_non_leap_year():
     result = extract_month(iso_date)
     expected = 2
     assert result == expected, f"Expected {expected}, but got {result}"
+
+
+def test_invalid_day_of_month():
+    """Test that a day past the end of the month is rejected."""
+    for iso_date in ["2023-02-29T12:00:00", "2024-04-31T12:00:00", "2024-13-01T12:00:00"]:
+        with pytest.raises(ValueError):
+            extract_month(iso_date)
+        with pytest.raises(ValueError):
+            extract_month(pd.Series([iso_date]), engine="python")
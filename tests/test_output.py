@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import time
+from date_extractor_mds.date_extractor_mds import *
+
+ISO_DATES = pd.Series(["2025-01-15T10:20:30", "2024-12-25T23:59:59"], index=[4, 2], name="dates")
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+@pytest.mark.parametrize("extractor, expected_dtype, expected", [
+    (extract_year, "int16", [2025, 2024]),
+    (extract_month, "int8", [1, 12]),
+    (extract_day, "int8", [15, 25])
+])
+def test_compact_output(engine, extractor, expected_dtype, expected):
+    """Test that output="compact" gives the smallest integer dtype."""
+    result = extractor(ISO_DATES, engine=engine, output="compact")
+    pd.testing.assert_series_equal(
+        result, pd.Series(expected, index=[4, 2], name="dates", dtype=expected_dtype)
+    )
+
+
+def test_explicit_integer_dtype():
+    """Test that any integer dtype wide enough for the component is accepted."""
+    result = extract_year(ISO_DATES, output="uint16")
+    assert result.dtype == np.dtype("uint16")
+    assert result.tolist() == [2025, 2024]
+
+
+@pytest.mark.parametrize("output", ["int8", "float64", "unknown"])
+def test_unusable_component_output(output):
+    """Test that dtypes which cannot hold the year are rejected."""
+    with pytest.raises(ValueError):
+        extract_year(ISO_DATES, output=output)
+
+
+def test_string_input_ignores_output():
+    """Test that string input still returns a plain integer."""
+    assert extract_month("2025-01-15T10:20:30", output="compact") == 1
+
+
+def test_components_compact_output():
+    """Test compact output from extract_components."""
+    result = extract_components(ISO_DATES, fields=["year", "second"], output="compact")
+    assert result.dtypes.tolist() == [np.dtype("int16"), np.dtype("int8")]
+    assert result["second"].tolist() == [30, 59]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_time_seconds_output(engine):
+    """Test seconds since midnight from extract_time."""
+    result = extract_time(ISO_DATES, engine=engine, output="seconds")
+    expected = pd.Series([37230, 86399], index=[4, 2], name="dates", dtype="int32")
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_time_timedelta_output():
+    """Test timedelta output from extract_time."""
+    result = extract_time(ISO_DATES, output="timedelta")
+    assert result.dtype == np.dtype("timedelta64[s]")
+    assert result.iloc[0] == pd.Timedelta(hours=10, minutes=20, seconds=30)
+
+
+def test_time_default_output():
+    """Test that output="time" gives datetime.time objects."""
+    result = extract_time(ISO_DATES, output="time")
+    assert result.tolist() == [time(10, 20, 30), time(23, 59, 59)]
+
+
+def test_unknown_time_output():
+    """Test requesting a time representation that does not exist."""
+    with pytest.raises(ValueError, match="Unknown output 'minutes'"):
+        extract_time(ISO_DATES, output="minutes")
+
+
+def test_pyarrow_output():
+    """Test pyarrow-backed output."""
+    pyarrow = pytest.importorskip("pyarrow")
+    year = extract_year(ISO_DATES, output="pyarrow")
+    assert year.dtype == pd.ArrowDtype(pyarrow.int16())
+    assert year.tolist() == [2025, 2024]
+    times = extract_time(ISO_DATES, output="pyarrow")
+    assert times.dtype == pd.ArrowDtype(pyarrow.time32("s"))
+    assert times.tolist() == [time(10, 20, 30), time(23, 59, 59)]
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+from date_extractor_mds import _parallel
+from date_extractor_mds.date_extractor_mds import *
+
+ISO_DATES = pd.Series(
+    [f"20{year:02d}-{month:02d}-15T{month:02d}:{year:02d}:30" for year in range(10, 30) for month in range(1, 13)],
+    index=range(1000, 1240),
+    name="dates"
+)
+
+
+@pytest.fixture
+def small_partitions(monkeypatch):
+    """Let the process pool split even a small Series."""
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_JOB", 10)
+
+
+def test_parallel_matches_serial(small_partitions):
+    """Test that a process pool gives the same components as a single process."""
+    result = extract_components(ISO_DATES, n_jobs=4)
+    pd.testing.assert_frame_equal(result, extract_components(ISO_DATES))
+
+
+@pytest.mark.parametrize("extractor", [extract_year, extract_month, extract_day, extract_time])
+def test_parallel_extractors_keep_index(small_partitions, extractor):
+    """Test that every extractor reassembles the result with the original index."""
+    pd.testing.assert_series_equal(extractor(ISO_DATES, n_jobs=3), extractor(ISO_DATES))
+
+
+def test_parallel_reports_positions(small_partitions):
+    """Test that invalid rows in any partition are reported by position."""
+    iso_dates = ISO_DATES.copy()
+    iso_dates.iloc[5] = "invalid-date"
+    iso_dates.iloc[200] = "2024/01/01T00:00:00"
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 5, 200\)"):
+        extract_year(iso_dates, n_jobs=4)
+    iso_dates = ISO_DATES.copy()
+    iso_dates.iloc[230] = "2023-02-29T00:00:00"
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 230\)"):
+        extract_month(iso_dates, n_jobs=4)
+
+
+def test_small_series_stays_serial():
+    """Test that Series too small to benefit do not start a pool."""
+    assert _parallel.effective_jobs(8, 1000) == 1
+    assert _parallel.effective_jobs(8, 10 * _parallel.MIN_ROWS_PER_JOB) == 8
+    assert _parallel.effective_jobs(None, 10 ** 9) == 1
+
+
+def test_invalid_n_jobs():
+    """Test rejecting a number of processes that makes no sense."""
+    with pytest.raises(ValueError, match="n_jobs must be None, -1 or a positive integer"):
+        extract_year(ISO_DATES, n_jobs=0)
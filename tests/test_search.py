@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from date_extractor_mds import extract_components, find_datetimes
+
+
+def test_embedded_timestamps():
+    """Test that timestamps are found anywhere in the text, with their positions and components."""
+    notes = pd.Series(
+        ["deployed at 2023-07-16T12:34:56 by ci", "no timestamp", None,
+         "from 2024-03-25T08:15:30.250Z to 2024-03-25T09:00:00+01:00."],
+        index=["a", "b", "c", "d"],
+    )
+    found = find_datetimes(notes, fields=["day", "hour", "microsecond"])
+    assert found.index.tolist() == [("a", 0), ("d", 0), ("d", 1)]
+    assert found.index.names == [None, "match"]
+    assert found.to_dict("list") == {
+        "start": [12, 5, 33], "end": [31, 29, 58],
+        "day": [16, 25, 25], "hour": [12, 8, 9], "microsecond": [0, 250000, 0],
+    }
+    for (label, _), start, end in zip(found.index, found["start"], found["end"]):
+        assert extract_components(notes[label][start:end], fields=["day"])
+
+
+def test_timestamp_boundaries():
+    """Test that digit runs around a timestamp and malformed suffixes are handled like a regex search."""
+    found = find_datetimes([
+        "12023-07-16T12:34:56 2023-07-16T12:34:567 2023-07-16T12:34:56.1234567890",
+        "2023-07-16T12:34:56+0200 2023-07-16T12:34:56.2023-07-16T12:34:56",
+    ])
+    assert found[["start", "end"]].values.tolist() == [[0, 19], [25, 49]]
+
+
+def test_non_ascii_offsets():
+    """Test that positions count characters rather than UTF-8 bytes."""
+    text = "créé à 2023-07-16T12:34:56 puis 2023-07-17T00:00:00"
+    found = find_datetimes([text], fields=["day"])
+    assert [text[start:end] for start, end in found[["start", "end"]].values] == [
+        "2023-07-16T12:34:56", "2023-07-17T00:00:00"
+    ]
+
+
+def test_validate_and_utc():
+    """Test that out of range timestamps are skipped unless validate is fast, and that utc converts."""
+    text = ["2023-02-30T00:00:00 and 2023-07-16T23:30:00-01:00"]
+    assert find_datetimes(text, fields=["day"])["day"].tolist() == [16]
+    assert find_datetimes(text, fields=["day"], validate="fast")["day"].tolist() == [30, 16]
+    assert find_datetimes(text, fields=["day", "hour"], utc=True).iloc[0][["day", "hour"]].tolist() == [17, 0]
+
+
+@pytest.mark.parametrize("fields", [None, ["year"], ["hour"], ["month"], ["microsecond"], ["quarter"]])
+def test_matches_do_not_depend_on_fields(fields):
+    """Test that the timestamps found are the same whichever fields are requested."""
+    text = ["at 2023-02-30T00:00:00 and 2023-01-01T25:00:00 then 2023-01-02T03:04:05.5"]
+    found = find_datetimes(text, fields=fields)
+    assert found["start"].tolist() == [52]
+    assert find_datetimes(text, fields=fields, validate="fast")["start"].tolist() == [3, 27, 52]
+
+
+def test_output_and_empty_input():
+    """Test the compact output and the result for text without timestamps."""
+    found = find_datetimes(np.array(["at 2023-07-16T12:34:56"]), fields=["year", "month"], output="compact")
+    assert found.dtypes.to_dict() == {"start": np.int64, "end": np.int64, "year": np.int16, "month": np.int8}
+    empty = find_datetimes(pd.Series([], dtype=object))
+    assert empty.empty and list(empty.columns[:3]) == ["start", "end", "year"]
+
+
+def test_invalid_input():
+    """Test that invalid input and options are rejected."""
+    with pytest.raises(TypeError, match="Input must be a Pandas Series"):
+        find_datetimes("2023-07-16T12:34:56")
+    with pytest.raises(ValueError, match="must be strings or missing values"):
+        find_datetimes(["2023-07-16T12:34:56", 5])
+    with pytest.raises(ValueError, match="Unknown validate mode 'off'"):
+        find_datetimes(["2023-07-16T12:34:56"], validate="off")
+    with pytest.raises(ValueError, match="Unknown field 'week'"):
+        find_datetimes(["2023-07-16T12:34:56"], fields=["week"])
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+import pytest
+from date_extractor_mds.streaming import extract_from_file, extract_from_log
+
+TIMESTAMPS = [f"2024-{month:02d}-{day:02d}T{day % 24:02d}:30:00" for month in range(1, 13) for day in range(1, 29)]
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """A CSV file with an ISO 8601 column and an unrelated column."""
+    path = tmp_path / "events.csv"
+    pd.DataFrame({"id": range(len(TIMESTAMPS)), "timestamp": TIMESTAMPS}).to_csv(path, index=False)
+    return path
+
+
+def test_chunks_cover_file(csv_file):
+    """Test that the chunks together hold one row per row of the file."""
+    chunks = list(extract_from_file(csv_file, "timestamp", fields=["month", "day"], chunksize=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 100, 36]
+    result = pd.concat(chunks)
+    assert list(result.index) == list(range(len(TIMESTAMPS)))
+    assert result["month"].tolist() == [month for month in range(1, 13) for _ in range(28)]
+    assert result["day"].tolist() == list(range(1, 29)) * 12
+
+
+def test_extract_options_passed_on(csv_file):
+    """Test that extract_components options reach every chunk."""
+    chunk = next(extract_from_file(csv_file, "timestamp", fields=["hour"], output="compact"))
+    assert chunk["hour"].dtype == "int8"
+
+
+def test_write_csv(csv_file, tmp_path):
+    """Test writing the extracted components to a CSV file."""
+    output_path = tmp_path / "parts.csv"
+    rows = extract_from_file(csv_file, "timestamp", fields=["year", "hour"], chunksize=50, output_path=output_path)
+    assert rows == len(TIMESTAMPS)
+    written = pd.read_csv(output_path)
+    assert list(written.columns) == ["year", "hour"]
+    assert len(written) == len(TIMESTAMPS)
+
+
+def test_invalid_row_reports_chunk(tmp_path):
+    """Test that an invalid row is reported with the start of its chunk."""
+    path = tmp_path / "events.csv"
+    pd.DataFrame({"timestamp": TIMESTAMPS[:5] + ["not-a-date"] + TIMESTAMPS[:5]}).to_csv(path, index=False)
+    with pytest.raises(ValueError, match=r"In the chunk starting at row 4: .*\(positions: 1\)"):
+        list(extract_from_file(path, "timestamp", chunksize=4))
+
+
+def test_empty_cell_is_invalid(tmp_path):
+    """Test that a missing value is reported as an invalid row."""
+    path = tmp_path / "events.csv"
+    path.write_text("timestamp\n2024-01-01T00:00:00\n\"\"\n")
+    with pytest.raises(ValueError, match="not in valid ISO 8601 format"):
+        list(extract_from_file(path, "timestamp"))
+
+
+def test_unknown_format(tmp_path):
+    """Test a file whose format cannot be inferred."""
+    with pytest.raises(ValueError, match="Cannot infer the format"):
+        extract_from_file(tmp_path / "events.json", "timestamp")
+
+
+def test_parquet_round_trip(tmp_path):
+    """Test reading from and writing to Parquet files."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "events.parquet"
+    pd.DataFrame({"timestamp": TIMESTAMPS}).to_parquet(path)
+    chunks = list(extract_from_file(path, "timestamp", fields=["month"], chunksize=300))
+    assert [chunk.index[0] for chunk in chunks] == [0, 300]
+    output_path = tmp_path / "parts.parquet"
+    assert extract_from_file(path, "timestamp", output_path=output_path, output="compact") == len(TIMESTAMPS)
+    written = pd.read_parquet(output_path)
+    assert written["year"].dtype == "int16"
+    assert written["day"].tolist() == list(range(1, 29)) * 12
+
+
+def test_mask_not_written(csv_file, tmp_path):
+    """Test that errors="mask" is rejected when writing to a file."""
+    with pytest.raises(ValueError, match="errors='mask' cannot be written"):
+        extract_from_file(csv_file, "timestamp", output_path=tmp_path / "parts.csv", errors="mask")
+
+
+@pytest.mark.parametrize("options, exception, error", [
+    ({"fields": ["year", "decade"]}, ValueError, "Unknown field 'decade'"),
+    ({"errors": "ignore"}, ValueError, "Unknown errors mode 'ignore'"),
+    ({"validate": "partial"}, ValueError, "Unknown validate mode 'partial'"),
+    ({"deduplicate": "sort"}, ValueError, "Unknown deduplicate mode 'sort'"),
+    ({"output": "int8", "fields": ["year"]}, ValueError, "cannot hold the year component"),
+    ({"utc_offset": True}, TypeError, "unexpected keyword argument 'utc_offset'"),
+])
+def test_options_checked_on_call(csv_file, options, exception, error):
+    """Test that invalid options raise when extract_from_file is called, not when the chunks are read."""
+    with pytest.raises(exception, match=error):
+        extract_from_file(csv_file, "timestamp", **options)
+
+
+def test_text_formats(tmp_path):
+    """Test reading compressed timestamp-per-line files and newline-delimited JSON."""
+    import gzip
+    path = tmp_path / "stamps.txt.gz"
+    with gzip.open(path, "wt") as stream:
+        stream.write("\n".join(TIMESTAMPS) + "\n")
+    chunks = list(extract_from_file(path, None, fields=["month"], chunksize=300))
+    assert [chunk.index[0] for chunk in chunks] == [0, 300]
+    assert pd.concat(chunks)["month"].tolist() == [month for month in range(1, 13) for _ in range(28)]
+    json_path = tmp_path / "events.ndjson"
+    pd.DataFrame({"timestamp": TIMESTAMPS[:3]}).to_json(json_path, orient="records", lines=True)
+    assert next(extract_from_file(json_path, "timestamp", fields=["day"]))["day"].tolist() == [1, 2, 3]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """A log file whose lines start with timestamps in every accepted variant."""
+    path = tmp_path / "app.log"
+    lines = [f"{timestamp} INFO request {number}" for number, timestamp in enumerate(TIMESTAMPS)]
+    lines[3] = "2024-01-04T03:30:00.25+01:00\tWARN slow"
+    lines[4] = "2024-01-05T04:30:00Z"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.parametrize("block_size", [1, 100, 1_000_000])
+def test_log_file(log_file, block_size):
+    """Test that every line is decoded, whatever the block size."""
+    blocks = list(extract_from_log(log_file, fields=["month", "day", "microsecond"], block_size=block_size))
+    assert len(blocks) > 1 or block_size == 1_000_000
+    month = np.concatenate([block["month"] for block in blocks])
+    assert month.tolist() == [month for month in range(1, 13) for _ in range(28)]
+    microsecond = np.concatenate([block["microsecond"] for block in blocks])
+    assert microsecond[3] == 250000 and microsecond.sum() == 250000
+
+
+def test_log_invalid_lines(tmp_path):
+    """Test that lines without a leading timestamp are reported by line number or masked."""
+    path = tmp_path / "app.log"
+    path.write_bytes(b"2024-01-01T00:00:00 start\nTraceback (most recent call last):\n\n"
+                     b"2024-02-30T00:00:00 bad day\r\n2024-01-01T00:00:00,123 comma\n2024-01-02T00:00:00")
+    with pytest.raises(ValueError, match=r"in the log file are not in valid ISO 8601 format \(positions: 1, 2, 4\)"):
+        list(extract_from_log(path))
+    path.write_bytes(b"2024-01-01T00:00:00\n" * 3 + b"2024-02-30T00:00:00\n")
+    with pytest.raises(ValueError, match=r"out of range date or time components \(positions: 3\)"):
+        list(extract_from_log(path, block_size=20))
+    path.write_bytes(b"2024-01-01T00:00:00 start\nTraceback (most recent call last):\n\n"
+                     b"2024-02-30T00:00:00 bad day\r\n2024-01-01T00:00:00,123 comma\n2024-01-02T00:00:00")
+    (components, valid), = extract_from_log(path, fields=["day"], output="compact", errors="mask")
+    assert valid.tolist() == [True, False, False, False, False, True]
+    assert components["day"].dtype == np.int8 and components["day"].compressed().tolist() == [1, 2]
+
+
+def test_log_options_checked_on_call(log_file):
+    """Test that invalid options raise when extract_from_log is called, not when the blocks are read."""
+    with pytest.raises(ValueError, match="Unknown errors mode 'ignore'"):
+        extract_from_log(log_file, errors="ignore")
+    with pytest.raises(ValueError, match="block_size must be a positive integer"):
+        extract_from_log(log_file, block_size=0)
+
+
+def test_empty_log(tmp_path):
+    """Test that an empty log file yields nothing."""
+    path = tmp_path / "empty.log"
+    path.write_bytes(b"")
+    assert list(extract_from_log(path)) == []
@@ -1,3 +1,4 @@
+import pandas as pd
 from datetime import time
 from date_extractor_mds.date_extractor_mds import *
 
@@ -94,3 +95,21 @@ def test_invalid_iso8601_format():
             assert False, f"Expected ValueError for invalid date format {date}"
         except ValueError:
             pass
+
+
+def test_out_of_range_minute_and_second():
+    """Test that minutes and seconds past 59 are rejected."""
+    for iso_date in ["2025-01-01T12:60:00", "2025-01-01T12:00:60"]:
+        try:
+            extract_time(iso_date)
+            assert False, f"Expected ValueError for out of range time {iso_date}"
+        except ValueError:
+            pass
+
+
+def test_python_engine_plain_and_suffixed_strings():
+    """Test that the Python engine reads plain strings and ones with a fraction or offset alike."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30", "2025-01-15T10:20:30.25", "2025-01-15T10:20:30+01:00"])
+    expected = [time(10, 20, 30), time(10, 20, 30, 250000), time(10, 20, 30)]
+    assert extract_time(iso_dates, engine="python").tolist() == expected
+    assert extract_time(iso_dates, engine="python", utc=True).tolist()[2] == time(9, 20, 30)
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from date_extractor_mds import _parallel
+from date_extractor_mds.date_extractor_mds import *
+
+ISO_DATES = ["2023-07-16T12:34:56", "1970-01-01T00:00:00", "1969-12-31T23:59:59.5", "2024-02-29T08:15:30Z",
+             "1969-12-31T23:59:59.123456789"]
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_matches_pandas(unit):
+    """Test that the timestamps match pandas for every unit."""
+    dates = pd.Series([date.rstrip("Z") for date in ISO_DATES], index=[3, 4, 5, 6, 7], name="dates")
+    expected = pd.to_datetime(dates, format="ISO8601").dt.floor(unit).astype(f"datetime64[{unit}]")
+    pd.testing.assert_series_equal(to_datetime64(dates, unit=unit), expected)
+
+
+def test_nanoseconds_are_kept():
+    """Test that unit="ns" keeps every digit of the fraction, for each input type."""
+    strings = ["2023-07-16T12:34:56.123456789", "2023-07-16T12:34:56.000000001+01:00", "2023-07-16T12:34:56.98765"]
+    expected = np.array(["2023-07-16T12:34:56.123456789", "2023-07-16T11:34:56.000000001",
+                         "2023-07-16T12:34:56.987650000"], dtype="datetime64[ns]")
+    np.testing.assert_array_equal(to_datetime64(strings, utc=True), expected)
+    np.testing.assert_array_equal(to_datetime64(pd.Series(strings * 3), deduplicate=True, utc=True).dt.tz_localize(None),
+                                  np.tile(expected, 3))
+    assert [to_datetime64(string, utc=True) for string in strings] == list(expected)
+
+
+def test_calendar_matches_numpy():
+    """Test the days-from-civil arithmetic across leap years and centuries."""
+    stamps = np.arange(np.datetime64("1678-01-01"), np.datetime64("2262-01-01"), 97, dtype="datetime64[D]")
+    strings = np.datetime_as_string(stamps.astype("datetime64[s]"), unit="s")
+    np.testing.assert_array_equal(to_datetime64(strings, unit="s"), stamps.astype("datetime64[s]"))
+    np.testing.assert_array_equal(to_datetime64(["0001-01-01T00:00:00", "9999-12-31T23:59:59"], unit="s"),
+                                  np.array(["0001-01-01T00:00:00", "9999-12-31T23:59:59"], dtype="datetime64[s]"))
+
+
+def test_string_input():
+    """Test that a single string gives a datetime64 scalar."""
+    assert to_datetime64("2023-07-16T12:34:56.123456789") == np.datetime64("2023-07-16T12:34:56.123456789", "ns")
+    assert to_datetime64("2023-07-16T12:34:56.123456789", unit="us") == np.datetime64("2023-07-16T12:34:56.123456")
+    assert to_datetime64("2023-07-16T12:34:56", unit="s").dtype == np.dtype("datetime64[s]")
+    assert to_datetime64("bad", errors="mask") == (None, False)
+
+
+def test_utc():
+    """Test that utc=True converts offsets and marks Series as UTC."""
+    dates = pd.Series(["2024-03-25T08:15:30+01:00", "2023-12-31T23:30:00-01:00", "2023-07-16T12:34:56"])
+    result = to_datetime64(dates, utc=True)
+    assert str(result.dtype) == "datetime64[ns, UTC]"
+    assert result.tolist() == [pd.Timestamp("2024-03-25T07:15:30Z"), pd.Timestamp("2024-01-01T00:30:00Z"),
+                               pd.Timestamp("2023-07-16T12:34:56Z")]
+    assert to_datetime64(dates).iloc[0] == pd.Timestamp("2024-03-25T08:15:30")
+    assert to_datetime64("2024-03-25T08:15:30+01:00", utc=True) == np.datetime64("2024-03-25T07:15:30")
+
+
+def test_out_of_range_for_unit():
+    """Test that timestamps outside the range of the unit are rejected or coerced."""
+    with pytest.raises(ValueError, match=r"out of the range of datetime64\[ns\] \(positions: 1\)"):
+        to_datetime64(pd.Series(["2023-07-16T12:34:56", "2300-01-01T00:00:00"]))
+    with pytest.raises(ValueError, match=r"out of the range of datetime64\[ns\]"):
+        to_datetime64("1677-09-21T00:12:43")
+    assert to_datetime64("2300-01-01T00:00:00", unit="us") == np.datetime64("2300-01-01")
+    edges = ["2262-04-11T23:47:16.854775", "1677-09-21T00:12:43.145225", "1677-09-21T00:12:43.145224"]
+    assert np.isnat(to_datetime64(edges, errors="coerce")).tolist() == [False, False, True]
+
+
+def test_errors_modes():
+    """Test that invalid rows become NaT and are reported by the mask."""
+    dates = pd.Series(["2023-07-16T12:34:56", "2023-02-30T00:00:00", None, "bad"])
+    result, valid = to_datetime64(dates, errors="mask")
+    assert result.isna().tolist() == [False, True, True, True]
+    assert valid.tolist() == [True, False, False, False]
+    with pytest.raises(ValueError, match=r"contain out of range date or time components \(positions: 1\)"):
+        to_datetime64(dates.iloc[:2])
+
+
+def test_arrow_and_polars():
+    """Test that Arrow input gives timestamp arrays in the same container type."""
+    pyarrow = pytest.importorskip("pyarrow")
+    result = to_datetime64(pyarrow.chunked_array([ISO_DATES[:2], ISO_DATES[2:] + ["bad"]]), unit="ms",
+                           errors="coerce", utc=True)
+    assert isinstance(result, pyarrow.ChunkedArray)
+    assert result.type == pyarrow.timestamp("ms", tz="UTC")
+    assert result.null_count == 1
+    polars = pytest.importorskip("polars")
+    series = to_datetime64(polars.Series("ts", ISO_DATES), unit="us")
+    assert series.name == "ts"
+    assert series.to_list()[1] == pd.Timestamp("1970-01-01").to_pydatetime()
+
+
+def test_deduplicate_and_process_pool(monkeypatch):
+    """Test that the distinct-value and process pool paths give the same result."""
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_JOB", 2)
+    dates = pd.Series(ISO_DATES * 3)
+    expected = to_datetime64(dates)
+    pd.testing.assert_series_equal(to_datetime64(dates, deduplicate=True), expected)
+    pd.testing.assert_series_equal(to_datetime64(dates.astype("category")), expected)
+    pd.testing.assert_series_equal(to_datetime64(dates, n_jobs=3), expected)
+
+
+def test_invalid_options():
+    """Test that unknown units and unsupported input types are rejected."""
+    with pytest.raises(ValueError, match="Unknown unit 'D'"):
+        to_datetime64("2023-07-16T12:34:56", unit="D")
+    with pytest.raises(TypeError, match="Input must be either a string or a Pandas Series of strings"):
+        to_datetime64(20230716)
@@ -1,5 +1,6 @@
 import pandas as pd
 import pytest
+from date_extractor_mds import _parallel
 from date_extractor_mds.date_extractor_mds import *
 
 
@@ -81,4 +82,60 @@ def test_invalid_type():
     """Test invalid input type."""
     invalid_input = 12345  # Integer input, not a string or Series
     with pytest.raises(TypeError, match="Input must be either a string or a Pandas Series of strings"):
-        validate_datetime(invalid_input)
\ No newline at end of file
+        validate_datetime(invalid_input)
+
+def test_invalid_series_reports_positions():
+    """Test that the error message lists the positions of the invalid rows."""
+    iso_dates = pd.Series([
+        "2025-01-15T10:20:30",
+        "invalid-date",
+        "2024-12-25T15:45:00",
+        "2024/12/25T15:45:00"
+    ], index=[10, 20, 30, 40])
+    with pytest.raises(ValueError, match=r"\(positions: 1, 3\)"):
+        validate_datetime(iso_dates)
+
+
+def test_invalid_series_positions_truncated():
+    """Test that long lists of invalid positions are truncated."""
+    iso_dates = pd.Series(["invalid-date"] * 25)
+    with pytest.raises(ValueError, match=r"positions: 0, 1, .*, 9, \.\.\. \(15 more\)"):
+        validate_datetime(iso_dates)
+
+
+def test_string_dtype_series():
+    """Test a Series backed by the pandas string dtype."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30", "2024-12-25T15:45:00"], dtype="string")
+    validate_datetime(iso_dates)
+
+
+def test_missing_value_in_string_dtype_series():
+    """Test a string dtype Series containing a missing value."""
+    iso_dates = pd.Series(["2025-01-15T10:20:30", None], dtype="string")
+    with pytest.raises(ValueError, match="All elements of the Pandas Series must be strings"):
+        validate_datetime(iso_dates)
+
+
+def test_trailing_newline_rejected():
+    """Test that a trailing newline is not accepted as part of the format."""
+    with pytest.raises(ValueError, match="is not in valid ISO 8601 format"):
+        validate_datetime("2025-01-15T10:20:30\n")
+
+
+@pytest.mark.parametrize("container", [pd.Series, list, "pyarrow"])
+def test_nul_characters_rejected(container, monkeypatch):
+    """Test that NUL characters, which byte buffers pad with, are rejected like for a single string."""
+    monkeypatch.setattr(_parallel, "MIN_ROWS_PER_JOB", 2)
+    strings = ["2025-01-15T10:20:30", "2025-01-15T10:20:30\0", "2025-01-15T10:20:30.5\0\0", "2025-01-15T10:20:30"]
+    if container == "pyarrow":
+        iso_dates = pytest.importorskip("pyarrow").array(strings)
+    else:
+        iso_dates = container(strings)
+    with pytest.raises(ValueError, match="is not in valid ISO 8601 format"):
+        validate_datetime(strings[1])
+    with pytest.raises(ValueError, match=r"not in valid ISO 8601 format \(positions: 1, 2\)"):
+        validate_datetime(iso_dates)
+    with pytest.raises(ValueError, match=r"\(positions: 1, 2\)"):
+        extract_year(iso_dates, n_jobs=2)
+    with pytest.raises(ValueError, match=r"\(positions: 0\)"):
+        validate_datetime([b"2025-01-15T10:20:30\0"])
@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+from datetime import time
+from date_extractor_mds.date_extractor_mds import *
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_fast_skips_range_checks(engine):
+    """Test that validate="fast" extracts components without range checks."""
+    iso_dates = pd.Series(["2023-02-30T10:20:30", "2024-04-31T23:59:59"])
+    result = extract_day(iso_dates, engine=engine, validate="fast")
+    pd.testing.assert_series_equal(result, pd.Series([30, 31]))
+    assert extract_month("2023-02-30T10:20:30", validate="fast") == 2
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_fast_still_checks_format(engine):
+    """Test that validate="fast" still rejects malformed strings."""
+    iso_dates = pd.Series(["2023-02-28T10:20:30", "2023/02/28T10:20:30"])
+    with pytest.raises(ValueError, match="not in valid ISO 8601 format"):
+        extract_month(iso_dates, engine=engine, validate="fast")
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_off_skips_all_checks(engine):
+    """Test that validate="off" trusts the input format."""
+    iso_dates = pd.Series(["2023/07/16 12:34:56", "2024-03-25T08:15:30"])
+    result = extract_year(iso_dates, engine=engine, validate="off")
+    pd.testing.assert_series_equal(result, pd.Series([2023, 2024]))
+
+
+def test_off_still_checks_type():
+    """Test that validate="off" still rejects unsupported input types."""
+    with pytest.raises(TypeError, match="Input must be either a string or a Pandas Series of strings"):
+        extract_year(12345, validate="off")
+
+
+def test_fast_time_and_components():
+    """Test validate="fast" with extract_time and extract_components."""
+    assert extract_time("2023-02-30T10:20:30", validate="fast") == time(10, 20, 30)
+    result = extract_components("2023-02-30T10:20:30", fields=["month", "day"], validate="fast")
+    assert result == {"month": 2, "day": 30}
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_fast_time_past_midnight(engine):
+    """Test that a time of day no datetime.time can hold is out of range, even unchecked."""
+    iso_dates = pd.Series(["2024-04-30T12:00:00", "2024-04-30T24:00:00"])
+    with pytest.raises(ValueError, match="contains an out of range date or time component"):
+        extract_time("2024-04-30T24:00:00", validate="fast")
+    with pytest.raises(ValueError, match="out of range date or time component"):
+        extract_time(iso_dates, engine=engine, validate="fast")
+    with pytest.raises(ValueError, match=r"array contain out of range .*\(positions: 1\)"):
+        extract_time(list(iso_dates), validate="fast")
+    times = extract_time(iso_dates, engine=engine, validate="fast", errors="coerce")
+    assert times.tolist() == [time(12, 0), pd.NA]
+    # Seconds since midnight can hold it.
+    assert extract_time(iso_dates, validate="fast", output="seconds").tolist() == [43200, 86400]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_day_of_month_checked_when_full(engine):
+    """Test that extract_day only rejects a day past the end of the month with validate="full"."""
+    assert extract_day("2024-04-31T12:00:00") == 31
+    assert extract_day(pd.Series(["2024-04-31T12:00:00"]), engine=engine).tolist() == [31]
+    assert extract_day(["2024-04-31T12:00:00"]).tolist() == [31]
+    with pytest.raises(ValueError, match="out of range"):
+        extract_day("2024-04-31T12:00:00", validate="full")
+    with pytest.raises(ValueError, match="out of range"):
+        extract_day(pd.Series(["2024-04-31T12:00:00"]), engine=engine, validate="full")
+    with pytest.raises(ValueError, match="not in valid ISO 8601 format"):
+        extract_day(pd.Series(["2024-04-31 12:00:00"]), engine=engine)
+
+
+def test_unknown_validate_mode():
+    """Test requesting a validate mode that does not exist."""
+    with pytest.raises(ValueError, match="Unknown validate mode 'partial'"):
+        extract_day("2024-04-30T12:00:00", validate="partial")